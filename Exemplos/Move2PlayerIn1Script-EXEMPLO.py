@@ -20,10 +20,12 @@ class a:
 
         self.enabled = True
 
-        self.movement_speed = 5  # Define movement_speed as an attribute
+        self.movement_speed = 300  # Define movement_speed as an attribute
 
         self.gameobject = "Rectangle2"
 
+        self.target = scene_view.handle(self.gameobject)
+
         self.v = 0
 
         self.h = 0
@@ -45,51 +47,52 @@ class a:
         if self.enabled:
 
             keys = self.scene_view.key_pressed
+            step = self.movement_speed * self.scene_view.dt
 
 
 
             if Qt.Key_Up in keys:
 
-                game_object.position = (game_object.position[0], game_object.position[1] - self.movement_speed)
+                game_object.position = (game_object.position[0], game_object.position[1] - step)
 
 
 
             if Qt.Key_Down in keys:
 
-                game_object.position = (game_object.position[0], game_object.position[1] + self.movement_speed)
+                game_object.position = (game_object.position[0], game_object.position[1] + step)
 
 
 
             if Qt.Key_Left in keys:
 
-                game_object.position = (game_object.position[0] - self.movement_speed, game_object.position[1])
+                game_object.position = (game_object.position[0] - step, game_object.position[1])
 
 
 
             if Qt.Key_Right in keys:
 
-                game_object.position = (game_object.position[0] + self.movement_speed, game_object.position[1])
+                game_object.position = (game_object.position[0] + step, game_object.position[1])
 
-            target_object = self.scene_view.get_gameobject(self.gameobject)
+            target_object = self.target.get()
 
             if Qt.Key_D in keys:  # Supondo que 'M'  a tecla para mover outro objeto
 
-                    target_object.position = (target_object.position[0] + self.movement_speed, target_object.position[1])
+                    target_object.position = (target_object.position[0] + step, target_object.position[1])
    
             if Qt.Key_A in keys:  # Supondo que 'M'  a tecla para mover outro objeto
-                    target_object.position = (target_object.position[0] - self.movement_speed, target_object.position[1])
+                    target_object.position = (target_object.position[0] - step, target_object.position[1])
 
             if Qt.Key_W in keys:  # Supondo que 'M'  a tecla para mover outro objeto
 
 
 
-                    target_object.position = (target_object.position[0], target_object.position[1] - self.movement_speed)
+                    target_object.position = (target_object.position[0], target_object.position[1] - step)
 
    
 
             if Qt.Key_S in keys:  # Supondo que 'M'  a tecla para mover outro objeto
 
-                    target_object.position = (target_object.position[0], target_object.position[1] + self.movement_speed)
+                    target_object.position = (target_object.position[0], target_object.position[1] + step)
 
        
 
@@ -9,7 +9,8 @@ class a:
         self.scene_view = scene_view
         self.started = False
         self.enabled = True
-        self.movement_speed = 5  # Define movement_speed as an attribute
+        self.movement_speed = 300  # Define movement_speed as an attribute
+        self.target = scene_view.handle("Rectangle2")  # Busca feita uma vez; get() é O(1) a cada frame
         self.v = 0
         self.h = 0
 
@@ -19,24 +20,25 @@ class a:
     def Update(self, game_object):
         if self.enabled:
             keys = self.scene_view.key_pressed
+            step = self.movement_speed * self.scene_view.dt
 
             if Qt.Key_Up in keys:
-                game_object.position = (game_object.position[0], game_object.position[1] - self.movement_speed)
+                game_object.position = (game_object.position[0], game_object.position[1] - step)
 
             if Qt.Key_Down in keys:
-                game_object.position = (game_object.position[0], game_object.position[1] + self.movement_speed)
+                game_object.position = (game_object.position[0], game_object.position[1] + step)
 
             if Qt.Key_Left in keys:
-                game_object.position = (game_object.position[0] - self.movement_speed, game_object.position[1])
+                game_object.position = (game_object.position[0] - step, game_object.position[1])
 
             if Qt.Key_Right in keys:
-                game_object.position = (game_object.position[0] + self.movement_speed, game_object.position[1])
+                game_object.position = (game_object.position[0] + step, game_object.position[1])
 
             if Qt.Key_M in keys:  # Supondo que 'M' é a tecla para mover outro objeto
                 # Obtendo outro game object em cena
-                target_object = self.scene_view.get_gameobject("Rectangle2")
+                target_object = self.target.get()
                 if target_object:
-                    new_position = (target_object.position[0] + 10, target_object.position[1])
+                    new_position = (target_object.position[0] + 2 * step, target_object.position[1])
                     target_object.position = new_position
                     target_object.notify_change()
                     print(f"{self.name} moved {target_object.name} to {new_position}")
@@ -16,7 +16,9 @@ class a:
 
         self.enabled = True
 
-        self.movement_speed = 5  # Define movement_speed as an attribute
+        self.movement_speed = 300  # Define movement_speed as an attribute
+
+        self.target = scene_view.handle("Rectangle2")
 
         self.v = 0
 
@@ -36,25 +38,26 @@ class a:
         if self.enabled:
 
             keys = self.scene_view.key_pressed
+            step = self.movement_speed * self.scene_view.dt
 
             if Qt.Key_Up in keys:
 
-                game_object.position = (game_object.position[0], game_object.position[1] - self.movement_speed)
+                game_object.position = (game_object.position[0], game_object.position[1] - step)
 
 
             if Qt.Key_Down in keys:
 
-                game_object.position = (game_object.position[0], game_object.position[1] + self.movement_speed)
+                game_object.position = (game_object.position[0], game_object.position[1] + step)
 
 
             if Qt.Key_Left in keys:
 
-                game_object.position = (game_object.position[0] - self.movement_speed, game_object.position[1])
+                game_object.position = (game_object.position[0] - step, game_object.position[1])
 
 
             if Qt.Key_Right in keys:
                 
-                game_object.position = (game_object.position[0] + self.movement_speed, game_object.position[1])
+                game_object.position = (game_object.position[0] + step, game_object.position[1])
 
 
             self.v = game_object.position[0]
@@ -63,7 +66,7 @@ class a:
 
             # Obtendo outro game object em cena
 
-            target_object = self.scene_view.get_gameobject("Rectangle2")
+            target_object = self.target.get()
 
             if target_object:
 
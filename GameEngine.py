@@ -24,10 +24,7 @@ class GameEngine(QMainWindow):
         self.hierarchy = Hierarchy(self.scene_view)
         self.properties = Properties(self.scene_view)
         
-        self.object_dict = {}
-        self.key_pressed = set()
-
-        self.hierarchy.hierarchy_tree.itemClicked.connect(self.update_properties)
+        self.hierarchy.hierarchy_tree.clicked.connect(self.update_properties)
 
         layout = QVBoxLayout()
         
@@ -47,14 +44,15 @@ class GameEngine(QMainWindow):
 
         # Verificando se o root_item já existe
         if not self.hierarchy.root_item:
-            # Criando o objeto de jogo root_item como nó raiz
-            root_item = GameObject("Cena", position=(100, 100), size=(50, 50), color=(255, 0, 0, 255), rotation=0, scale=1, scene_view=self.scene_view)
+            # Criando o objeto de jogo root_item como nó raiz; fica na origem
+            # para que a posição local dos filhos seja a própria posição no mundo
+            root_item = GameObject("Cena", position=(0, 0), size=(50, 50), color=(255, 0, 0, 255), rotation=0, scale=1, scene_view=self.scene_view)
             
             # Adicionando o root_item à hierarquia
             self.hierarchy.set_root_item(root_item)
             
-            # Adicionando root_item ao dicionário de objetos
-            self.object_dict[root_item.name] = root_item
+            # Registrando root_item na cena para que possa ser encontrado pelo nome
+            self.scene_view.registry.add(root_item)
 
         # Criando outros objetos de jogo
         rect1 = GameObject("Rectangle1", position=(100, 100), size=(50, 50), color=(255, 0, 0, 255), rotation=0, scale=1, scene_view=self.scene_view)
@@ -62,24 +60,23 @@ class GameEngine(QMainWindow):
         rect3 = GameObject("Rectangle3", position=(350, 200), size=(70, 30), color=(0, 255, 0, 255), rotation=0, scale=1, scene_view=self.scene_view)
 
         # Adicionando objetos à cena
-        self.scene_view.scene_objects.extend([rect1, rect2, rect3])
+        for game_object in (rect1, rect2, rect3):
+            self.scene_view.add_game_object(game_object)
 
-        # Adicionando objetos à hierarquia e ao dicionário
-        self.add_to_hierarchy_and_dict(rect1)
-        self.add_to_hierarchy_and_dict(rect2)
-        self.add_to_hierarchy_and_dict(rect3)
+        # Adicionando objetos à hierarquia
+        self.add_to_hierarchy(rect1)
+        self.add_to_hierarchy(rect2)
+        self.add_to_hierarchy(rect3)
 
-    def add_to_hierarchy_and_dict(self, game_object):
-        if game_object.name not in self.object_dict:
-            self.hierarchy.add_gameobject(game_object)
-            self.object_dict[game_object.name] = game_object
+    def add_to_hierarchy(self, game_object):
+        self.hierarchy.add_gameobject(game_object)
 
-    def update_properties(self, item):
-        selected_item_text = item.text(0)
-        selected_object = self.object_dict.get(selected_item_text)
+    def update_properties(self, index):
+        # O índice guarda o id do objeto; nomes repetidos não atrapalham
+        selected_object = self.hierarchy.model.object_at(index)
         if selected_object:
             self.properties.set_selected_object(selected_object)
-            self.hierarchy.update_cam(item)
+            self.hierarchy.update_cam(selected_object)
 
             
 
@@ -99,12 +96,11 @@ class GameEngine(QMainWindow):
         self.show()
         
     def keyPressEvent(self, event):
-        self.key_pressed.add(event.key())
-        self.scene_view.update_scene()
+        # Só entra na fila de input; a cena lê as teclas no próximo tick.
+        self.scene_view.input.key_press(event)
 
     def keyReleaseEvent(self, event):
-        self.key_pressed.discard(event.key())
-        self.scene_view.update_scene()
+        self.scene_view.input.key_release(event)
 
 
 if __name__ == "__main__":
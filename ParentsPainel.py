@@ -99,5 +99,9 @@ class ParentsPanel(QWidget):
 
     def notify_change(self):
         """Notifica mudanças e atualiza a cena."""
-        self.scene_view.repaint()
+        self.scene_view.mark_dirty()
+        # A árvore da Hierarchy não vê set_parent/set_children: avisa para que ela se releia
+        hierarchy_edited = getattr(self.scene_view, 'hierarchy_edited', None)
+        if hierarchy_edited is not None:
+            hierarchy_edited.emit()
         self.update_lists()
@@ -9,7 +9,7 @@ class PongBallScript:
         self.scene_view = scene_view
         self.started = False
         self.enabled = True
-        self.velocity = [random.choice([-5, 5]), random.choice([-5, 5])]  # Velocidade inicial aleatória
+        self.velocity = [random.choice([-300, 300]), random.choice([-300, 300])]  # Velocidade inicial aleatória, em pixels por segundo
 
     def Start(self, game_object, started=True):
         self.started = started
@@ -23,9 +23,10 @@ class PongBallScript:
 
     def move_ball(self, game_object):
         # Atualize a posição da bola
+        dt = self.scene_view.dt
         new_position = (
-            game_object.position[0] + self.velocity[0],
-            game_object.position[1] + self.velocity[1]
+            game_object.position[0] + self.velocity[0] * dt,
+            game_object.position[1] + self.velocity[1] * dt
         )
 
         # Verifique colisão com as bordas
@@ -35,24 +36,16 @@ class PongBallScript:
         if new_position[1] <= 0 or new_position[1] >= self.scene_view.height() - game_object.size[1]:
             self.velocity[1] = -self.velocity[1]  # Inverta a direção no eixo Y
 
-        # Verifique colisão com outros game objects
-        for obj in self.scene_view.scene_objects:
-            if obj != game_object and self.check_collision(new_position, game_object.size, obj):
-                self.handle_collision(obj)
-
         # Atualize a posição do game object
         game_object.position = (
-            game_object.position[0] + self.velocity[0],
-            game_object.position[1] + self.velocity[1]
+            game_object.position[0] + self.velocity[0] * dt,
+            game_object.position[1] + self.velocity[1] * dt
         )
         game_object.notify_change()
 
-    def check_collision(self, new_position, size, other_obj):
-        # Verifique se há interseção entre os retângulos da bola e do outro objeto
-        left1, top1, right1, bottom1 = new_position[0], new_position[1], new_position[0] + size[0], new_position[1] + size[1]
-        left2, top2, right2, bottom2 = other_obj.position[0], other_obj.position[1], other_obj.position[0] + other_obj.size[0], other_obj.position[1] + other_obj.size[1]
-
-        return not (right1 <= left2 or right2 <= left1 or bottom1 <= top2 or bottom2 <= top1)
+    def OnCollisionEnter(self, game_object, other_obj):
+        # Chamado pelo serviço de colisões da cena quando a bola encosta em outro objeto
+        self.handle_collision(other_obj)
 
     def handle_collision(self, other_obj):
         # Inverta a direção da bola ao colidir com outro objeto
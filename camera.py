@@ -1,11 +1,22 @@
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 from OpenGL.GLU import gluOrtho2D
-from copy import deepcopy
+import math
 
 class Camera:
+    # Slotted like GameObject; DynamicCamera accepts ad-hoc attributes.
+    __slots__ = (
+        "scene_view", "object_id", "_name", "_tag",
+        "position", "size", "rotation", "fov",
+        "scripts", "parent", "children", "started", "active",
+        "original_position", "original_rotation", "original_size", "original_fov",
+    )
+
     def __init__(self, name, position=(0, 0), size=(100, 100), rotation=0, fov=60, scene_view=None):
+        self.scene_view = None
+        self.object_id = None
         self.name = name
+        self.tag = "MainCamera"
         self.position = list(position)
         self.size = list(size)
         self.rotation = rotation
@@ -20,11 +31,35 @@ class Camera:
         
         self.store_original_state()
     
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        old_name = getattr(self, '_name', None)
+        self._name = value
+        registry = getattr(self.scene_view, 'registry', None)
+        if registry is not None:
+            registry.rename(self, old_name, value)
+
+    @property
+    def tag(self):
+        return self._tag
+
+    @tag.setter
+    def tag(self, value):
+        old_tag = getattr(self, '_tag', None)
+        self._tag = value
+        registry = getattr(self.scene_view, 'registry', None)
+        if registry is not None:
+            registry.retag(self, old_tag, value)
+
     def reset(self):
-        self.position = deepcopy(self.original_position)
-        self.size = deepcopy(self.original_size)
-        self.rotation = deepcopy(self.original_rotation)
-        self.fov = deepcopy(self.original_fov)
+        self.position = list(self.original_position)
+        self.size = list(self.original_size)
+        self.rotation = self.original_rotation
+        self.fov = self.original_fov
     
     def set_state(self, state):
         self.position = list(state.get("position", self.position))
@@ -32,11 +67,27 @@ class Camera:
         self.rotation = state.get("rotation", self.rotation)
         self.fov = state.get("fov", self.fov)
     
+    def capture_state(self):
+        return (tuple(self.position), self.rotation, tuple(self.size), self.fov, self.active, self._name, self._tag)
+
+    def restore_state(self, state):
+        position, rotation, size, fov, active, name, tag = state
+        self.position = list(position)
+        self.rotation = rotation
+        self.size = list(size)
+        self.fov = fov
+        self.active = active
+        if self._name != name:
+            self.name = name
+        if self._tag != tag:
+            self.tag = tag
+
     def store_original_state(self):
-        self.original_position = deepcopy(self.position)
-        self.original_rotation = deepcopy(self.rotation)
-        self.original_size = deepcopy(self.size)
-        self.original_fov = deepcopy(self.fov)
+        # position and size are lists here; keep immutable copies.
+        self.original_position = tuple(self.position)
+        self.original_rotation = self.rotation
+        self.original_size = tuple(self.size)
+        self.original_fov = self.fov
     
     def apply_view(self, width, height):
         glMatrixMode(GL_PROJECTION)
@@ -51,6 +102,28 @@ class Camera:
         glRotatef(self.rotation, 0, 0, 1)
         glScalef(self.size[0] / 100.0, self.size[1] / 100.0, 1)
     
+    def screen_to_world(self, x, y, width, height):
+        """Map a widget pixel (origin top-left) to world coordinates.
+
+        This is the inverse of apply_view: undo the translation, then the
+        rotation, then the zoom.
+        """
+        eye_x = x - width / 2 - (-self.position[0] + width / 2)
+        eye_y = y - height / 2 - (self.position[1] - height / 2)
+        angle = math.radians(self.rotation)
+        cos, sin = math.cos(angle), math.sin(angle)
+        rotated_x = cos * eye_x + sin * eye_y
+        rotated_y = -sin * eye_x + cos * eye_y
+        return (rotated_x / (self.size[0] / 100.0), rotated_y / (self.size[1] / 100.0))
+
+    def visible_rect(self, width, height):
+        """World-space bounding box of everything this camera can show."""
+        if not self.size[0] or not self.size[1]:
+            return None
+        corners = [self.screen_to_world(x, y, width, height) for x, y in ((0, 0), (width, 0), (width, height), (0, height))]
+        xs, ys = zip(*corners)
+        return (min(xs), min(ys), max(xs), max(ys))
+
     def start_scripts(self):
         for script in self.scripts:
             if not script.started:
@@ -60,10 +133,17 @@ class Camera:
     def add_script(self, script):
         if script not in self.scripts:
             self.scripts.append(script)
+            self.scripts_changed()
     
     def remove_script(self, script):
         if script in self.scripts:
             self.scripts.remove(script)
+            self.scripts_changed()
+
+    def scripts_changed(self):
+        scripts_changed = getattr(self.scene_view, 'scripts_changed', None)
+        if scripts_changed is not None:
+            scripts_changed()
             
     def VoidUpdate(self):
         if self.active:
@@ -72,14 +152,21 @@ class Camera:
                     script.Update(self)
                 except Exception as e:
                     print(f"Error in script {script.name}: {e}")
+
+    # See GameObject.VoidUpdate.
+    VoidUpdate.runs_scripts = True
     
     def set_parent(self, parent):
         self.parent = parent
     
     def add_child(self, child):
-        if child not in self.children:
-            self.children.append(child)
-            child.set_parent(self)
+        if child is self or child in self.children:
+            return
+        # A child has one parent: take it away from the old one first.
+        if getattr(child, 'parent', None) is not None:
+            child.parent.remove_child(child)
+        self.children.append(child)
+        child.set_parent(self)
     
     def remove_child(self, child):
         if child in self.children:
@@ -106,3 +193,9 @@ class Camera:
     def zoom(self, factor):
         self.fov *= factor
         self.size = [self.size[0] * factor, self.size[1] * factor]
+
+
+class DynamicCamera(Camera):
+    """Camera that also accepts ad-hoc attributes."""
+
+    __slots__ = ("__dict__",)
@@ -0,0 +1,138 @@
+HANDLERS = ("OnCollisionEnter", "OnCollisionStay", "OnCollisionExit")
+
+
+def _overlap(a, b):
+    return not (a[2] < b[0] or a[0] > b[2] or a[3] < b[1] or a[1] > b[3])
+
+
+class CollisionWorld:
+    """Broadphase queries and per-tick contact events for a scene.
+
+    Uses the scene's spatial hash, which already tracks every object with
+    bounds and is re-indexed incrementally as objects move, so queries cost
+    the cells they touch rather than a scan of the scene.
+
+    Contacts are found once per tick, after the scripts ran, for the objects
+    somebody listens to: objects with a subscribed callback and objects with
+    a script defining OnCollisionEnter/Stay/Exit(game_object, other). With
+    track_all_pairs set, every overlapping pair is tracked and listed in
+    `pairs`, listeners or not.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.index = scene.spatial_index
+        self.track_all_pairs = False
+        self.pairs = set()
+        self.subscribers = {}
+        self.script_listeners = set()
+
+    def query_aabb(self, rect, exclude=None):
+        """Objects whose bounds overlap `rect` (min_x, min_y, max_x, max_y)."""
+        self.scene.refresh_spatial_index()
+        found = self.index.query_aabb(rect)
+        found.discard(exclude)
+        return found
+
+    def query_point(self, x, y):
+        self.scene.refresh_spatial_index()
+        return self.index.query_point(x, y)
+
+    def overlapping(self, game_object):
+        """Objects currently overlapping `game_object`."""
+        self.scene.refresh_spatial_index()
+        bounds = self.index.bounds.get(game_object)
+        if bounds is None:
+            return set()
+        found = self.index.query_aabb(bounds)
+        found.discard(game_object)
+        return found
+
+    def subscribe(self, game_object, on_enter=None, on_stay=None, on_exit=None):
+        """Call on_*(game_object, other) when contacts of `game_object` change."""
+        self.subscribers.setdefault(game_object, []).append((on_enter, on_stay, on_exit))
+
+    def unsubscribe(self, game_object):
+        self.subscribers.pop(game_object, None)
+
+    def refresh_listener(self, game_object):
+        """Re-check whether any of the object's scripts handles collisions."""
+        scripts = getattr(game_object, 'scripts', ())
+        if any(hasattr(script, name) for script in scripts for name in HANDLERS):
+            self.script_listeners.add(game_object)
+        else:
+            self.script_listeners.discard(game_object)
+
+    def forget(self, game_object):
+        """Drop a removed object's subscriptions and contacts without events."""
+        self.subscribers.pop(game_object, None)
+        self.script_listeners.discard(game_object)
+        self.pairs = {pair for pair in self.pairs if game_object not in pair}
+
+    def clear_contacts(self):
+        self.pairs = set()
+
+    def step(self):
+        """Recompute contacts and fire enter/stay/exit events."""
+        listeners = self.script_listeners.union(self.subscribers)
+        if not listeners and not self.track_all_pairs:
+            if self.pairs:
+                self.pairs = set()
+            return
+        self.scene.refresh_spatial_index()
+        if self.track_all_pairs:
+            current = self._all_pairs()
+        else:
+            current = self._pairs_of(listeners)
+
+        previous = self.pairs
+        self.pairs = current
+        for pair in current - previous:
+            self._dispatch(pair, 0, listeners)
+        for pair in current & previous:
+            self._dispatch(pair, 1, listeners)
+        for pair in previous - current:
+            self._dispatch(pair, 2, listeners)
+
+    def _pairs_of(self, objects):
+        pairs = set()
+        bounds = self.index.bounds
+        for game_object in objects:
+            rect = bounds.get(game_object)
+            if rect is None:
+                continue
+            for other in self.index.query_aabb(rect):
+                if other is not game_object:
+                    pairs.add((game_object, other) if id(game_object) < id(other) else (other, game_object))
+        return pairs
+
+    def _all_pairs(self):
+        pairs = set()
+        bounds = self.index.bounds
+        for cell in self.index.cells.values():
+            if len(cell) < 2:
+                continue
+            members = list(cell)
+            for i, a in enumerate(members):
+                bounds_a = bounds[a]
+                for b in members[i + 1:]:
+                    if _overlap(bounds_a, bounds[b]):
+                        pairs.add((a, b) if id(a) < id(b) else (b, a))
+        return pairs
+
+    def _dispatch(self, pair, kind, listeners):
+        a, b = pair
+        for game_object, other in ((a, b), (b, a)):
+            if game_object not in listeners:
+                continue
+            for callbacks in self.subscribers.get(game_object, ()):
+                if callbacks[kind] is not None:
+                    callbacks[kind](game_object, other)
+            if game_object in self.script_listeners:
+                for script in game_object.scripts:
+                    handler = getattr(script, HANDLERS[kind], None)
+                    if handler is not None and getattr(script, 'enabled', True):
+                        try:
+                            handler(game_object, other)
+                        except Exception as e:
+                            print(f"Error in script {script.name}: {e}")
@@ -24,6 +24,10 @@ class PainelDeControle(QHBoxLayout):
         self.stop_button.clicked.connect(self.stop_simulation)
         self.addWidget(self.stop_button)
 
+        self.stats_checkbox = QCheckBox("Estatísticas")
+        self.stats_checkbox.toggled.connect(self.scene_view.set_stats_overlay)
+        self.addWidget(self.stats_checkbox)
+
     def start_simulation(self):
         try:
             self.scene_view.start()
@@ -0,0 +1,139 @@
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import QLabel
+
+# Properties that pick the object's texture (the texture cache key). Every
+# new value decodes and uploads a texture, so a scrub only applies them
+# when it ends.
+TEXTURE_PROPERTIES = frozenset(("color", "image_path"))
+
+# Properties that only move or re-layer the sprite; anything else changes
+# how it is drawn and needs update_image().
+GEOMETRY_PROPERTIES = frozenset(("position", "size", "rotation", "scale", "layer"))
+
+# Properties with a setter method that does more than the attribute (a
+# Camera moves its children along with it).
+SETTERS = {"position": "set_position"}
+
+
+class EditTransaction:
+    """Batches editor property changes and applies them once per event-loop turn.
+
+    Panels call set(obj, name, value) from their textChanged handlers. The
+    first change of a turn schedules flush() on a zero-length timer, and
+    later changes in the same turn overwrite the pending value. flush()
+    assigns the pending properties, then calls update_image() and
+    store_original_state() once per object and marks the scene dirty
+    (one asynchronous frame). Before this, each keystroke ran a synchronous
+    repaint, a texture sync and a state snapshot.
+
+    While a scrub is in progress (begin_scrub/end_scrub, e.g. dragging a
+    ScrubLabel), geometry is applied every turn. TEXTURE_PROPERTIES are
+    held back until the scrub ends, and so is storing the original state,
+    so dragging does not produce a texture or a snapshot per mouse move.
+    """
+
+    def __init__(self, scene_view):
+        self.scene_view = scene_view
+        self.pending = {}  # object -> {property: value}
+        self.held = {}  # texture properties held back during a scrub
+        self.scrubbed = set()
+        self.scrubbing = False
+        self.scheduled = False
+
+    def set(self, obj, name, value):
+        self.pending.setdefault(obj, {})[name] = value
+        self._schedule()
+
+    def get(self, obj, name):
+        """The value `name` will have once pending edits are applied."""
+        for changes in (self.pending.get(obj), self.held.get(obj)):
+            if changes and name in changes:
+                return changes[name]
+        return getattr(obj, name)
+
+    def begin_scrub(self):
+        self.flush()
+        self.scrubbing = True
+
+    def end_scrub(self):
+        if not self.scrubbing:
+            return
+        self.scrubbing = False
+        for obj, held in self.held.items():
+            changes = self.pending.setdefault(obj, {})
+            for name, value in held.items():
+                changes.setdefault(name, value)
+        for obj in self.scrubbed:
+            # Even with no held values: the original state is stored now.
+            self.pending.setdefault(obj, {})
+        self.held = {}
+        self.scrubbed = set()
+        self._schedule()
+
+    def flush(self):
+        """Apply every pending change now."""
+        self.scheduled = False
+        pending, self.pending = self.pending, {}
+        if not pending:
+            return
+        running = getattr(self.scene_view, 'running', False)
+        for obj, changes in pending.items():
+            if self.scrubbing:
+                self.scrubbed.add(obj)
+                for name in TEXTURE_PROPERTIES.intersection(changes):
+                    self.held.setdefault(obj, {})[name] = changes.pop(name)
+            for name, value in changes.items():
+                setter = SETTERS.get(name)
+                if setter is not None and hasattr(obj, setter):
+                    getattr(obj, setter)(value)
+                else:
+                    setattr(obj, name, value)
+            if hasattr(obj, 'update_image') and not GEOMETRY_PROPERTIES.issuperset(changes):
+                obj.update_image()
+            if not self.scrubbing and not running and hasattr(obj, 'store_original_state'):
+                obj.store_original_state()
+        self.scene_view.mark_dirty()
+
+    def _schedule(self):
+        if not self.scheduled:
+            self.scheduled = True
+            QTimer.singleShot(0, self.flush)
+
+
+class ScrubLabel(QLabel):
+    """Label that changes a numeric QLineEdit by `step` per pixel dragged sideways.
+
+    The field's textChanged handler sees each value as if it had been typed;
+    the drag is wrapped in a scrub of `edits`.
+    """
+
+    def __init__(self, text, field, edits, step=1.0):
+        super().__init__(text)
+        self.field = field
+        self.edits = edits
+        self.step = step
+        self._origin = None
+        self._start_value = 0.0
+        self.setCursor(Qt.SizeHorCursor)
+
+    def mousePressEvent(self, event):
+        if event.button() != Qt.LeftButton:
+            return super().mousePressEvent(event)
+        try:
+            self._start_value = float(self.field.text())
+        except ValueError:
+            return
+        self._origin = event.globalX()
+        self.edits.begin_scrub()
+
+    def mouseMoveEvent(self, event):
+        if self._origin is None:
+            return super().mouseMoveEvent(event)
+        value = self._start_value + (event.globalX() - self._origin) * self.step
+        self.field.setText(str(round(value, 4)))
+
+    def mouseReleaseEvent(self, event):
+        if self._origin is None:
+            return super().mouseReleaseEvent(event)
+        self._origin = None
+        self.edits.end_scrub()
@@ -0,0 +1,46 @@
+class GameClock:
+    """Fixed-timestep accumulator.
+
+    Real elapsed time is fed in with advance(), which returns how many
+    simulation ticks of `fixed_dt` seconds are due. At most
+    `max_ticks_per_frame` ticks run per call; time beyond that is dropped so
+    a long hitch slows the game down briefly instead of snowballing into
+    ever longer catch-up frames.
+    """
+
+    def __init__(self, fixed_dt=1 / 60, max_ticks_per_frame=5):
+        self.fixed_dt = fixed_dt
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.reset()
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.time = 0.0
+        self.frame = 0
+        self.dropped_time = 0.0
+
+    def set_tick_rate(self, hz):
+        if not hz > 0:
+            raise ValueError(f"Tick rate must be a positive number of ticks per second, not {hz!r}")
+        self.fixed_dt = 1.0 / hz
+
+    def advance(self, elapsed):
+        self.accumulator += max(0.0, elapsed)
+        ticks = int(self.accumulator / self.fixed_dt)
+        if ticks > self.max_ticks_per_frame:
+            dropped = (ticks - self.max_ticks_per_frame) * self.fixed_dt
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+            ticks = self.max_ticks_per_frame
+        self.accumulator -= ticks * self.fixed_dt
+        return ticks
+
+    def tick(self):
+        """Account for one simulation step that just ran."""
+        self.time += self.fixed_dt
+        self.frame += 1
+
+    @property
+    def alpha(self):
+        """How far rendering is between the last tick and the next one (0..1)."""
+        return self.accumulator / self.fixed_dt
@@ -1,14 +1,62 @@
-import numpy as np
-from PIL import Image
-from OpenGL.GL import *
-from PyQt5.QtGui import QColor
-from copy import deepcopy
-from PyQt5.QtCore import QTimer
+import math
+
+
+def qcolor(*args):
+    """QColor(*args), imported on first use so headless scenes never load Qt."""
+    from PyQt5.QtGui import QColor
+    return QColor(*args)
+
+
+def qcolor_from_rgba(rgba):
+    from PyQt5.QtGui import QColor
+    return QColor.fromRgba(rgba)
+
+
+def overlay_rgba(color):
+    # No overlay yet (None) is transparent black, like QColor(0, 0, 0, 0).
+    return color.rgba() if color is not None else 0
 
 
 class GameObject:
+    # No per-instance __dict__: scenes spawn thousands of these. Scripts that
+    # need to hang their own attributes on an object use DynamicGameObject.
+    __slots__ = (
+        "appearance_dirty",
+        "_store", "_row", "_velocity", "_angular_velocity", "_world",
+        "parent", "children", "scene_view", "object_id", "_name", "_tag",
+        "_position", "_size", "_color", "_rotation", "_scale", "_layer",
+        "texture_id", "texture_entry", "atlas_region", "texture_ready",
+        "scripts", "started", "active", "_image_path",
+        "_offset_x", "_offset_y", "_tiling_x", "_tiling_y",
+        "_overlay_color", "overlay_tint",
+        "original_position", "original_size", "original_color",
+        "original_rotation", "original_scale", "original_image_path",
+        "original_overlay_color", "original_layer",
+        "original_velocity", "original_angular_velocity",
+    )
+
     def __init__(self, name, position=(0, 0), size=(50, 50), color=(255, 255, 255, 255), rotation=0, scale=1, scene_view=None, image_path=None):
+        # Transform, size and overlay changes only need a repaint; appearance
+        # changes also need the texture re-synced, which happens once, right
+        # before drawing.
+        self.appearance_dirty = True
+        # Row in the scene's TransformStore while bound to one; the store
+        # then holds the transform, size, color and velocity columns.
+        self._store = None
+        self._row = -1
+        self._velocity = (0.0, 0.0)
+        self._angular_velocity = 0.0
+        # position, rotation and scale are local to the parent; the world
+        # transform is derived from them on demand and cached in _world.
+        self._world = None
+        self.parent = None
+        # Most objects never get children or scripts: they share the empty
+        # tuple until add_child/add_script gives them a list of their own.
+        self.children = ()
+        self.scene_view = None
+        self.object_id = None
         self.name = name
+        self.tag = "Untagged"
         self.position = position
         self.size = size
         self.color = color
@@ -16,50 +64,512 @@ class GameObject:
         self.scale = scale
         self.scene_view = scene_view
         self.texture_id = None
-        self.scripts = []
+        self.texture_entry = None
+        self.atlas_region = None
+        self.texture_ready = False
+        self.scripts = ()
         self.started = False
         self.active = True
         self.image_path = image_path
-        self.offset_x = 0
-        self.offset_y = 0
-        self.tiling_x = 1
-        self.tiling_y = 1
-        self.overlay_color = QColor(0, 0, 0, 0)
+        self._offset_x = 0
+        self._offset_y = 0
+        self._tiling_x = 1
+        self._tiling_y = 1
+        # Transparent until set; the QColor is only made when someone asks.
+        self.overlay_color = None
         self.layer = 0
 
-        self.original_position = deepcopy(self.position)
-        self.original_size = deepcopy(self.size)
-        self.original_color = deepcopy(self.color)
-        self.original_rotation = deepcopy(self.rotation)
-        self.texture_id = self.texture_id
-        self.original_scale = deepcopy(self.scale)
-        self.original_image_path = deepcopy(self.image_path)
-        self.original_overlay_color = deepcopy(self.overlay_color)
-        self.original_layer = deepcopy(self.layer)
-
-        self.parent = None
-        self.children = []
-
+        self.original_image_path = image_path
+        self.original_overlay_color = self._overlay_color
+        self.original_velocity = self._velocity
+        self.original_angular_velocity = self._angular_velocity
+        self._snapshot_transform()
+
+    def _snapshot_transform(self):
+        # Tuples and numbers are immutable, so the snapshot only keeps
+        # references; tuple() hands a tuple back unchanged and copies lists.
+        self.original_position = tuple(self.position)
+        self.original_size = tuple(self.size)
+        self.original_color = tuple(self.color)
+        self.original_rotation = self.rotation
+        self.original_scale = self.scale
+        self.original_layer = self.layer
+
+    def transform_changed(self):
+        moved_objects = getattr(self.scene_view, 'moved_objects', None)
+        if moved_objects is not None and not moved_objects:
+            # First object to move since the scene last re-indexed: one
+            # frame request covers everything that moves after it.
+            self.scene_view.mark_dirty()
+        self._invalidate_world()
+
+    def _invalidate_world(self):
+        # Computing a world transform computes the parent's first, so a dirty
+        # object never has a clean descendant and the walk can skip subtrees
+        # that are already dirty. Objects in a TransformStore have no cache of
+        # their own and are always walked.
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+            store = getattr(obj, '_store', None)
+            if store is not None:
+                store.world_dirty = True
+            elif getattr(obj, '_world', None) is None:
+                continue
+            obj._world = None
+            # Queue the object so the scene only re-indexes what actually
+            # moved; the set holds it once however often it moves.
+            moved_objects = getattr(obj.scene_view, 'moved_objects', None)
+            if moved_objects is not None:
+                moved_objects.add(obj)
+            stack.extend(obj.children)
+
+    def world_transform(self):
+        """(x, y, rotation, scale) in world space, cached until something above changes."""
+        if self._store is not None:
+            return self._store.world_of(self._row)
+        world = self._world
+        if world is not None:
+            return world
+        # Walk up to the nearest ancestor with a valid cache, then compose
+        # back down, caching every level on the way.
+        chain = [self]
+        parent = self.parent
+        while hasattr(parent, 'world_transform') and parent._store is None and parent._world is None:
+            chain.append(parent)
+            parent = parent.parent
+        world = parent.world_transform() if hasattr(parent, 'world_transform') else None
+        for obj in reversed(chain):
+            x, y = obj._position
+            if world is None:
+                world = (x, y, obj._rotation, obj._scale)
+            else:
+                parent_x, parent_y, parent_rotation, parent_scale = world
+                angle = math.radians(parent_rotation)
+                cos = math.cos(angle) * parent_scale
+                sin = math.sin(angle) * parent_scale
+                world = (
+                    parent_x + x * cos - y * sin,
+                    parent_y + x * sin + y * cos,
+                    parent_rotation + obj._rotation,
+                    parent_scale * obj._scale,
+                )
+            obj._world = world
+        return world
+
+    def world_matrix(self):
+        """World transform as a 2x3 affine matrix ((a, b, tx), (c, d, ty))."""
+        x, y, rotation, scale = self.world_transform()
+        angle = math.radians(rotation)
+        cos = math.cos(angle) * scale
+        sin = math.sin(angle) * scale
+        return ((cos, -sin, x), (sin, cos, y))
+
+    @property
+    def world_position(self):
+        x, y, _, _ = self.world_transform()
+        return (x, y)
+
+    def world_to_local(self, x, y, rotation=0, scale=1):
+        """Express a world transform in this object's parent space."""
+        parent = self.parent
+        if parent is None or not hasattr(parent, 'world_transform'):
+            return (x, y), rotation, scale
+        parent_x, parent_y, parent_rotation, parent_scale = parent.world_transform()
+        if not parent_scale:
+            return (0, 0), rotation - parent_rotation, scale
+        angle = math.radians(-parent_rotation)
+        cos, sin = math.cos(angle), math.sin(angle)
+        dx, dy = x - parent_x, y - parent_y
+        return (
+            ((dx * cos - dy * sin) / parent_scale, (dx * sin + dy * cos) / parent_scale),
+            rotation - parent_rotation,
+            scale / parent_scale,
+        )
+
+    def get_bounds(self):
+        """Axis-aligned (min_x, min_y, max_x, max_y) of the rotated, scaled quad in world space."""
+        x, y, rotation, scale = self.world_transform()
+        half_w = abs(self.size[0] * scale) / 2
+        half_h = abs(self.size[1] * scale) / 2
+        if rotation % 180:
+            angle = math.radians(rotation)
+            cos, sin = abs(math.cos(angle)), abs(math.sin(angle))
+            half_w, half_h = cos * half_w + sin * half_h, sin * half_w + cos * half_h
+        return (x - half_w, y - half_h, x + half_w, y + half_h)
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        old_name = getattr(self, '_name', None)
+        self._name = value
+        registry = getattr(self.scene_view, 'registry', None)
+        if registry is not None:
+            registry.rename(self, old_name, value)
+
+    @property
+    def tag(self):
+        return self._tag
+
+    @tag.setter
+    def tag(self, value):
+        old_tag = getattr(self, '_tag', None)
+        self._tag = value
+        registry = getattr(self.scene_view, 'registry', None)
+        if registry is not None:
+            registry.retag(self, old_tag, value)
+
+    @property
+    def position(self):
+        if self._store is not None:
+            return tuple(self._store.position[self._row].tolist())
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        if self._store is not None:
+            self._store.position[self._row] = value
+        else:
+            self._position = value
+        self.transform_changed()
+
+    @property
+    def rotation(self):
+        if self._store is not None:
+            return float(self._store.rotation[self._row])
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value):
+        if self._store is not None:
+            self._store.rotation[self._row] = value
+        else:
+            self._rotation = value
+        self.transform_changed()
+
+    @property
+    def scale(self):
+        if self._store is not None:
+            return float(self._store.scale[self._row])
+        return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        if self._store is not None:
+            self._store.scale[self._row] = value
+        else:
+            self._scale = value
+        self.transform_changed()
+
+    @property
+    def velocity(self):
+        """Units per second the scene adds to position every tick."""
+        if self._store is not None:
+            return tuple(self._store.velocity[self._row].tolist())
+        return self._velocity
+
+    @velocity.setter
+    def velocity(self, value):
+        if self._store is not None:
+            self._store.velocity[self._row] = value
+        else:
+            self._velocity = tuple(value)
+            self.motion_changed()
+        if not getattr(self.scene_view, 'running', False):
+            self.original_velocity = tuple(value)
+
+    @property
+    def angular_velocity(self):
+        """Degrees per second the scene adds to rotation every tick."""
+        if self._store is not None:
+            return float(self._store.angular_velocity[self._row])
+        return self._angular_velocity
+
+    @angular_velocity.setter
+    def angular_velocity(self, value):
+        if self._store is not None:
+            self._store.angular_velocity[self._row] = value
+        else:
+            self._angular_velocity = value
+            self.motion_changed()
+        if not getattr(self.scene_view, 'running', False):
+            self.original_angular_velocity = value
+
+    def motion_changed(self):
+        moving_objects = getattr(self.scene_view, 'moving_objects', None)
+        if moving_objects is None or not self.scene_view.registry.contains(self):
+            return
+        if self._velocity[0] or self._velocity[1] or self._angular_velocity:
+            moving_objects.add(self)
+        else:
+            moving_objects.discard(self)
+
+    @property
+    def layer(self):
+        return self._layer
+
+    @layer.setter
+    def layer(self, value):
+        render_queue = getattr(self.scene_view, 'render_queue', None)
+        if render_queue is not None:
+            render_queue.move(self, value)
+        self._layer = value
+        if self._store is not None:
+            self._store.update_draw_key(self)
+
+    @property
+    def size(self):
+        if self._store is not None:
+            return tuple(self._store.size[self._row].tolist())
+        return self._size
+
+    @size.setter
+    def size(self, value):
+        # Textures are kept at native resolution, so size is geometry only.
+        if self._store is not None:
+            self._store.size[self._row] = value
+            # Tiled sprites derive their UVs from the size.
+            self._store.render_pending[self._row] = True
+        else:
+            self._size = value
+        self.transform_changed()
+
+    @property
+    def color(self):
+        if self._store is not None:
+            return tuple(self._store.color[self._row].tolist())
+        return self._color
+
+    @color.setter
+    def color(self, value):
+        if self._store is not None:
+            self._store.color[self._row] = self._store.color_row(value)
+        else:
+            self._color = value
+        self.appearance_changed()
+
+    @property
+    def image_path(self):
+        return self._image_path
+
+    @image_path.setter
+    def image_path(self, value):
+        self._image_path = value
+        self.appearance_changed()
+
+    @property
+    def overlay_color(self):
+        if self._overlay_color is None:
+            self._overlay_color = qcolor(0, 0, 0, 0)
+        return self._overlay_color
+
+    @overlay_color.setter
+    def overlay_color(self, value):
+        # Applied at draw time, so only the cached RGBA floats change.
+        self._overlay_color = value
+        self.overlay_tint = value.getRgbF() if value is not None else (0.0, 0.0, 0.0, 0.0)
+        if self._store is not None:
+            self._store.render_pending[self._row] = True
+
+    # Offset and tiling only move the texture coordinates, unless they take
+    # the sprite into or out of the atlas (see wraps_texture).
+
+    @property
+    def offset_x(self):
+        return self._offset_x
+
+    @offset_x.setter
+    def offset_x(self, value):
+        wrapped = self.wraps_texture()
+        self._offset_x = value
+        self.texture_coords_changed(wrapped)
+
+    @property
+    def offset_y(self):
+        return self._offset_y
+
+    @offset_y.setter
+    def offset_y(self, value):
+        wrapped = self.wraps_texture()
+        self._offset_y = value
+        self.texture_coords_changed(wrapped)
+
+    @property
+    def tiling_x(self):
+        return self._tiling_x
+
+    @tiling_x.setter
+    def tiling_x(self, value):
+        wrapped = self.wraps_texture()
+        self._tiling_x = value
+        self.texture_coords_changed(wrapped)
+
+    @property
+    def tiling_y(self):
+        return self._tiling_y
+
+    @tiling_y.setter
+    def tiling_y(self, value):
+        wrapped = self.wraps_texture()
+        self._tiling_y = value
+        self.texture_coords_changed(wrapped)
+
+    def texture_coords_changed(self, wrapped):
+        """Refresh the UVs; `wrapped` is what wraps_texture() said before the change."""
+        if wrapped != self.wraps_texture():
+            self.appearance_changed()
+        elif self._store is not None:
+            self._store.render_pending[self._row] = True
+
+    def appearance_changed(self):
+        self.appearance_dirty = True
+        if self._store is not None:
+            self._store.render_pending[self._row] = True
+
+    def bind_store(self, store, row):
+        """Called by TransformStore.bind once the row holds this object's state."""
+        self._store = store
+        self._row = row
+        self._world = None
+
+    def unbind_store(self, position, rotation, scale, size, color, velocity, angular_velocity):
+        """Called by TransformStore.unbind with the row's final state."""
+        self._store = None
+        self._row = -1
+        self._position = position
+        self._rotation = rotation
+        self._scale = scale
+        self._size = size
+        self._color = color
+        self._velocity = velocity
+        self._angular_velocity = angular_velocity
+        # The world cache was not maintained while bound; make sure the
+        # spatial index picks up the restored transform.
+        self._world = None
+        moved_objects = getattr(self.scene_view, 'moved_objects', None)
+        if moved_objects is not None:
+            moved_objects.add(self)
+        self.motion_changed()
 
     def reset(self):
-        self.position = deepcopy(self.original_position)
-        self.size = deepcopy(self.original_size)
-        self.color = deepcopy(self.original_color)
-        self.rotation = deepcopy(self.original_rotation)
-        self.scale = deepcopy(self.original_scale)
-        self.image_path = deepcopy(self.original_image_path)
-        self.overlay_color = deepcopy(self.original_overlay_color)
-        self.layer = deepcopy(self.original_layer)
+        self.position = self.original_position
+        self.size = self.original_size
+        self.color = self.original_color
+        self.rotation = self.original_rotation
+        self.scale = self.original_scale
+        self.image_path = self.original_image_path
+        # QColor is mutable: hand out a copy so the original stays intact.
+        original = self.original_overlay_color
+        self.overlay_color = qcolor(original) if original is not None else None
+        self.layer = self.original_layer
+        self.velocity = self.original_velocity
+        self.angular_velocity = self.original_angular_velocity
         self.update_image()
         print(f"{self.name} reset to original position {self.original_position}")
     
+    def capture_state(self):
+        """Compact tuple of this object's own play-time state, for SceneSnapshot.
+
+        The first seven fields are the transform, size, color and velocity.
+        They are None for objects in a TransformStore; the snapshot copies
+        the store's columns in one go instead.
+        """
+        if self._store is None:
+            return (self._position, self._rotation, self._scale, self._size, self._color,
+                    self._velocity, self._angular_velocity,
+                    self._layer, self._image_path, overlay_rgba(self._overlay_color),
+                    self._offset_x, self._offset_y, self._tiling_x, self._tiling_y,
+                    self.active, self._name, self._tag)
+        return (None, None, None, None, None, None, None,
+                self._layer, self._image_path, overlay_rgba(self._overlay_color),
+                self._offset_x, self._offset_y, self._tiling_x, self._tiling_y,
+                self.active, self._name, self._tag)
+
+    def restore_state(self, state):
+        """Undo capture_state, touching only what changed so unchanged sprites keep their textures."""
+        (position, rotation, scale, size, color, velocity, angular_velocity,
+         layer, image_path, overlay, offset_x, offset_y, tiling_x, tiling_y,
+         active, name, tag) = state
+        if position is not None:
+            if self.position != position:
+                self.position = position
+            if self.rotation != rotation:
+                self.rotation = rotation
+            if self.scale != scale:
+                self.scale = scale
+            if self.size != size:
+                self.size = size
+            if self.color != color:
+                self.color = color
+            if self.velocity != velocity:
+                self.velocity = velocity
+            if self.angular_velocity != angular_velocity:
+                self.angular_velocity = angular_velocity
+        if self._image_path != image_path:
+            self.image_path = image_path
+        if (self._offset_x, self._offset_y, self._tiling_x, self._tiling_y) != (offset_x, offset_y, tiling_x, tiling_y):
+            self._offset_x, self._offset_y = offset_x, offset_y
+            self._tiling_x, self._tiling_y = tiling_x, tiling_y
+            self.update_image()
+        if overlay_rgba(self._overlay_color) != overlay:
+            self.overlay_color = qcolor_from_rgba(overlay) if overlay else None
+        if self._layer != layer:
+            self.layer = layer
+        self.active = active
+        if self._name != name:
+            self.name = name
+        if self._tag != tag:
+            self.tag = tag
+
     def set_parent(self, parent):
+        """Re-parent, keeping the object where it is in the world."""
+        if parent is self.parent:
+            return
+        x, y, rotation, scale = self.world_transform()
         self.parent = parent
+        # Only the local values change; the cached world transforms of this
+        # object and its subtree stay valid.
+        position, rotation, scale = self.world_to_local(x, y, rotation, scale)
+        if self._store is not None:
+            store = self._store
+            store.position[self._row] = position
+            store.rotation[self._row] = rotation
+            store.scale[self._row] = scale
+            store.reparent(self)
+        else:
+            self._position, self._rotation, self._scale = position, rotation, scale
+        if not getattr(self.scene_view, 'running', False):
+            # Editing the hierarchy: the new local transform is what Stop
+            # should come back to.
+            self.original_position = tuple(position)
+            self.original_rotation = rotation
+            self.original_scale = scale
+        hierarchy_changed = getattr(self.scene_view, 'hierarchy_changed', None)
+        if hierarchy_changed is not None:
+            hierarchy_changed()
+
+    def has_ancestor(self, node):
+        parent = self.parent
+        while parent is not None:
+            if parent is node:
+                return True
+            parent = getattr(parent, 'parent', None)
+        return False
 
     def add_child(self, child):
-        if child not in self.children:
+        # Refuse cycles: a node cannot become a child of its own descendant.
+        if child is self or child in self.children or self.has_ancestor(child):
+            return
+        if child.parent is not None:
+            child.parent.remove_child(child)
+        if self.children:
             self.children.append(child)
-            child.set_parent(self)
+        else:
+            self.children = [child]
+        child.set_parent(self)
     
     def remove_parent(self):
         if self.parent:
@@ -72,94 +582,81 @@ class GameObject:
             child.set_parent(None)
 
     def set_position(self, new_position):
-        delta_x = new_position[0] - self.position[0]
-        delta_y = new_position[1] - self.position[1]
+        # Children are positioned relative to this object and follow it.
         self.position = new_position
-        self._update_children_position(delta_x, delta_y)
-
-    def _update_children_position(self, delta_x, delta_y):
-        for child in self.children:
-            new_child_position = (child.position[0] + delta_x, child.position[1] + delta_y)
-            child.set_position(new_child_position)
 
     def update_position(self, delta):
-        new_position = (self.position[0] + delta[0], self.position[1] + delta[1])
-        self.set_position(new_position)
-        self._update_children_position()
-        
+        self.set_position((self.position[0] + delta[0], self.position[1] + delta[1]))
 
     def notify_change(self):
-        self.update_image()
         if self.scene_view:
-            self.scene_view.update()
+            self.scene_view.mark_dirty()
 
     def initialize_texture(self):
-        if self.texture_id is None:
-            self.texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, self.texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
-        self.update_image()
+        self.texture_ready = True
+        self.appearance_changed()
 
     def update_image(self):
-        if self.texture_id is None:
+        """Schedule a texture sync for the next time this object is drawn."""
+        self.appearance_changed()
+
+    def sync_texture(self):
+        """Bring the texture in line with the appearance properties.
+
+        Must run with the GL context current, which is why it is only called
+        from draw() instead of every time a property changes. The rendering
+        modules are imported here rather than at the top so game objects can
+        be simulated headless, on machines without OpenGL.
+        """
+        if not self.texture_ready:
+            return
+        from texture_cache import texture_cache
+        from texture_atlas import texture_atlas
+        self.appearance_dirty = False
+        key = texture_cache.make_key(self.image_path, self.color)
+        in_atlas = not self.wraps_texture()
+        if self.texture_entry is not None and self.texture_entry.key == key and (self.atlas_region is not None) == in_atlas:
             return
-        glBindTexture(GL_TEXTURE_2D, self.texture_id)
-        if self.image_path:
-            image = Image.open(self.image_path).convert("RGBA")
-            image = image.resize((int(self.size[0]), int(self.size[1])))
+        entry = texture_cache.acquire(key)
+        self.release_texture()
+        self.texture_entry = entry
+        if in_atlas and texture_atlas.fits(entry):
+            # None when the texture budget has no room for another atlas page.
+            self.atlas_region = texture_atlas.acquire(entry)
+        if self.atlas_region is not None:
+            self.texture_id = self.atlas_region.page.texture_id
         else:
-            size = (int(self.size[0]), int(self.size[1]))
-            color = tuple(map(int, self.color))
-            image = Image.new("RGBA", size, color)
-        image_data = np.array(image)
+            self.texture_id = texture_cache.texture(entry)
 
-        # Apply overlay color with alpha blending
-        overlay_color = np.array(self.overlay_color.getRgb())
-        overlay_color = overlay_color / 255.0
-        overlay_color = np.append(overlay_color[:3], overlay_color[3])
-        overlay_image = np.full(image_data.shape, overlay_color)
-        blended_image = (image_data * (1 - overlay_color[3]) + overlay_image * overlay_color[3]).astype(np.uint8)
+    def release_texture(self):
+        if self.texture_entry is None:
+            return
+        from texture_cache import texture_cache
+        from texture_atlas import texture_atlas
+        texture_atlas.release(self.atlas_region)
+        texture_cache.release(self.texture_entry)
+        self.atlas_region = None
+        self.texture_entry = None
+        self.texture_id = None
 
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, image.width, image.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, blended_image)
+    def wraps_texture(self):
+        """Tiled or scrolled sprites need GL_REPEAT, so they stay out of the atlas."""
+        return self._tiling_x != 1 or self._tiling_y != 1 or self._offset_x != 0 or self._offset_y != 0
 
     def draw(self):
-        if self.texture_id:
-            glEnable(GL_TEXTURE_2D)
-            glBindTexture(GL_TEXTURE_2D, self.texture_id)
-            glPushMatrix()
-            glTranslatef(self.position[0], self.position[1], 0)
-            glRotatef(self.rotation, 0, 0, 1)
-            glScalef(self.scale, self.scale, 1)
-
-            offset_x = self.offset_x % self.size[0]
-            offset_y = self.offset_y % self.size[1]
-
-            glBegin(GL_QUADS)
-            glColor4f(1, 1, 1, 1)
-            glTexCoord2f(0 + offset_x / self.size[0], 0 + offset_y / self.size[1])
-            glVertex2f(-self.size[0] / 2, -self.size[1] / 2)
-            glTexCoord2f(self.tiling_x + offset_x / self.size[0], 0 + offset_y / self.size[1])
-            glVertex2f(self.size[0] / 2, -self.size[1] / 2)
-            glTexCoord2f(self.tiling_x + offset_x / self.size[0], self.tiling_y + offset_y / self.size[1])
-            glVertex2f(self.size[0] / 2, self.size[1] / 2)
-            glTexCoord2f(0 + offset_x / self.size[0], self.tiling_y + offset_y / self.size[1])
-            glVertex2f(-self.size[0] / 2, self.size[1] / 2)
-            glEnd()
-
-            glPopMatrix()
-            glDisable(GL_TEXTURE_2D)
+        """Draw this object on its own; SceneView batches sprites instead."""
+        from sprite_batch import SpriteBatch
+        batch = SpriteBatch.shared()
+        batch.begin()
+        batch.add(self)
+        batch.end()
 
     def set_image(self, image_path):
         self.image_path = image_path
-        self.update_image()
         self.notify_change()
 
     def set_overlay_color(self, color):
         self.overlay_color = color
-        self.update_image()
         self.notify_change()
 
     def set_offset(self, offset_x, offset_y):
@@ -186,11 +683,28 @@ class GameObject:
                 script.started = True
 
     def add_script(self, script):
-        self.scripts.append(script)
+        if self.scripts:
+            self.scripts.append(script)
+        else:
+            self.scripts = [script]
+        self.scripts_changed()
 
     def remove_script(self, script):
         if script in self.scripts:
             self.scripts.remove(script)
+        self.scripts_changed()
+
+    def scripts_changed(self):
+        """Call after editing `scripts` directly (assign a list first: it starts as a shared empty tuple)."""
+        self.refresh_collision_listener()
+        scripts_changed = getattr(self.scene_view, 'scripts_changed', None)
+        if scripts_changed is not None:
+            scripts_changed()
+
+    def refresh_collision_listener(self):
+        collisions = getattr(self.scene_view, 'collisions', None)
+        if collisions is not None:
+            collisions.refresh_listener(self)
 
     def get_state(self):
         return {
@@ -212,37 +726,21 @@ class GameObject:
         self.update_image()
 
     def store_original_state(self):
-        self.original_position = deepcopy(self.position)
-        self.original_size = deepcopy(self.size)
-        self.original_color = deepcopy(self.color)
-        self.original_rotation = deepcopy(self.rotation)
-        self.original_scale = deepcopy(self.scale)
-        self.original_layer = deepcopy(self.layer)
+        self._snapshot_transform()
         print(f"{self.name} original position stored as {self.original_position}")
 
     def VoidUpdate(self):
-        """Update the GameObject and its children."""
+        """Run this object's scripts; the scene calls it parents-first, once per tick."""
         if self.active:
-            # Update the GameObject itself
             for script in self.scripts:
                 try:
                     script.Update(self)
                 except Exception as e:
                     print(f"Error in script {script.name}: {e}")
-            self.update_children()
-
-    def update_children(self):
-        """Update all children based on the parent's transformation."""
-        for child in self.children:
-            delta_x = self.position[0] - self.original_position[0]
-            delta_y = self.position[1] - self.original_position[1]
-            child.position = (
-                child.original_position[0] + delta_x,
-                child.original_position[1] + delta_y
-            )
-            child.VoidUpdate()
-
 
+    # ScriptScheduler runs the scripts itself, script by script, unless a
+    # subclass overrides VoidUpdate.
+    VoidUpdate.runs_scripts = True
 
     def update_game_objects(self):
         """Update all game objects in the scene."""
@@ -256,3 +754,9 @@ class GameObject:
         game_object.scene_view = self.scene_view
         game_object.initialize_texture()
         game_object.VoidStart()
+
+
+class DynamicGameObject(GameObject):
+    """GameObject that also accepts ad-hoc attributes (game_object.health = 3)."""
+
+    __slots__ = ("__dict__",)
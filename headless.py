@@ -0,0 +1,159 @@
+"""Run scenes without a window, a GL context or an event loop.
+
+Usage from code:
+
+    scene = load_scene("pong.json")
+    scene.run(10000)            # VoidStart once, then 10000 ticks of VoidUpdate
+
+Usage from a shell, e.g. to simulate many matches on a server:
+
+    python -m headless pong.json --ticks 10000 --runs 100
+
+A scene file is JSON:
+
+    {
+        "width": 800, "height": 600, "tick_rate": 60,
+        "objects": [
+            {"name": "Ball", "position": [400, 300], "size": [20, 20],
+             "color": [255, 255, 255, 255], "layer": 0,
+             "scripts": ["PongBallScript"]}
+        ]
+    }
+
+Scripts are loaded the same way the editor loads them: `<name>.py` must
+define a class called `<name>`, looked up next to the scene file and then in
+the current directory.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import random
+import time
+
+from scene_core import SceneCore
+
+
+class HeadlessScene(SceneCore):
+    """SceneCore with a stub view surface instead of a QOpenGLWidget.
+
+    Scripts see the same interface they get in the editor: width(), height(),
+    input, key_pressed and the dt/time/frame clock. Keys can be held with
+    press_key()/release_key() to script inputs; like Qt events, they take
+    effect at the next tick.
+    """
+
+    def __init__(self, width=800, height=600):
+        super().__init__()
+        self._width = width
+        self._height = height
+        # Nobody reads the timings unless asked; skip the bookkeeping.
+        self.profiler.enabled = False
+
+    def width(self):
+        return self._width
+
+    def height(self):
+        return self._height
+
+    def update(self):
+        pass
+
+    def repaint(self):
+        pass
+
+    def isVisible(self):
+        return False
+
+    def press_key(self, key):
+        self.input.press_key(key)
+
+    def release_key(self, key):
+        self.input.release_key(key)
+
+    def start(self):
+        self.running = True
+        self.begin_play()
+
+    def stop(self):
+        self.running = False
+        self.clock.reset()
+        self.reset_scene()
+
+    def run(self, ticks):
+        """Start the scene if needed and step it `ticks` times, as fast as possible."""
+        if not self.running:
+            self.start()
+        for _ in range(ticks):
+            self.step()
+        return ticks
+
+
+def load_script(name, scene, search_paths=(".",)):
+    for directory in search_paths:
+        path = os.path.join(directory, f"{name}.py")
+        if os.path.exists(path):
+            spec = importlib.util.spec_from_file_location(name, path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return getattr(module, name)(name, scene)
+    raise FileNotFoundError(f"Script '{name}' not found in {', '.join(search_paths)}")
+
+
+def load_scene(path):
+    from gameobject import GameObject
+
+    with open(path) as file:
+        spec = json.load(file)
+    scene = HeadlessScene(spec.get("width", 800), spec.get("height", 600))
+    if "tick_rate" in spec:
+        scene.set_tick_rate(spec["tick_rate"])
+    search_paths = (os.path.dirname(os.path.abspath(path)), ".")
+    for description in spec.get("objects", []):
+        game_object = GameObject(
+            description["name"],
+            position=tuple(description.get("position", (0, 0))),
+            size=tuple(description.get("size", (50, 50))),
+            color=tuple(description.get("color", (255, 255, 255, 255))),
+            rotation=description.get("rotation", 0),
+            scale=description.get("scale", 1),
+            scene_view=scene,
+            image_path=description.get("image_path"),
+        )
+        if "layer" in description:
+            game_object.layer = description["layer"]
+        for script_name in description.get("scripts", []):
+            game_object.add_script(load_script(script_name, scene, search_paths))
+        scene.add_game_object(game_object)
+    return scene
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate a scene without a window or OpenGL.")
+    parser.add_argument("scene", help="JSON scene file")
+    parser.add_argument("--ticks", type=int, default=3600)
+    parser.add_argument("--runs", type=int, default=1, help="Reload and simulate the scene this many times")
+    parser.add_argument("--seed", type=int, help="Seed Python's random module before each run")
+    args = parser.parse_args(argv)
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+    if args.ticks < 0:
+        parser.error("--ticks cannot be negative")
+
+    total_ticks = 0
+    start = time.perf_counter()
+    for run in range(args.runs):
+        if args.seed is not None:
+            random.seed(args.seed + run)
+        scene = load_scene(args.scene)
+        total_ticks += scene.run(args.ticks)
+    elapsed = time.perf_counter() - start
+
+    simulated = total_ticks * scene.dt
+    print(f"{args.runs} run(s), {total_ticks} ticks in {elapsed:.2f} s")
+    print(f"{total_ticks / elapsed:.0f} ticks/s, {simulated / elapsed:.1f}x real time")
+    return scene
+
+
+if __name__ == "__main__":
+    main()
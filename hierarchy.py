@@ -5,6 +5,7 @@ from copy import deepcopy
 from gameobject import GameObject
 from scene_view import SceneView
 from camera import Camera
+from hierarchy_model import HierarchyModel
 
 class AddGameObjectDialog(QDialog):
     def __init__(self, scene_view, parent=None):
@@ -60,7 +61,6 @@ class AddGameObjectDialog(QDialog):
 
     def add_game_object(self, item):
         self.selected_item = deepcopy(item)
-        self.scene_view.repaint()
         self.accept()
 
     def get_selected_item(self):
@@ -76,9 +76,14 @@ class Hierarchy(QWidget):
         # Configuração do layout principal
         self.layout = QVBoxLayout()
 
+        # Modelo sobre o grafo da cena: as linhas são criadas sob demanda
+        self.model = HierarchyModel(scene_view, parent=self)
+
         # Criação da árvore hierárquica
-        self.hierarchy_tree = QTreeWidget()
+        self.hierarchy_tree = QTreeView()
+        self.hierarchy_tree.setModel(self.model)
         self.hierarchy_tree.setHeaderHidden(True)  # Esconde o cabeçalho
+        self.hierarchy_tree.setUniformRowHeights(True)  # Evita medir cada linha em árvores grandes
         self.hierarchy_tree.setStyleSheet("background-color: #333; color: #FFF; border: 1px solid #777;")  # Estilo visual
         self.hierarchy_tree.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)  # Barras de rolagem
         self.hierarchy_tree.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
@@ -86,44 +91,102 @@ class Hierarchy(QWidget):
         self.hierarchy_tree.setDefaultDropAction(Qt.MoveAction)  # Ação padrão ao soltar
         self.hierarchy_tree.setEditTriggers(QAbstractItemView.DoubleClicked)  # Edição ao dar duplo clique
         self.hierarchy_tree.setSelectionMode(QAbstractItemView.ExtendedSelection)  # Seleção estendida
-        
+
         # Botão para adicionar novos objetos de jogo
         self.add_button = QPushButton("Add GameObject")
         self.add_button.clicked.connect(self.show_add_game_object_dialog)  # Conecta o clique do botão a um método
-        self.root_item = None  # Definimos o root_item como None inicialmente
+        self.root_item = None  # Objeto raiz da cena, definido por set_root_item
+        # Versão do grafo da cena no último Play; fora do Play o modelo acompanha as edições
+        self.play_hierarchy_version = None
 
         # Adiciona a árvore e o botão ao layout
         self.layout.addWidget(self.hierarchy_tree)
         self.layout.addWidget(self.add_button)
         self.setLayout(self.layout)
 
-        # Conecta sinais de inserção e movimentação de linhas na árvore
-        self.hierarchy_tree.model().rowsInserted.connect(self.on_rows_inserted)
-        self.hierarchy_tree.model().rowsMoved.connect(self.on_rows_moved)
-
-    def dragEnterEvent(self, event):
-        event.accept()
-
-    def dragMoveEvent(self, event):
-        event.accept()
-    
+        # Pause/Stop (o Stop restaura os pais do snapshot) e edições feitas por
+        # outros painéis mudam o grafo sem passar pelo modelo: relê a árvore
+        play_state_changed = getattr(scene_view, 'play_state_changed', None)
+        if play_state_changed is not None:
+            play_state_changed.connect(self.on_play_state_changed)
+        hierarchy_edited = getattr(scene_view, 'hierarchy_edited', None)
+        if hierarchy_edited is not None:
+            hierarchy_edited.connect(self.refresh)
+
+    def on_play_state_changed(self, running):
+        # Só relê a árvore se o grafo mudou durante o Play (scripts ou o Stop)
+        version = getattr(self.scene_view, 'hierarchy_version', None)
+        if running:
+            self.play_hierarchy_version = version
+        elif version is None or version != self.play_hierarchy_version:
+            self.refresh()
 
-    
     def set_root_item(self, root_object):
         if self.root_item is None:
-            # Utiliza o root_object para definir o root_item e o adiciona na hierarquia
-            self.root_item = QTreeWidgetItem([root_object.name])
-            self.hierarchy_tree.addTopLevelItem(self.root_item)
-            self.root_item.setExpanded(True)
+            # O root_object é a única linha de topo; os demais objetos ficam abaixo dele
+            self.root_item = root_object
+            self.model.set_root(root_object)
+            self.hierarchy_tree.expand(self.model.index_of(root_object))
 
     def add_gameobject(self, game_object):
-        item = QTreeWidgetItem([game_object.name])
-        if self.root_item:
-            self.root_item.addChild(item)
+        self.model.add_objects([game_object])
+
+    def add_gameobjects(self, game_objects):
+        # Um único sinal de inserção por pai, em vez de um por objeto
+        self.model.add_objects(game_objects)
+
+    def remove_gameobjects(self, game_objects):
+        self.model.remove_objects(game_objects)
+        for game_object in game_objects:
+            self.scene_view.remove_game_object(game_object)
+
+    def refresh(self):
+        """Relê o grafo da cena (por exemplo, depois que scripts mudaram os pais durante o Play).
+
+        Os nós que estavam abertos e continuam na cena são abertos de novo.
+        """
+        expanded = self.expanded_objects()
+        self.model.refresh()
+        if self.root_item is not None:
+            self.hierarchy_tree.expand(self.model.index_of(self.root_item))
+        for obj in expanded:
+            index = self.fetch_index(obj)
+            if index.isValid():
+                self.hierarchy_tree.expand(index)
+
+    def expanded_objects(self):
+        # Pais antes dos filhos: cada nó só tem índice depois que o pai foi aberto
+        model = self.model
+        expanded = []
+        pending = [model.index(0, 0)]
+        for index in pending:
+            if not index.isValid() or not self.hierarchy_tree.isExpanded(index):
+                continue
+            obj = model.object_at(index)
+            if obj is not self.root_item:
+                expanded.append(obj)
+            pending.extend(model.index(row, 0, index) for row in range(model.rowCount(index)))
+        return expanded
+
+    def fetch_index(self, obj):
+        """Índice de obj, buscando as linhas do pai até a dele (já estavam na tela antes)."""
+        model = self.model
+        parent = getattr(obj, 'parent', None)
+        if parent is None or parent is self.root_item:
+            parent, siblings = self.root_item, model.top_level
         else:
-            self.hierarchy_tree.addTopLevelItem(item)
-
-
+            siblings = parent.children
+        parent_index = model.index_of(parent)
+        if obj not in siblings or not parent_index.isValid() or not self.hierarchy_tree.isExpanded(parent_index):
+            return QModelIndex()
+        index = model.index_of(obj)
+        while not index.isValid() and model.canFetchMore(parent_index):
+            model.fetchMore(parent_index)
+            index = model.index_of(obj)
+        return index
+
+    def selected_object(self):
+        return self.model.object_at(self.hierarchy_tree.currentIndex())
 
     def show_add_game_object_dialog(self):
         dialog = AddGameObjectDialog(self.scene_view, self)
@@ -132,8 +195,7 @@ class Hierarchy(QWidget):
             properties = selected_item["properties"]
             unique_name = self.generate_unique_name(selected_item["name"])
 
-            parent_item = self.hierarchy_tree.currentItem()
-            parent_object = self.parent().parent().object_dict.get(parent_item.text(0)) if parent_item else None
+            parent_object = self.selected_object()
 
             if selected_item["name"] == "Camera":
                 new_game_object = Camera(
@@ -159,107 +221,18 @@ class Hierarchy(QWidget):
 
             self.scene_view.add_game_object(new_game_object)
 
-            if parent_object:
+            # Sob o objeto raiz o novo objeto fica sem pai, no topo da cena
+            if parent_object is not None and parent_object is not self.root_item:
                 parent_object.add_child(new_game_object)
-                new_game_object.set_parent(parent_object)
 
-            self.parent().parent().add_to_hierarchy_and_dict(new_game_object)
+            self.parent().parent().add_to_hierarchy(new_game_object)
 
     def generate_unique_name(self, base_name):
-        existing_names = self.get_all_item_names()
-        if base_name not in existing_names:
-            return base_name
-
-        i = 1
-        new_name = f"{base_name} ({i})"
-        while new_name in existing_names:
-            i += 1
-            new_name = f"{base_name} ({i})"
-        return new_name
-
-    def get_all_item_names(self):
-        def get_item_names(item):
-            names = [item.text(0)]
-            for i in range(item.childCount()):
-                names.extend(get_item_names(item.child(i)))
-            return names
-
-        names = []
-        for i in range(self.hierarchy_tree.topLevelItemCount()):
-            names.extend(get_item_names(self.hierarchy_tree.topLevelItem(i)))
-        return names
-
-    def update_cam(self, item):
-        selected_item_text = item.text(0)
-        selected_object = self.parent().parent().object_dict.get(selected_item_text)
+        # O registro da cena já indexa os nomes; não é preciso percorrer a árvore
+        return self.scene_view.registry.unique_name(base_name)
+
+    def update_cam(self, selected_object):
         if selected_object:
             self.parent().parent().properties.set_selected_object(selected_object)
             if isinstance(selected_object, Camera):
                 self.scene_view.set_active_camera(selected_object)
-
-    def on_rows_inserted(self, parent_index, start, end):
-        parent_item = self.hierarchy_tree.itemFromIndex(parent_index)
-        for row in range(start, end + 1):
-            child_item = self.hierarchy_tree.itemFromIndex(parent_index.child(row, 0))
-            if child_item and parent_item:
-                child_object = self.parent().parent().object_dict.get(child_item.text(0))
-                parent_object = self.parent().parent().object_dict.get(parent_item.text(0))
-                if child_object and parent_object:
-                    if child_object.parent:
-                        child_object.parent.children.remove(child_object)
-                        child_object.set_parent(None)
-                    parent_object.add_child(child_object)
-                    child_object.set_parent(parent_object)
-
-    def on_rows_moved(self, source_parent, source_start, source_end, destination_parent, destination_row):
-        # Verifica se o destino não é o root_item ou se o destino não é válido.
-        if not destination_parent.isValid() or destination_parent != self.hierarchy_tree.indexFromItem(self.root_item):
-            return  # Cancela a ação se o destino não for o root_item ou não for válido
-        
-        source_parent_item = self.hierarchy_tree.itemFromIndex(source_parent)
-        destination_parent_item = self.hierarchy_tree.itemFromIndex(destination_parent)
-
-        for row in range(source_start, source_end + 1):
-            moved_item = self.hierarchy_tree.itemFromIndex(source_parent.child(row, 0))
-            if moved_item:
-                moved_object = self.parent().parent().object_dict.get(moved_item.text(0))
-
-                # Impede mover para fora do root_item
-                if destination_parent_item != self.root_item:  # Verificação direta
-                    return  # Cancela a ação se o item está sendo movido para fora do root_item
-
-                # Remove o objeto do seu pai anterior, se houver
-                if moved_object and moved_object.parent:
-                    moved_object.parent.remove_child(moved_object)
-                    moved_object.set_parent(None)
-
-                # Adiciona o objeto ao novo pai se for válido
-                if destination_parent_item == self.root_item:
-                    if moved_object:
-                        moved_object.set_parent(None)
-                else:
-                    destination_object = self.parent().parent().object_dict.get(destination_parent_item.text(0))
-                    if moved_object and destination_object:
-                        destination_object.add_child(moved_object)
-                        moved_object.set_parent(destination_object)
-
-        self.hierarchy_tree.expandAll()
-
-
-
-
-    def dropEvent(self, event):
-        super(Hierarchy, self).dropEvent(event)
-        
-        # Impede a movimentação para fora do nó raiz
-        current_item = self.hierarchy_tree.currentItem()
-        if current_item and current_item.parent() is None:
-            self.root_item.addChild(current_item)
-        
-        self.on_rows_moved(
-            self.hierarchy_tree.currentIndex().parent(),
-            self.hierarchy_tree.currentIndex().row(),
-            self.hierarchy_tree.currentIndex().row(),
-            self.hierarchy_tree.currentIndex().parent(),
-            self.hierarchy_tree.currentIndex().row()
-        )
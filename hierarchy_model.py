@@ -0,0 +1,352 @@
+from PyQt5.QtCore import QAbstractItemModel, QMimeData, QModelIndex, Qt
+
+MIME_TYPE = "application/x-gameobject-ids"
+
+
+class HierarchyModel(QAbstractItemModel):
+    """Tree model over the scene graph, for the Hierarchy panel's QTreeView.
+
+    The only top-level row is the scene's root object. Under it are the
+    objects added without a parent (top_level), and under every other
+    object are its `children`. Indexes carry the object's registry
+    `object_id`, so rows are found by id, never by their text, and
+    renaming or duplicate names do not matter.
+
+    Rows are created lazily: a node hands its children to the view
+    `fetch_batch` at a time as it is expanded and scrolled
+    (canFetchMore/fetchMore). A level with 20k objects therefore costs
+    rows for what is on screen, not for every object. add_objects,
+    remove_objects and reparent signal once per parent. Changes made to
+    the scene graph behind the model's back (a script re-parenting during
+    Play) are picked up by refresh().
+    """
+
+    def __init__(self, scene, fetch_batch=256, parent=None):
+        super().__init__(parent)
+        self.scene = scene
+        self.fetch_batch = fetch_batch
+        self.root = None
+        self.top_level = []
+        self._top_level_ids = set()
+        # Only for rows handed to the view. Node 0 is the view's invisible root.
+        self._objects = {}  # object_id -> object
+        self._shown = {}  # node -> children shown so far, a prefix of _source(node)
+        self._parents = {}  # object_id -> node it is shown under
+        self._rows = {}  # object_id -> row under that node
+
+    # Scene graph side
+
+    def set_root(self, root):
+        self.beginResetModel()
+        self.root = root
+        self._forget_all()
+        self.endResetModel()
+        if root is not None:
+            self._append(0, [root])
+
+    def refresh(self):
+        """Re-read the scene graph; open nodes collapse.
+
+        The top level becomes every scene object without a parent (or
+        parented to the root object), keeping the order it had for the
+        objects that were already there.
+        """
+        self.beginResetModel()
+        root = self.root
+        members = self.scene.scene_objects
+        member_ids = {id(obj) for obj in members}
+        top_level = [obj for obj in self.top_level
+                     if id(obj) in member_ids and getattr(obj, 'parent', None) in (None, root)]
+        top_level_ids = {id(obj) for obj in top_level}
+        top_level.extend(obj for obj in members
+                         if id(obj) not in top_level_ids and getattr(obj, 'parent', None) in (None, root))
+        self.top_level = top_level
+        self._top_level_ids = {id(obj) for obj in top_level}
+        self._forget_all()
+        self.endResetModel()
+        if root is not None:
+            self._append(0, [root])
+
+    def add_objects(self, objects):
+        """Show objects that were just added to the scene.
+
+        Objects without a parent (or parented to the root object) go to the
+        top level; the others are already in their parent's children.
+        """
+        added = {}
+        for obj in objects:
+            parent = getattr(obj, 'parent', None)
+            if parent is None or parent is self.root:
+                if id(obj) in self._top_level_ids:
+                    continue
+                self._top_level_ids.add(id(obj))
+                self.top_level.append(obj)
+                parent = self.root
+            if parent is not None:
+                added[parent] = added.get(parent, 0) + 1
+        for node, count in added.items():
+            self._show_appended(node, count)
+
+    def remove_objects(self, objects):
+        """Stop showing objects (and their subtrees)."""
+        self._hide(objects)
+        removed = {id(obj) for obj in objects} & self._top_level_ids
+        if removed:
+            self._top_level_ids -= removed
+            self.top_level = [obj for obj in self.top_level if id(obj) not in removed]
+
+    def reparent(self, objects, new_parent=None):
+        """Move objects under `new_parent` (None: the top level), in the scene and the tree.
+
+        Objects already there stay put, and so do the root and objects that
+        would become their own ancestor.
+        """
+        root = self.root
+        if new_parent is root:
+            new_parent = None
+        node = new_parent if new_parent is not None else root
+        moving = []
+        for obj in dict.fromkeys(objects):
+            if obj is root or obj is new_parent:
+                continue
+            if new_parent is None:
+                if id(obj) in self._top_level_ids:
+                    continue
+            elif getattr(obj, 'parent', None) is new_parent or self._is_ancestor(obj, new_parent):
+                continue
+            moving.append(obj)
+        if not moving:
+            return
+        # Whether the destination shows all its children, before they change.
+        caught_up = node is not None and self._caught_up(node)
+        self._hide(moving)
+        for obj in moving:
+            if id(obj) in self._top_level_ids:
+                self._top_level_ids.discard(id(obj))
+                self.top_level.remove(obj)
+            # Detach here rather than trusting every add_child to do it.
+            old_parent = getattr(obj, 'parent', None)
+            if old_parent is not None:
+                old_parent.remove_child(obj)
+            if new_parent is not None:
+                new_parent.add_child(obj)
+                continue
+            self._top_level_ids.add(id(obj))
+            self.top_level.append(obj)
+        if caught_up:
+            self._show_appended(node, len(moving), caught_up=True)
+
+    # Qt model interface
+
+    def index(self, row, column, parent=QModelIndex()):
+        shown = self._shown.get(self._node(parent))
+        if column != 0 or shown is None or not 0 <= row < len(shown):
+            return QModelIndex()
+        return self.createIndex(row, 0, shown[row].object_id)
+
+    def parent(self, index=None):
+        if index is None:
+            # QObject.parent(), which this method hides.
+            return super().parent()
+        if not index.isValid():
+            return QModelIndex()
+        return self._index_of(self._parents.get(index.internalId(), 0))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self._shown.get(self._node(parent), ()))
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        return bool(self._source(self._node(parent)))
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        return len(self._shown.get(node, ())) < len(self._source(node))
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        start = len(self._shown.get(node, ()))
+        batch = list(self._source(node)[start:start + self.fetch_batch])
+        if batch:
+            self._append(node, batch)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            obj = self.object_at(index)
+            if obj is not None:
+                return obj.name
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        obj = self.object_at(index)
+        if obj is None or role != Qt.EditRole or not value or value == obj.name:
+            return False
+        # The name setter keeps the registry (get_gameobject) up to date.
+        obj.name = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        obj = self.object_at(index)
+        if obj is None:
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDropEnabled
+        if obj is not self.root:
+            flags |= Qt.ItemIsEditable | Qt.ItemIsDragEnabled
+        return flags
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def mimeTypes(self):
+        return [MIME_TYPE]
+
+    def mimeData(self, indexes):
+        object_ids = dict.fromkeys(index.internalId() for index in indexes if index.isValid())
+        mime = QMimeData()
+        mime.setData(MIME_TYPE, ",".join(map(str, object_ids)).encode())
+        return mime
+
+    def canDropMimeData(self, data, action, row, column, parent):
+        # Nothing goes beside the root object, only under it.
+        return parent.isValid() and data.hasFormat(MIME_TYPE)
+
+    def dropMimeData(self, data, action, row, column, parent):
+        if action == Qt.IgnoreAction:
+            return True
+        target = self.object_at(parent)
+        if target is None or not data.hasFormat(MIME_TYPE):
+            return False
+        object_ids = bytes(data.data(MIME_TYPE)).decode().split(",")
+        objects = [self._objects[int(object_id)] for object_id in object_ids if object_id and int(object_id) in self._objects]
+        self.reparent(objects, target)
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        # After a move the view asks to remove the dragged rows from where
+        # they were; dropMimeData has already moved them.
+        return False
+
+    # Lookups
+
+    def object_at(self, index):
+        if not index.isValid():
+            return None
+        return self._objects.get(index.internalId())
+
+    def index_of(self, obj):
+        """Index of `obj`, or an invalid index while its row has not been fetched."""
+        object_id = getattr(obj, 'object_id', None)
+        if object_id is None or self._objects.get(object_id) is not obj:
+            return QModelIndex()
+        return self._index_of(object_id)
+
+    # Internals
+
+    def _node(self, index):
+        return index.internalId() if index.isValid() else 0
+
+    def _index_of(self, node):
+        if node == 0:
+            return QModelIndex()
+        return self.createIndex(self._rows[node], 0, node)
+
+    def _source(self, node):
+        """Every child of `node` in the scene graph, fetched or not."""
+        if node == 0:
+            return [self.root] if self.root is not None else []
+        obj = self._objects.get(node)
+        if obj is None:
+            return ()
+        if obj is self.root:
+            return self.top_level
+        return getattr(obj, 'children', ())
+
+    def _object_id(self, obj):
+        if getattr(obj, 'object_id', None) is None:
+            # Objects outside the scene (the root) still need an id.
+            self.scene.registry.add(obj)
+        return obj.object_id
+
+    @staticmethod
+    def _is_ancestor(obj, node):
+        while node is not None:
+            if node is obj:
+                return True
+            node = getattr(node, 'parent', None)
+        return False
+
+    def _caught_up(self, obj):
+        node = getattr(obj, 'object_id', None)
+        if self._objects.get(node) is not obj:
+            return False
+        return len(self._shown.get(node, ())) >= len(self._source(node))
+
+    def _show_appended(self, obj, count, caught_up=None):
+        """Show rows for `count` children just appended to `obj`, if its node showed all the rest."""
+        node = getattr(obj, 'object_id', None)
+        if node is None or self._objects.get(node) is not obj:
+            # Its row is not in the view yet; it is fetched with the right children.
+            return
+        shown = self._shown.get(node, ())
+        source = self._source(node)
+        if caught_up is None:
+            caught_up = len(shown) >= len(source) - count
+        if not caught_up or len(shown) >= len(source):
+            return
+        self._append(node, list(source[len(shown):len(shown) + self.fetch_batch]))
+
+    def _append(self, node, objects):
+        shown = self._shown.setdefault(node, [])
+        first = len(shown)
+        self.beginInsertRows(self._index_of(node), first, first + len(objects) - 1)
+        for row, obj in enumerate(objects, first):
+            object_id = self._object_id(obj)
+            self._objects[object_id] = obj
+            self._parents[object_id] = node
+            self._rows[object_id] = row
+        shown.extend(objects)
+        self.endInsertRows()
+
+    def _hide(self, objects):
+        """Remove the rows of `objects`, one signal per run of adjacent rows."""
+        rows_by_node = {}
+        for obj in objects:
+            object_id = getattr(obj, 'object_id', None)
+            if object_id is not None and self._objects.get(object_id) is obj and obj is not self.root:
+                rows_by_node.setdefault(self._parents[object_id], []).append(self._rows[object_id])
+        for node, rows in rows_by_node.items():
+            rows.sort(reverse=True)
+            shown = self._shown[node]
+            parent_index = self._index_of(node)
+            i = 0
+            while i < len(rows):
+                last = first = rows[i]
+                i += 1
+                while i < len(rows) and rows[i] == first - 1:
+                    first = rows[i]
+                    i += 1
+                self.beginRemoveRows(parent_index, first, last)
+                for obj in shown[first:last + 1]:
+                    self._forget(obj.object_id)
+                del shown[first:last + 1]
+                for row in range(first, len(shown)):
+                    self._rows[shown[row].object_id] = row
+                self.endRemoveRows()
+
+    def _forget(self, node):
+        del self._objects[node]
+        del self._parents[node]
+        del self._rows[node]
+        for child in self._shown.pop(node, ()):
+            self._forget(child.object_id)
+
+    def _forget_all(self):
+        self._objects = {}
+        self._shown = {0: []}
+        self._parents = {}
+        self._rows = {}
@@ -1,12 +1,15 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QHBoxLayout, QLineEdit, QPushButton, QFileDialog, QColorDialog)
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QPixmap, QColor
+from edit_transaction import EditTransaction, ScrubLabel
 
 class ImagePanel(QWidget):
     def __init__(self, scene_view):
         super().__init__()
         self.selected_object = None
         self.scene_view = scene_view
+        # Junta as edições de cada volta do loop de eventos numa só aplicação
+        self.edits = EditTransaction(scene_view)
 
         layout = QVBoxLayout()
         self.setLayout(layout)
@@ -28,16 +31,16 @@ class ImagePanel(QWidget):
         layout.addLayout(image_layout)
 
         # Campos de Offset e Tiling
-        self.offset_x_edit = self.create_labeled_field("Offset X", layout)
+        self.offset_x_edit = self.create_labeled_field("Offset X", layout, scrub_step=0.01)
         self.offset_x_edit.textChanged.connect(self.update_offset_x)
 
-        self.offset_y_edit = self.create_labeled_field("Offset Y", layout)
+        self.offset_y_edit = self.create_labeled_field("Offset Y", layout, scrub_step=0.01)
         self.offset_y_edit.textChanged.connect(self.update_offset_y)
 
-        self.tiling_x_edit = self.create_labeled_field("Tiling X", layout)
+        self.tiling_x_edit = self.create_labeled_field("Tiling X", layout, scrub_step=0.01)
         self.tiling_x_edit.textChanged.connect(self.update_tiling_x)
 
-        self.tiling_y_edit = self.create_labeled_field("Tiling Y", layout)
+        self.tiling_y_edit = self.create_labeled_field("Tiling Y", layout, scrub_step=0.01)
         self.tiling_y_edit.textChanged.connect(self.update_tiling_y)
 
         # Botão de Cor de Sobreposição
@@ -62,16 +65,20 @@ class ImagePanel(QWidget):
         self.layer_edit = self.create_labeled_field("Camada", layout)
         self.layer_edit.textChanged.connect(self.update_layer)
 
-    def create_labeled_field(self, label_text, layout):
+    def create_labeled_field(self, label_text, layout, scrub_step=None):
         container = QWidget()
         container_layout = QHBoxLayout()
         container.setLayout(container_layout)
 
-        label = QLabel(label_text)
-        label.setAlignment(Qt.AlignCenter)
-
         line_edit = QLineEdit()
         line_edit.setStyleSheet("border: 1px solid black; border-radius: 5px; padding: 2px;")
+
+        # Com scrub_step, arrastar o rótulo para os lados altera o valor
+        if scrub_step is None:
+            label = QLabel(label_text)
+        else:
+            label = ScrubLabel(label_text, line_edit, self.edits, scrub_step)
+        label.setAlignment(Qt.AlignCenter)
         
         container_layout.addWidget(label)
         container_layout.addWidget(line_edit)
@@ -93,12 +100,18 @@ class ImagePanel(QWidget):
             else:
                 self.image_display.clear()
                 
-            self.offset_x_edit.setText(str(getattr(self.selected_object, 'offset_x', '')))
-            self.offset_y_edit.setText(str(getattr(self.selected_object, 'offset_y', '')))
-            self.tiling_x_edit.setText(str(getattr(self.selected_object, 'tiling_x', '')))
-            self.tiling_y_edit.setText(str(getattr(self.selected_object, 'tiling_y', '')))
-            self.overlay_alpha_edit.setText(str(getattr(self.selected_object, 'overlay_color', QColor(0, 0, 0, 255)).alpha()))
-            self.layer_edit.setText(str(getattr(self.selected_object, 'layer', '')))
+            # Sem textChanged: mostrar os valores não é uma edição
+            for field, value in (
+                (self.offset_x_edit, getattr(self.selected_object, 'offset_x', '')),
+                (self.offset_y_edit, getattr(self.selected_object, 'offset_y', '')),
+                (self.tiling_x_edit, getattr(self.selected_object, 'tiling_x', '')),
+                (self.tiling_y_edit, getattr(self.selected_object, 'tiling_y', '')),
+                (self.overlay_alpha_edit, getattr(self.selected_object, 'overlay_color', QColor(0, 0, 0, 255)).alpha()),
+                (self.layer_edit, getattr(self.selected_object, 'layer', '')),
+            ):
+                field.blockSignals(True)
+                field.setText(str(value))
+                field.blockSignals(False)
 
             if hasattr(self.selected_object, 'overlay_color'):
                 color = self.selected_object.overlay_color
@@ -121,11 +134,8 @@ class ImagePanel(QWidget):
             # Open the color dialog
             color = QColorDialog.getColor()
             if color.isValid():
-                self.selected_object.overlay_color = color
+                self.edits.set(self.selected_object, 'overlay_color', color)
                 self.overlay_color_button.setStyleSheet(f"background-color: {color.name()};")
-                if hasattr(self.selected_object, 'update_image'):
-                    self.selected_object.update_image()
-                self.notify_change()
 
             # Restore the always-on-top hint
             self.window().setWindowFlags(self.window().windowFlags() | Qt.WindowStaysOnTopHint)
@@ -134,40 +144,28 @@ class ImagePanel(QWidget):
     def update_offset_x(self, value):
         if self.selected_object:
             try:
-                self.selected_object.offset_x = float(value)
-                if hasattr(self.selected_object, 'update_image'):
-                    self.selected_object.update_image()
-                self.notify_change()
+                self.edits.set(self.selected_object, 'offset_x', float(value))
             except ValueError:
                 pass
 
     def update_offset_y(self, value):
         if self.selected_object:
             try:
-                self.selected_object.offset_y = float(value)
-                if hasattr(self.selected_object, 'update_image'):
-                    self.selected_object.update_image()
-                self.notify_change()
+                self.edits.set(self.selected_object, 'offset_y', float(value))
             except ValueError:
                 pass
 
     def update_tiling_x(self, value):
         if self.selected_object:
             try:
-                self.selected_object.tiling_x = float(value)
-                if hasattr(self.selected_object, 'update_image'):
-                    self.selected_object.update_image()
-                self.notify_change()
+                self.edits.set(self.selected_object, 'tiling_x', float(value))
             except ValueError:
                 pass
 
     def update_tiling_y(self, value):
         if self.selected_object:
             try:
-                self.selected_object.tiling_y = float(value)
-                if hasattr(self.selected_object, 'update_image'):
-                    self.selected_object.update_image()
-                self.notify_change()
+                self.edits.set(self.selected_object, 'tiling_y', float(value))
             except ValueError:
                 pass
 
@@ -176,27 +174,16 @@ class ImagePanel(QWidget):
             try:
                 alpha = int(value)
                 if 0 <= alpha <= 255:
-                    color = self.selected_object.overlay_color
+                    # Cópia: o QColor atual pode ser o mesmo objeto de original_overlay_color
+                    color = QColor(self.edits.get(self.selected_object, 'overlay_color'))
                     color.setAlpha(alpha)
-                    self.selected_object.overlay_color = color
-                    if hasattr(self.selected_object, 'update_image'):
-                        self.selected_object.update_image()
-                    self.notify_change()
+                    self.edits.set(self.selected_object, 'overlay_color', color)
             except ValueError:
                 pass
 
     def update_layer(self, value):
         if self.selected_object:
             try:
-                layer = int(value)
-                self.selected_object.layer = layer
-                self.notify_change()
-                self.scene_view.update()
+                self.edits.set(self.selected_object, 'layer', int(value))
             except ValueError:
                 pass
-
-    def notify_change(self):
-        self.scene_view.repaint()
-        if not self.scene_view.running:
-            if hasattr(self.selected_object, 'store_original_state'):
-                self.selected_object.store_original_state()
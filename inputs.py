@@ -1,10 +1,198 @@
 # inputs.py
+from collections import deque
+
+
+class InputSnapshot:
+    """Keyboard and mouse state for one simulation tick.
+
+    `pressed` and `released` hold the edges seen since the previous tick. A
+    key tapped between two ticks is in both, even though it is no longer in
+    `down`, so short taps are never lost.
+    """
+
+    __slots__ = (
+        "down", "pressed", "released",
+        "buttons", "buttons_pressed", "buttons_released",
+        "mouse_screen", "mouse_world", "wheel",
+    )
+
+    def __init__(self, down=frozenset(), buttons=frozenset(), mouse_screen=(0, 0), mouse_world=(0, 0)):
+        self.down = down
+        self.pressed = frozenset()
+        self.released = frozenset()
+        self.buttons = buttons
+        self.buttons_pressed = frozenset()
+        self.buttons_released = frozenset()
+        self.mouse_screen = mouse_screen
+        self.mouse_world = mouse_world
+        self.wheel = 0
+
 
 class InputHandler:
-    def __init__(self):
-        pass
+    """Collects Qt input events and turns them into one snapshot per tick.
+
+    Event handlers only append to a deque (append and popleft are atomic, so
+    no lock is needed) or overwrite the last mouse position; they never run
+    simulation work. SceneCore.step calls begin_tick() before the scripts,
+    which drains the queue into a fresh InputSnapshot. Scripts read it
+    through this object:
+
+        inputs = scene_view.input
+        if inputs.is_down(Qt.Key_Left): ...
+        if inputs.pressed_this_tick(Qt.Key_Space): ...
+        x, y = inputs.mouse_position          # world space, through the camera
+
+    Keys and buttons are the ints Qt reports (Qt.Key_*, Qt.LeftButton...).
+    Nothing is queued while the scene is not running: no tick would read
+    it, and it would replay as edges on the first tick after Play resumes.
+    """
+
+    def __init__(self, scene=None):
+        self.scene = scene
+        self.events = deque()
+        self._held = set()
+        self._buttons = set()
+        self._mouse_screen = (0, 0)
+        self.state = InputSnapshot()
+
+    # Feeding events (GUI thread or tests)
+
+    def key_press(self, event):
+        # Auto-repeat is the OS re-sending a held key; the key is already down.
+        if not event.isAutoRepeat():
+            self._queue("key", event.key(), True)
+
+    def key_release(self, event):
+        if not event.isAutoRepeat():
+            self._queue("key", event.key(), False)
+
+    def mouse_move(self, event):
+        position = event.pos()
+        self._mouse_screen = (position.x(), position.y())
+
+    def mouse_press(self, event):
+        self.mouse_move(event)
+        self._queue("button", int(event.button()), True)
+
+    def mouse_release(self, event):
+        self.mouse_move(event)
+        self._queue("button", int(event.button()), False)
+
+    def wheel(self, event):
+        self._queue("wheel", event.angleDelta().y(), None)
+
+    def press_key(self, key):
+        self._queue("key", key, True)
+
+    def release_key(self, key):
+        self._queue("key", key, False)
+
+    def move_mouse(self, x, y):
+        self._mouse_screen = (x, y)
+
+    def release_all(self):
+        """Release everything held, e.g. when the view loses focus and will miss the releases."""
+        self._queue("release_all", None, None)
+
+    def _queue(self, kind, code, down):
+        if getattr(self.scene, 'running', True):
+            self.events.append((kind, code, down))
+
+    def reset(self):
+        """Forget queued events and everything held (Start, Pause and Stop)."""
+        self.events.clear()
+        self._held.clear()
+        self._buttons.clear()
+        self.state = InputSnapshot(mouse_screen=self._mouse_screen, mouse_world=self.state.mouse_world)
+
+    # Per tick
+
+    def begin_tick(self):
+        """Apply the queued events and publish the snapshot for this tick."""
+        held = self._held
+        buttons = self._buttons
+        pressed = set()
+        released = set()
+        buttons_pressed = set()
+        buttons_released = set()
+        wheel = 0
+        events = self.events
+        while events:
+            kind, code, down = events.popleft()
+            if kind == "key":
+                if down:
+                    if code not in held:
+                        held.add(code)
+                        pressed.add(code)
+                elif code in held:
+                    held.discard(code)
+                    released.add(code)
+            elif kind == "button":
+                if down:
+                    if code not in buttons:
+                        buttons.add(code)
+                        buttons_pressed.add(code)
+                elif code in buttons:
+                    buttons.discard(code)
+                    buttons_released.add(code)
+            elif kind == "wheel":
+                wheel += code
+            else:
+                released.update(held)
+                buttons_released.update(buttons)
+                held.clear()
+                buttons.clear()
+
+        state = InputSnapshot(frozenset(held), frozenset(buttons), self._mouse_screen, self.screen_to_world(*self._mouse_screen))
+        if pressed:
+            state.pressed = frozenset(pressed)
+        if released:
+            state.released = frozenset(released)
+        if buttons_pressed:
+            state.buttons_pressed = frozenset(buttons_pressed)
+        if buttons_released:
+            state.buttons_released = frozenset(buttons_released)
+        state.wheel = wheel
+        self.state = state
+        return state
+
+    def screen_to_world(self, x, y):
+        scene = self.scene
+        camera = getattr(scene, 'active_camera', None)
+        if camera is None:
+            # Without a camera SceneView maps one world unit to one pixel.
+            return (x, y)
+        return camera.screen_to_world(x, y, scene.width(), scene.height())
+
+    # Queries for scripts, all about the current tick's snapshot
+
+    def is_down(self, key):
+        return key in self.state.down
+
+    def pressed_this_tick(self, key):
+        return key in self.state.pressed
+
+    def released_this_tick(self, key):
+        return key in self.state.released
+
+    def mouse_down(self, button):
+        return button in self.state.buttons
+
+    def mouse_pressed_this_tick(self, button):
+        return button in self.state.buttons_pressed
+
+    def mouse_released_this_tick(self, button):
+        return button in self.state.buttons_released
+
+    @property
+    def mouse_position(self):
+        """Mouse position in world space, as of the start of this tick."""
+        return self.state.mouse_world
+
+    @property
+    def mouse_screen_position(self):
+        return self.state.mouse_screen
 
-    def handle_pyqt_input(self, qt_event):
-        key = qt_event.key()
-        key_name = chr(key) if key < 256 else str(key)
-        print(f"PyQt5 key pressed: {key_name}")
+    @property
+    def wheel_delta(self):
+        return self.state.wheel
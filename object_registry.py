@@ -0,0 +1,142 @@
+import itertools
+
+
+class ObjectHandle:
+    """Cached reference to a scene object, looked up by name.
+
+    get() returns the cached object while it is still registered under that
+    name and only repeats the (dictionary) lookup after it was removed or
+    renamed, so scripts can create handles once and call get() every frame.
+    """
+
+    __slots__ = ("registry", "name", "_object")
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+        self._object = None
+
+    def get(self):
+        obj = self._object
+        if obj is None or obj.name != self.name or not self.registry.contains(obj):
+            obj = self._object = self.registry.get(self.name)
+        return obj
+
+    def __bool__(self):
+        return self.get() is not None
+
+
+class ObjectRegistry:
+    """The scene's one index of its objects: by id, name, tag and type.
+
+    Every object gets a unique `object_id` the first time it is registered
+    and keeps it if it is removed and added back. Several objects may share
+    a name; get() returns the first one added. GameObject and Camera report
+    name and tag changes through rename() and retag().
+    """
+
+    def __init__(self):
+        self.by_id = {}
+        self.by_name = {}
+        self.by_tag = {}
+        self.by_type = {}
+        self._next_id = itertools.count(1)
+        # base name -> lowest suffix that may still be free
+        self._name_suffixes = {}
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def contains(self, obj):
+        return self.by_id.get(getattr(obj, 'object_id', None)) is obj
+
+    def add(self, obj):
+        if self.contains(obj):
+            return
+        if getattr(obj, 'object_id', None) is None or obj.object_id in self.by_id:
+            obj.object_id = next(self._next_id)
+        self.by_id[obj.object_id] = obj
+        self.by_name.setdefault(obj.name, []).append(obj)
+        self.by_tag.setdefault(getattr(obj, 'tag', None), {})[obj] = None
+        self.by_type.setdefault(type(obj), {})[obj] = None
+
+    def remove(self, obj):
+        if not self.contains(obj):
+            return
+        del self.by_id[obj.object_id]
+        self._unlink(self.by_name, obj.name, obj)
+        self._name_freed(obj.name)
+        self._unlink(self.by_tag, getattr(obj, 'tag', None), obj)
+        self._unlink(self.by_type, type(obj), obj)
+
+    def rename(self, obj, old_name, new_name):
+        if self.contains(obj) and old_name != new_name:
+            self._unlink(self.by_name, old_name, obj)
+            self._name_freed(old_name)
+            self.by_name.setdefault(new_name, []).append(obj)
+
+    def retag(self, obj, old_tag, new_tag):
+        if self.contains(obj) and old_tag != new_tag:
+            self._unlink(self.by_tag, old_tag, obj)
+            self.by_tag.setdefault(new_tag, {})[obj] = None
+
+    def clear(self):
+        self.by_id.clear()
+        self.by_name.clear()
+        self.by_tag.clear()
+        self.by_type.clear()
+        self._name_suffixes.clear()
+
+    def unique_name(self, base_name):
+        """`base_name` if no object uses it, else the first free "base_name (i)".
+
+        Remembers where the search for each base name stopped, so naming
+        thousands of objects "GameObject" does not rescan the taken suffixes
+        every time.
+        """
+        if base_name not in self.by_name:
+            return base_name
+        i = self._name_suffixes.get(base_name, 1)
+        name = f"{base_name} ({i})"
+        while name in self.by_name:
+            i += 1
+            name = f"{base_name} ({i})"
+        self._name_suffixes[base_name] = i
+        return name
+
+    def _name_freed(self, name):
+        # A suffix below the remembered one became free: search from there.
+        if name in self.by_name or not isinstance(name, str) or not name.endswith(")"):
+            return
+        base_name, _, suffix = name[:-1].rpartition(" (")
+        if suffix.isdigit() and int(suffix) < self._name_suffixes.get(base_name, 0):
+            self._name_suffixes[base_name] = int(suffix)
+
+    def get(self, name):
+        objects = self.by_name.get(name)
+        return objects[0] if objects else None
+
+    def get_by_id(self, object_id):
+        return self.by_id.get(object_id)
+
+    def find_by_tag(self, tag):
+        return list(self.by_tag.get(tag, ()))
+
+    def find_all(self, cls):
+        """Every registered instance of `cls` or of its subclasses."""
+        return [obj for obj_type, objects in self.by_type.items() if issubclass(obj_type, cls) for obj in objects]
+
+    def handle(self, name):
+        return ObjectHandle(self, name)
+
+    @staticmethod
+    def _unlink(index, key, obj):
+        objects = index.get(key)
+        if objects is None:
+            return
+        if isinstance(objects, list):
+            objects.remove(obj)
+        else:
+            del objects[obj]
+        if not objects:
+            del index[key]
@@ -0,0 +1,196 @@
+"""Render SceneView frames without a window.
+
+Usage from code (inside a QApplication, any QPA platform):
+
+    renderer = OffscreenRenderer(scene_view, 800, 600)
+    frame = renderer.render()   # (height, width, 4) uint8, top row first
+
+Usage from a shell, e.g. on a CI box without display or GPU:
+
+    python -m offscreen --sprites 5000 --frames 200 --save frame.png
+
+The GL context comes from Qt (QOpenGLContext on a QOffscreenSurface) unless
+PyOpenGL runs on its EGL platform (PYOPENGL_PLATFORM=egl), in which case a
+surfaceless EGL context is used; with Mesa that runs on llvmpipe. Either way
+the scene is drawn into a framebuffer object and read back with glReadPixels.
+"""
+import argparse
+import ctypes
+import os
+import sys
+import time
+
+if __name__ == "__main__":
+    # Must be set before PyQt5 and PyOpenGL are imported.
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+    os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+
+import numpy as np
+from OpenGL.GL import *
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QOpenGLContext, QOffscreenSurface
+
+
+class QtContext:
+    def __init__(self):
+        self.context = QOpenGLContext()
+        if not self.context.create():
+            raise RuntimeError("Could not create an OpenGL context")
+        self.surface = QOffscreenSurface()
+        self.surface.setFormat(self.context.format())
+        self.surface.create()
+
+    def make_current(self):
+        if not self.context.makeCurrent(self.surface):
+            raise RuntimeError("Could not make the offscreen OpenGL context current")
+
+    def destroy(self):
+        self.context.doneCurrent()
+
+
+class EglContext:
+    def __init__(self):
+        from OpenGL import EGL
+
+        self.egl = EGL
+        self.display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+        if not EGL.eglInitialize(self.display, None, None):
+            raise RuntimeError("Could not initialize EGL; try EGL_PLATFORM=surfaceless")
+        attributes = (EGL.EGLint * 5)(
+            EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+            EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+            EGL.EGL_NONE,
+        )
+        config = EGL.EGLConfig()
+        count = EGL.EGLint()
+        if not EGL.eglChooseConfig(self.display, attributes, ctypes.pointer(config), 1, ctypes.pointer(count)) or not count.value:
+            raise RuntimeError("No EGL config supports desktop OpenGL")
+        EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+        self.context = EGL.eglCreateContext(self.display, config, EGL.EGL_NO_CONTEXT, None)
+        if not self.context:
+            raise RuntimeError("Could not create an EGL context")
+
+    def make_current(self):
+        EGL = self.egl
+        if not EGL.eglMakeCurrent(self.display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, self.context):
+            raise RuntimeError("Could not make the EGL context current")
+
+    def destroy(self):
+        EGL = self.egl
+        EGL.eglMakeCurrent(self.display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, EGL.EGL_NO_CONTEXT)
+        EGL.eglDestroyContext(self.display, self.context)
+
+
+class OffscreenRenderer:
+    """Drives a SceneView's initializeGL/resizeGL/paintGL into an FBO."""
+
+    def __init__(self, scene_view, width=800, height=600):
+        self.scene_view = scene_view
+        self.width = width
+        self.height = height
+
+        if os.environ.get("PYOPENGL_PLATFORM") == "egl":
+            self.context = EglContext()
+        else:
+            self.context = QtContext()
+        self.context.make_current()
+
+        self.framebuffer = glGenFramebuffers(1)
+        glBindFramebuffer(GL_FRAMEBUFFER, self.framebuffer)
+        self.color_buffer, self.depth_buffer = glGenRenderbuffers(2)
+        glBindRenderbuffer(GL_RENDERBUFFER, self.color_buffer)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, width, height)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, self.color_buffer)
+        glBindRenderbuffer(GL_RENDERBUFFER, self.depth_buffer)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH24_STENCIL8, width, height)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_STENCIL_ATTACHMENT, GL_RENDERBUFFER, self.depth_buffer)
+        if glCheckFramebufferStatus(GL_FRAMEBUFFER) != GL_FRAMEBUFFER_COMPLETE:
+            raise RuntimeError("Offscreen framebuffer is incomplete")
+
+        # The widget is never shown; resizing it is enough for width()/height().
+        scene_view.resize(width, height)
+        scene_view.initializeGL()
+        scene_view.resizeGL(width, height)
+
+    def render(self):
+        """Paint one frame and return it as a (height, width, 4) uint8 array."""
+        self.context.make_current()
+        glBindFramebuffer(GL_FRAMEBUFFER, self.framebuffer)
+        self.scene_view.paintGL()
+        glFinish()
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+        data = glReadPixels(0, 0, self.width, self.height, GL_RGBA, GL_UNSIGNED_BYTE)
+        return np.frombuffer(data, dtype=np.uint8).reshape(self.height, self.width, 4)[::-1].copy()
+
+    def render_frames(self, count, step=None):
+        """Yield `count` frames, calling `step()` before each one if given."""
+        for _ in range(count):
+            if step is not None:
+                step()
+            yield self.render()
+
+    def close(self):
+        self.context.make_current()
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        glDeleteRenderbuffers(2, [self.color_buffer, self.depth_buffer])
+        glDeleteFramebuffers(1, [self.framebuffer])
+        self.context.destroy()
+
+
+def build_benchmark_scene(scene_view, sprites, width, height, image_path=None, seed=0):
+    from gameobject import GameObject
+
+    rng = np.random.default_rng(seed)
+    for i in range(sprites):
+        game_object = GameObject(
+            f"Sprite{i}",
+            position=(float(rng.uniform(0, width)), float(rng.uniform(0, height))),
+            size=(float(rng.uniform(8, 48)), float(rng.uniform(8, 48))),
+            color=tuple(int(c) for c in rng.integers(0, 256, 3)) + (255,),
+            rotation=float(rng.uniform(0, 360)),
+            scene_view=scene_view,
+            image_path=image_path,
+        )
+        game_object.layer = int(rng.integers(0, 4))
+        scene_view.add_game_object(game_object)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render SceneView frames offscreen.")
+    parser.add_argument("--sprites", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--width", type=int, default=800)
+    parser.add_argument("--height", type=int, default=600)
+    parser.add_argument("--image", help="Sprite image to use instead of solid colors")
+    parser.add_argument("--save", help="Write the last frame to this PNG file")
+    args = parser.parse_args(argv)
+
+    from PIL import Image
+    from scene_view import SceneView
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    scene_view = SceneView()
+    renderer = OffscreenRenderer(scene_view, args.width, args.height)
+    build_benchmark_scene(scene_view, args.sprites, args.width, args.height, args.image)
+
+    gl_renderer = glGetString(GL_RENDERER).decode()
+    times = []
+    frame = None
+    for _ in range(args.frames):
+        start = time.perf_counter()
+        frame = renderer.render()
+        times.append(time.perf_counter() - start)
+    renderer.close()
+
+    times_ms = np.array(times) * 1000
+    print(f"{gl_renderer}: {args.sprites} sprites, {args.frames} frames")
+    print(f"frame ms: mean {times_ms.mean():.2f}  p50 {np.percentile(times_ms, 50):.2f}  p95 {np.percentile(times_ms, 95):.2f}")
+    if args.save and frame is not None:
+        Image.fromarray(frame, "RGBA").save(args.save)
+        print(f"Saved {args.save}")
+    return app
+
+
+if __name__ == "__main__":
+    main()
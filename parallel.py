@@ -0,0 +1,183 @@
+"""Parallel stepping of TransformStore columns over a process pool.
+
+Scripts stay on the main thread: they are arbitrary Python objects that
+touch the scene. What can leave it is column work over the store's rows
+(velocity integration, particles, agents). ParallelStepper moves the
+store's columns into multiprocessing.shared_memory and, each tick, has the
+worker processes run kernels over slices of rows in place. Only the
+kernel reference, the row range and the shared-memory names travel to the
+workers; the columns themselves are never pickled.
+
+A kernel is a module-level function (workers import it by name):
+
+    def steer(columns, start, stop, dt):
+        target = columns["target"][start:stop]
+        ...
+        columns["moved"][start:stop] |= moving
+
+`columns` maps column names to the full shared arrays; a kernel only
+touches rows start:stop. Rows whose position, rotation or scale changed
+are flagged in the "moved" column so the scene re-indexes them.
+
+    stepper = scene.enable_parallel(workers=7)
+    scene.transform_store.add_column("target", (2,))
+    stepper.add_kernel(steer)
+"""
+import atexit
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+def integrate(columns, start, stop, dt):
+    """Default kernel: apply velocity and angular_velocity to rows start:stop."""
+    alive = columns["alive"][start:stop]
+    velocity = columns["velocity"][start:stop]
+    angular_velocity = columns["angular_velocity"][start:stop]
+    moving = alive & ((velocity != 0).any(axis=1) | (angular_velocity != 0))
+    if moving.any():
+        position = columns["position"][start:stop]
+        rotation = columns["rotation"][start:stop]
+        position[moving] += velocity[moving] * dt
+        rotation[moving] += angular_velocity[moving] * dt
+        columns["moved"][start:stop] |= moving
+
+
+class SharedArrays:
+    """Allocator handing out NumPy arrays backed by shared memory blocks.
+
+    Re-allocating a name (the store grew) retires the previous block: its
+    name is unlinked at once, its mapping is closed by release() once the
+    store has copied the rows over and dropped the old array. layout()
+    describes the current blocks for workers to attach to.
+    """
+
+    def __init__(self):
+        self.prefix = f"ge_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+        self.blocks = {}
+        self.retired = []
+        self.version = 0
+
+    def __call__(self, name, shape, dtype):
+        dtype = np.dtype(dtype)
+        size = max(1, int(np.prod(shape)) * dtype.itemsize)
+        self.version += 1
+        block = shared_memory.SharedMemory(name=f"{self.prefix}_{name}_{self.version}", create=True, size=size)
+        array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        self.retire(name)
+        self.blocks[name] = (block, array)
+        return array
+
+    def layout(self):
+        return tuple(
+            (name, block.name, array.shape, array.dtype.str)
+            for name, (block, array) in self.blocks.items()
+        )
+
+    def retire(self, name):
+        entry = self.blocks.pop(name, None)
+        if entry is not None:
+            entry[0].unlink()
+            self.retired.append(entry[0])
+
+    def release(self):
+        """Close retired blocks nothing maps any more."""
+        still_used = []
+        for block in self.retired:
+            try:
+                block.close()
+            except BufferError:
+                still_used.append(block)
+        self.retired = still_used
+
+    def close(self):
+        for name in list(self.blocks):
+            self.retire(name)
+        self.release()
+
+
+# Worker side: column name -> (block name, SharedMemory, array), kept between tasks.
+_attached = {}
+
+
+def _columns(layout):
+    columns = {}
+    for name, block_name, shape, dtype in layout:
+        entry = _attached.get(name)
+        if entry is None or entry[0] != block_name:
+            if entry is not None:
+                entry[1].close()
+            block = shared_memory.SharedMemory(name=block_name)
+            entry = _attached[name] = (block_name, block, np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf))
+        columns[name] = entry[2]
+    return columns
+
+
+def _run(kernel, layout, start, stop, dt):
+    kernel(_columns(layout), start, stop, dt)
+
+
+class ParallelStepper:
+    """Runs kernels over a TransformStore's rows on a pool of processes.
+
+    Stores smaller than `inline_below` rows are stepped in this process:
+    below that, handing work to the pool costs more than it saves.
+    """
+
+    def __init__(self, store, workers=None, inline_below=4096):
+        self.store = store
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.inline_below = inline_below
+        self.kernels = [integrate]
+        self.allocator = SharedArrays()
+        store.add_column("moved", (), bool, False)
+        store.set_allocator(self.allocator)
+        # spawn, not fork: the parent may be a Qt application with a GL context.
+        self.pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        atexit.register(self.close)
+
+    def add_kernel(self, kernel):
+        """Run `kernel(columns, start, stop, dt)` every tick, after the ones added before."""
+        self.kernels.append(kernel)
+
+    def step(self, dt):
+        """Run every kernel over all rows and return the rows that moved."""
+        store = self.store
+        count = store.count
+        if not count:
+            return np.empty(0, dtype=np.int64)
+        self.allocator.release()
+        if count < self.inline_below:
+            columns = {name: getattr(store, name) for name in self.allocator.blocks}
+            for kernel in self.kernels:
+                kernel(columns, 0, count, dt)
+        else:
+            layout = self.allocator.layout()
+            chunk = -(-count // self.workers)
+            for kernel in self.kernels:
+                # Kernels run one after another; each sees the previous one's results.
+                futures = [
+                    self.pool.submit(_run, kernel, layout, start, min(start + chunk, count), dt)
+                    for start in range(0, count, chunk)
+                ]
+                for future in futures:
+                    future.result()
+        moved = store.moved[:count]
+        rows = np.flatnonzero(moved)
+        moved[rows] = False
+        if len(rows):
+            store.world_dirty = True
+        return rows
+
+    def close(self):
+        if self.pool is None:
+            return
+        self.pool.shutdown()
+        self.pool = None
+        self.store.set_allocator(None)
+        self.allocator.close()
+        atexit.unregister(self.close)
@@ -0,0 +1,143 @@
+import math
+import time
+from collections import deque
+
+
+class _Span:
+    __slots__ = ("profiler", "phase", "start", "top_level")
+
+    def __init__(self, profiler, phase):
+        self.profiler = profiler
+        self.phase = phase
+
+    def __enter__(self):
+        profiler = self.profiler
+        self.top_level = profiler.depth == 0
+        profiler.depth += 1
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        elapsed = time.perf_counter_ns() - self.start
+        profiler = self.profiler
+        profiler.depth -= 1
+        frame = profiler.current
+        phases = frame["phases"]
+        phases[self.phase] = phases.get(self.phase, 0) + elapsed
+        if self.top_level:
+            frame["work_ns"] += elapsed
+        return False
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of an unsorted sequence (0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class FrameProfiler:
+    """Per-frame phase timings and counters kept in a rolling window.
+
+    Work is timed with perf_counter_ns spans:
+
+        with profiler.span("scripts"):
+            ...
+
+    Spans of the same phase add up within a frame and phases may nest (the
+    texture "upload" phase happens inside "draw"), so phase times are
+    inclusive; a frame's work time only adds up top-level spans. Counters
+    such as objects drawn are bumped with count(). A frame is closed by
+    end_frame(), which SceneView calls after painting; simulation ticks
+    that ran since the previous paint land in that frame.
+    """
+
+    # Phases the engine times, in the order a tick and a paint run them.
+    PHASES = ("scripts", "motion", "hierarchy", "collisions", "sort", "draw", "upload")
+
+    def __init__(self, history=300):
+        self.enabled = True
+        self.frames = deque(maxlen=history)
+        self.current = self._new_frame()
+        self.depth = 0
+        self._last_frame_end = None
+
+    def span(self, phase):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, phase)
+
+    def count(self, name, amount=1):
+        if self.enabled:
+            counters = self.current["counters"]
+            counters[name] = counters.get(name, 0) + amount
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        frame = self.current
+        frame["interval_ns"] = now - self._last_frame_end if self._last_frame_end is not None else 0
+        self._last_frame_end = now
+        self.frames.append(frame)
+        self.current = self._new_frame()
+
+    def reset(self):
+        self.frames.clear()
+        self.current = self._new_frame()
+        self._last_frame_end = None
+
+    def stats(self):
+        """Summary of the window: percentiles in milliseconds and mean counters."""
+        frames = list(self.frames)
+        work = [frame["work_ns"] / 1e6 for frame in frames]
+        intervals = [frame["interval_ns"] / 1e6 for frame in frames if frame["interval_ns"]]
+        phases = {}
+        counters = {}
+        for frame in frames:
+            for phase, ns in frame["phases"].items():
+                phases.setdefault(phase, []).append(ns / 1e6)
+            for name, value in frame["counters"].items():
+                counters[name] = counters.get(name, 0) + value
+        return {
+            "frames": len(frames),
+            "work_ms": {"p50": percentile(work, 0.50), "p95": percentile(work, 0.95), "p99": percentile(work, 0.99)},
+            "frame_ms": {"p50": percentile(intervals, 0.50), "p95": percentile(intervals, 0.95), "p99": percentile(intervals, 0.99)},
+            "phases_ms": {
+                phase: {"p50": percentile(values, 0.50), "p95": percentile(values, 0.95), "p99": percentile(values, 0.99)}
+                for phase, values in phases.items()
+            },
+            "counters": {name: total / len(frames) for name, total in counters.items()} if frames else {},
+            "last_counters": dict(frames[-1]["counters"]) if frames else {},
+        }
+
+    def summary_lines(self):
+        stats = self.stats()
+        lines = [
+            f"frame {stats['frame_ms']['p50']:.1f} / {stats['frame_ms']['p95']:.1f} / {stats['frame_ms']['p99']:.1f} ms (p50/p95/p99)",
+            f"work  {stats['work_ms']['p50']:.1f} / {stats['work_ms']['p95']:.1f} / {stats['work_ms']['p99']:.1f} ms",
+        ]
+        phases = stats["phases_ms"]
+        for phase in self.PHASES + tuple(sorted(set(phases) - set(self.PHASES))):
+            values = phases.get(phase, {"p50": 0.0, "p95": 0.0})
+            lines.append(f"{phase:<10} {values['p50']:.2f} / {values['p95']:.2f} ms")
+        for name, value in sorted(stats["last_counters"].items()):
+            lines.append(f"{name:<14} {value}")
+        return lines
+
+    @staticmethod
+    def _new_frame():
+        return {"phases": {}, "counters": {}, "work_ns": 0}
@@ -0,0 +1,93 @@
+import bisect
+import itertools
+
+
+class RenderQueue:
+    """Drawable objects grouped by layer, kept in draw order incrementally.
+
+    Objects are classified once, when they are added: anything without a
+    draw() method (cameras, empty nodes) never enters the queue, and sprites
+    are told apart from custom drawables up front. Each layer keeps its
+    objects in insertion order, so iterating yields the same order the old
+    per-frame stable sort produced without sorting or probing attributes.
+    """
+
+    # Objects without a layer attribute are drawn after every layered one.
+    UNLAYERED = float("inf")
+
+    def __init__(self):
+        self.layers = []
+        self.buckets = {}
+        self.object_layers = {}
+        self.draw_keys = {}
+        self.custom_drawables = set()
+        self._sequence = itertools.count()
+
+    def __len__(self):
+        return len(self.object_layers)
+
+    def __contains__(self, game_object):
+        return game_object in self.object_layers
+
+    def __iter__(self):
+        """Yield (object, is_sprite) pairs in draw order."""
+        for layer in self.layers:
+            yield from self.buckets[layer].items()
+
+    def ordered(self, objects):
+        """List (object, is_sprite) pairs for a subset of the queue in draw order.
+
+        Used after culling: sorting only the visible objects by their cached
+        (layer, insertion) key keeps the cost proportional to what is drawn.
+        """
+        custom_drawables = self.custom_drawables
+        return [
+            (game_object, game_object not in custom_drawables)
+            for game_object in sorted(objects, key=self.draw_keys.__getitem__)
+        ]
+
+    def add(self, game_object):
+        if game_object in self.object_layers or not hasattr(game_object, 'draw'):
+            return
+        is_sprite = hasattr(game_object, 'texture_id')
+        if not is_sprite:
+            self.custom_drawables.add(game_object)
+        self._insert(game_object, getattr(game_object, 'layer', self.UNLAYERED), is_sprite)
+
+    def remove(self, game_object):
+        layer = self.object_layers.pop(game_object, None)
+        if layer is None:
+            return None
+        del self.draw_keys[game_object]
+        self.custom_drawables.discard(game_object)
+        bucket = self.buckets[layer]
+        is_sprite = bucket.pop(game_object)
+        if not bucket:
+            del self.buckets[layer]
+            del self.layers[bisect.bisect_left(self.layers, layer)]
+        return is_sprite
+
+    def move(self, game_object, layer):
+        """Re-bucket an object whose layer changed; it goes last in its new layer."""
+        if self.object_layers.get(game_object, layer) == layer:
+            return
+        is_sprite = self.remove(game_object)
+        if not is_sprite:
+            self.custom_drawables.add(game_object)
+        self._insert(game_object, layer, is_sprite)
+
+    def clear(self):
+        self.layers.clear()
+        self.buckets.clear()
+        self.object_layers.clear()
+        self.draw_keys.clear()
+        self.custom_drawables.clear()
+
+    def _insert(self, game_object, layer, is_sprite):
+        bucket = self.buckets.get(layer)
+        if bucket is None:
+            bucket = self.buckets[layer] = {}
+            bisect.insort(self.layers, layer)
+        bucket[game_object] = is_sprite
+        self.object_layers[game_object] = layer
+        self.draw_keys[game_object] = (layer, next(self._sequence))
@@ -10,7 +10,7 @@ class s:
         self.scene_view = scene_view
         self.started = False
         self.enabled = True
-        self.movement_speed = 5  # Define movement_speed as an attribute
+        self.movement_speed = 300  # Define movement_speed as an attribute
 
     def Start(self, game_object, started=True):
         # Start method implementation
@@ -19,12 +19,13 @@ class s:
     def Update(self, game_object):
         if self.enabled:
             keys = self.scene_view.key_pressed
+            step = self.movement_speed * self.scene_view.dt
             if Qt.Key_Up in keys:
-                game_object.position = (game_object.position[0], game_object.position[1] - self.movement_speed)
+                game_object.position = (game_object.position[0], game_object.position[1] - step)
             if Qt.Key_Down in keys:
-                game_object.position = (game_object.position[0], game_object.position[1] + self.movement_speed)
+                game_object.position = (game_object.position[0], game_object.position[1] + step)
             if Qt.Key_Left in keys:
-                game_object.position = (game_object.position[0] - self.movement_speed, game_object.position[1])
+                game_object.position = (game_object.position[0] - step, game_object.position[1])
             if Qt.Key_Right in keys:
-                game_object.position = (game_object.position[0] + self.movement_speed, game_object.position[1])
+                game_object.position = (game_object.position[0] + step, game_object.position[1])
             game_object.notify_change()
\ No newline at end of file
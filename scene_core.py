@@ -0,0 +1,286 @@
+from render_queue import RenderQueue
+from spatial_hash import SpatialHash
+from profiler import FrameProfiler
+from game_clock import GameClock
+from collision import CollisionWorld
+from object_registry import ObjectRegistry
+from snapshot import SceneSnapshot
+from script_scheduler import ScriptScheduler
+from inputs import InputHandler
+
+
+class SceneCore:
+    """Scene state and simulation stepping, with no Qt widget or GL behind it.
+
+    SceneView mixes this into its QOpenGLWidget; HeadlessScene uses it on its
+    own. Subclasses provide the view surface scripts and objects talk to:
+    width(), height() and update().
+
+    Whatever changes something visible calls mark_dirty(), and the view
+    renders once for all the calls made before it gets to draw. Outside
+    Play that is the only thing that makes it draw; during Play the view
+    also draws on every timer fire.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.scene_objects = []
+        self.running = False
+        # Simulation runs in fixed ticks of clock.fixed_dt, however often
+        # the owner gets around to calling step().
+        self.clock = GameClock()
+        self.input = InputHandler(self)
+        self.active_camera = None
+        self.profiler = FrameProfiler()
+        self.render_queue = RenderQueue()
+        self.spatial_index = SpatialHash()
+        self.moved_objects = set()
+        self.collisions = CollisionWorld(self)
+        self.registry = ObjectRegistry()
+        self._update_order = None
+        # Bumped by hierarchy_changed(); views compare it to know whether
+        # the scene graph changed while they were not watching.
+        self.hierarchy_version = 0
+        self.scheduler = ScriptScheduler(self)
+        # Objects with a velocity that are not in the transform store, which
+        # integrates its own rows.
+        self.moving_objects = set()
+        self.transform_store = None
+        self.parallel = None
+        # Taken when Play starts (not on resume after a pause); Stop restores it.
+        self.play_snapshot = None
+
+    @property
+    def dt(self):
+        """Seconds simulated by each call to the scripts' Update.
+
+        Scripts keep speeds per second and move by speed * dt each Update,
+        so they move as fast whatever the tick rate (300 px/s is 5 px per
+        tick at 60 Hz).
+        """
+        return self.clock.fixed_dt
+
+    @property
+    def key_pressed(self):
+        """Keys held during this tick (read-only; see input for edges and the mouse)."""
+        return self.input.state.down
+
+    @property
+    def update_dt(self):
+        """Seconds since the running script's previous Update.
+
+        Same as dt, except for scripts with an update_interval or that were
+        deferred by the scheduler's budget.
+        """
+        return self.scheduler.current_dt
+
+    @property
+    def time(self):
+        """Simulated seconds since Start."""
+        return self.clock.time
+
+    @property
+    def frame(self):
+        """Number of simulation ticks since Start."""
+        return self.clock.frame
+
+    def mark_dirty(self):
+        """Something visible changed; ask the view for a new frame.
+
+        update() already merges every request made before the view draws,
+        so calling this often costs nothing extra.
+        """
+        self.update()
+
+    def set_tick_rate(self, hz):
+        self.clock.set_tick_rate(hz)
+        self.scheduler.invalidate()
+
+    def take_snapshot(self):
+        """SceneSnapshot of the current state; call restore() on it to go back."""
+        return SceneSnapshot(self)
+
+    def begin_play(self):
+        if self.play_snapshot is None:
+            self.play_snapshot = self.take_snapshot()
+            self.input.reset()
+        self.start_scripts()
+
+    def start_scripts(self):
+        """Call Start on every script that has not been started yet."""
+        for obj in self.scene_objects:
+            if hasattr(obj, 'VoidStart'):
+                obj.VoidStart()
+            elif hasattr(obj, 'start_scripts'):
+                obj.start_scripts()
+
+    def step(self):
+        """Advance the simulation by exactly one tick of `dt` seconds."""
+        self.input.begin_tick()
+        with self.profiler.span("scripts"):
+            self.scheduler.run_tick()
+        with self.profiler.span("motion"):
+            self.integrate_motion()
+        with self.profiler.span("hierarchy"):
+            self.update_world_transforms()
+        with self.profiler.span("collisions"):
+            self.collisions.step()
+        self.clock.tick()
+        self.profiler.count("ticks")
+
+    def integrate_motion(self):
+        """Apply velocity and angular_velocity for one tick."""
+        dt = self.clock.fixed_dt
+        store = self.transform_store
+        if store is not None:
+            rows = self.parallel.step(dt) if self.parallel is not None else store.integrate(dt)
+            if len(rows):
+                self.moved_objects.update(store.moved_objects(rows))
+        for obj in self.moving_objects:
+            velocity_x, velocity_y = obj.velocity
+            if velocity_x or velocity_y:
+                x, y = obj.position
+                obj.position = (x + velocity_x * dt, y + velocity_y * dt)
+            if obj.angular_velocity:
+                obj.rotation = obj.rotation + obj.angular_velocity * dt
+
+    def enable_transform_store(self, capacity=1024):
+        """Move every GameObject's transform into a NumPy TransformStore."""
+        if self.transform_store is None:
+            from transform_store import TransformStore
+
+            self.transform_store = TransformStore(capacity)
+            for obj in self.scene_objects:
+                if hasattr(obj, 'bind_store'):
+                    self.transform_store.bind(obj)
+                    self.moving_objects.discard(obj)
+        return self.transform_store
+
+    def disable_transform_store(self):
+        self.disable_parallel()
+        store = self.transform_store
+        if store is not None:
+            # Unset first so unbound objects with a velocity register as moving.
+            self.transform_store = None
+            store.clear()
+
+    def enable_parallel(self, workers=None):
+        """Step the transform store's columns on a process pool (see parallel.py)."""
+        if self.parallel is None:
+            from parallel import ParallelStepper
+
+            self.parallel = ParallelStepper(self.enable_transform_store(), workers)
+        return self.parallel
+
+    def disable_parallel(self):
+        if self.parallel is not None:
+            self.parallel.close()
+            self.parallel = None
+
+    def update_order(self):
+        """Scene objects with every parent ahead of its children, cached.
+
+        Objects whose parent is not in the scene count as roots. The order is
+        rebuilt only after objects are added or removed or re-parented.
+        """
+        if self._update_order is None:
+            members = set(self.scene_objects)
+            order = []
+            for root in self.scene_objects:
+                if getattr(root, 'parent', None) in members:
+                    continue
+                stack = [root]
+                while stack:
+                    obj = stack.pop()
+                    order.append(obj)
+                    stack.extend(child for child in reversed(getattr(obj, 'children', ())) if child in members)
+            self._update_order = order
+        return self._update_order
+
+    def hierarchy_changed(self):
+        self._update_order = None
+        self.hierarchy_version += 1
+        self.scheduler.invalidate()
+
+    def scripts_changed(self):
+        self.scheduler.invalidate()
+
+    def reset_scene(self):
+        """Go back to the state Play started from, or to each object's original state."""
+        snapshot, self.play_snapshot = self.play_snapshot, None
+        if snapshot is not None:
+            snapshot.restore()
+        else:
+            for obj in self.scene_objects:
+                obj.reset()
+        self.collisions.clear_contacts()
+        self.scheduler.reset()
+        self.input.reset()
+        self.mark_dirty()
+
+    def update_world_transforms(self):
+        """Propagate this tick's transform changes down the hierarchy.
+
+        Composes the transform store's world columns and re-indexes the
+        objects that moved, which recomputes their cached world transforms.
+        """
+        if self.transform_store is not None:
+            self.transform_store.update_world()
+        self.refresh_spatial_index()
+
+    def refresh_spatial_index(self):
+        """Re-index only the objects whose transform changed since the last call."""
+        for obj in self.moved_objects:
+            if obj in self.spatial_index:
+                self.spatial_index.update(obj, obj.get_bounds())
+        self.moved_objects.clear()
+
+    def add_game_object(self, game_object):
+        if getattr(game_object, 'scene_view', None) is None:
+            game_object.scene_view = self
+        self.scene_objects.append(game_object)
+        self.hierarchy_changed()
+        self.registry.add(game_object)
+        self.render_queue.add(game_object)
+        if self.transform_store is not None and hasattr(game_object, 'bind_store'):
+            self.transform_store.bind(game_object)
+        elif hasattr(game_object, 'motion_changed'):
+            game_object.motion_changed()
+        if hasattr(game_object, 'get_bounds'):
+            self.spatial_index.insert(game_object, game_object.get_bounds())
+        if hasattr(game_object, 'initialize_texture'):
+            game_object.initialize_texture()
+        self.collisions.refresh_listener(game_object)
+        self.mark_dirty()
+
+    def remove_game_object(self, game_object):
+        if game_object in self.scene_objects:
+            self.scene_objects.remove(game_object)
+        self.hierarchy_changed()
+        self.registry.remove(game_object)
+        self.render_queue.remove(game_object)
+        self.spatial_index.remove(game_object)
+        self.moved_objects.discard(game_object)
+        self.moving_objects.discard(game_object)
+        self.collisions.forget(game_object)
+        if self.transform_store is not None:
+            self.transform_store.unbind(game_object)
+        if hasattr(game_object, 'release_texture'):
+            game_object.release_texture()
+        self.mark_dirty()
+
+    def get_gameobject(self, name):
+        return self.registry.get(name)
+
+    def get_by_id(self, object_id):
+        return self.registry.get_by_id(object_id)
+
+    def find_by_tag(self, tag):
+        return self.registry.find_by_tag(tag)
+
+    def find_all(self, cls):
+        return self.registry.find_all(cls)
+
+    def handle(self, name):
+        """ObjectHandle for `name`; create it once (e.g. in Start) and call get() per frame."""
+        return self.registry.handle(name)
@@ -1,46 +1,63 @@
 from PyQt5.QtWidgets import QOpenGLWidget
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QPainter, QColor, QFont
+import time
 from OpenGL.GL import *
 from OpenGL.GLUT import *
+from sprite_batch import SpriteBatch
+from scene_core import SceneCore
+from texture_cache import texture_cache
+from texture_atlas import texture_atlas
+
+class SceneView(QOpenGLWidget, SceneCore):
+    # True on Start, False on Pause and Stop; lets panels run timers only during Play.
+    play_state_changed = pyqtSignal(bool)
+    # Parent/child links were edited outside the Hierarchy panel (e.g. ParentsPanel).
+    hierarchy_edited = pyqtSignal()
 
-class SceneView(QOpenGLWidget):
     def __init__(self):
         super().__init__()
         self.setMinimumSize(800, 250)
-        self.scene_objects = []
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_scene)
-        self.running = False
-        self.key_pressed = set()
-        self.active_camera = None
+        # The timer only drives rendering, at render_interval_ms; each frame
+        # runs however many simulation ticks are due.
+        self.render_interval_ms = 16
+        self._last_frame_time = None
+        self.show_stats = False
+        self.sprite_batch = SpriteBatch(self.profiler)
+        self.culling_enabled = True
 
         self.setFocusPolicy(Qt.StrongFocus)
+        self.setMouseTracking(True)
 
     def start(self):
         if not self.running:
             self.running = True
-            self.timer.start(16)  # Aproximadamente 60 FPS
+            self.begin_play()
+            self._last_frame_time = time.perf_counter()
+            self.timer.start(self.render_interval_ms)
+            self.play_state_changed.emit(True)
             print("Simulation started")
 
     def pause(self):
         if self.running:
             self.running = False
             self.timer.stop()
+            # Releases made while paused are not queued: let go of everything now.
+            self.input.reset()
+            self.play_state_changed.emit(False)
             print("Simulation paused")
 
     def stop(self):
         if self.running:
             self.running = False
             self.timer.stop()
+            self.clock.reset()
             self.reset_scene()
-            self.repaint()
+            self.play_state_changed.emit(False)
             print("Simulation stopped")
 
-    def reset_scene(self):
-        for obj in self.scene_objects:
-            obj.reset()
-        self.repaint()
-
     def initializeGL(self):
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
@@ -51,20 +68,88 @@ class SceneView(QOpenGLWidget):
                 obj.initialize_texture()
 
     def paintGL(self):
+        profiler = self.profiler
+        uploads_before = texture_cache.uploads + texture_atlas.uploads
+
+        # The stats overlay paints with QPainter, which leaves blending off.
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glLoadIdentity()
 
         if self.active_camera:
             self.active_camera.apply_view(self.width(), self.height())
 
-        objects_with_layer = [obj for obj in self.scene_objects if hasattr(obj, 'layer')]
-        objects_without_layer = [obj for obj in self.scene_objects if not hasattr(obj, 'layer')]
-
-        sorted_objects = sorted(objects_with_layer, key=lambda o: o.layer) + objects_without_layer
-
-        for obj in sorted_objects:
-            if hasattr(obj, 'draw'):
-                obj.draw()
+        with profiler.span("hierarchy"):
+            self.update_world_transforms()
+
+        store = self.transform_store
+        if store is not None and not self.render_queue.custom_drawables:
+            # Every drawable is a bound sprite: cull, sort and build the
+            # vertex data over the store's columns.
+            with profiler.span("sort"):
+                rect = self.visible_world_rect() if self.culling_enabled else None
+                visible = store.visible_rows(rect)
+            with profiler.span("draw"):
+                self.sprite_batch.begin()
+                self.sprite_batch.add_rows(*store.sprite_rows(visible, profiler))
+                self.sprite_batch.end()
+        else:
+            with profiler.span("sort"):
+                visible = self.visible_objects()
+
+            # Sprites go through the batch; anything else that knows how to draw
+            # itself flushes the batch first so layer order is preserved.
+            with profiler.span("draw"):
+                self.sprite_batch.begin()
+                for obj, is_sprite in visible:
+                    if is_sprite:
+                        self.sprite_batch.add(obj)
+                    else:
+                        self.sprite_batch.flush()
+                        obj.draw()
+                self.sprite_batch.end()
+
+        profiler.count("objects_visible", len(visible))
+        profiler.count("textures_uploaded", texture_cache.uploads + texture_atlas.uploads - uploads_before)
+        profiler.end_frame()
+
+        if self.show_stats and self.isVisible():
+            self.draw_stats_overlay()
+
+    def set_stats_overlay(self, enabled):
+        self.show_stats = enabled
+        self.mark_dirty()
+
+    def draw_stats_overlay(self):
+        lines = self.profiler.summary_lines()
+        painter = QPainter(self)
+        painter.setFont(QFont("Monospace", 9))
+        line_height = painter.fontMetrics().height()
+        painter.fillRect(5, 5, 330, line_height * len(lines) + 10, QColor(0, 0, 0, 160))
+        painter.setPen(QColor(255, 255, 255))
+        for i, line in enumerate(lines):
+            painter.drawText(10, 5 + line_height * (i + 1), line)
+        painter.end()
+
+    def visible_world_rect(self):
+        if self.active_camera:
+            return self.active_camera.visible_rect(self.width(), self.height())
+        return (0, 0, self.width(), self.height())
+
+    def visible_objects(self):
+        """List (object, is_sprite) in draw order, skipping sprites off camera.
+
+        Culled sprites are never handed to the batch, so they also skip any
+        pending texture sync until they come back into view.
+        """
+        rect = self.visible_world_rect() if self.culling_enabled else None
+        if rect is None:
+            return list(self.render_queue)
+        self.refresh_spatial_index()
+        visible = self.spatial_index.query_aabb(rect)
+        visible.update(self.render_queue.custom_drawables)
+        return self.render_queue.ordered(visible)
 
     def resizeGL(self, width, height):
         glViewport(0, 0, width, height)
@@ -74,31 +159,42 @@ class SceneView(QOpenGLWidget):
         glMatrixMode(GL_MODELVIEW)
 
     def update_scene(self):
-        if self.running:
-            for obj in self.scene_objects:
-                obj.VoidUpdate()
-            self.update()
+        """Run the simulation ticks that are due and schedule one repaint.
 
+        During Play the view draws on every timer fire, at display rate,
+        whether or not a tick was due; on-demand rendering is for edit mode.
+        """
+        if self.running:
+            now = time.perf_counter()
+            ticks = self.clock.advance(now - self._last_frame_time)
+            self._last_frame_time = now
+            for _ in range(ticks):
+                self.step()
+            self.mark_dirty()
+
+    # Input events are only queued; the next simulation tick reads them.
     def keyPressEvent(self, event):
-        self.key_pressed.add(event.key())
-        self.update()
+        self.input.key_press(event)
 
     def keyReleaseEvent(self, event):
-        self.key_pressed.discard(event.key())
-        self.update()
+        self.input.key_release(event)
+
+    def mouseMoveEvent(self, event):
+        self.input.mouse_move(event)
+
+    def mousePressEvent(self, event):
+        self.input.mouse_press(event)
 
-    def add_game_object(self, game_object):
-        self.scene_objects.append(game_object)
-        if hasattr(game_object, 'initialize_texture'):
-            game_object.initialize_texture()
-        self.update()
+    def mouseReleaseEvent(self, event):
+        self.input.mouse_release(event)
+
+    def wheelEvent(self, event):
+        self.input.wheel(event)
+
+    def focusOutEvent(self, event):
+        self.input.release_all()
+        super().focusOutEvent(event)
 
     def set_active_camera(self, camera):
         self.active_camera = camera
-        self.update()
-
-    def get_gameobject(self, name):
-        for obj in self.scene_objects:
-            if obj.name == name:
-                return obj
-        return None
+        self.mark_dirty()
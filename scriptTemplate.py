@@ -10,7 +10,10 @@ class ScriptTemplate:
         self.scene_view = scene_view
         self.started = False
         self.enabled = True
-        self.movement_speed = 5  # Define movement_speed as an attribute
+        self.movement_speed = 300  # Pixels per second
+        # Optional: update_interval = 0.2 runs Update 5 times a second (use
+        # scene_view.update_dt then); priority = -1 lets Update wait a tick
+        # when the scene's script budget is used up.
 
     def Start(self, game_object, started=True):
         # Start method implementation
@@ -18,13 +21,14 @@ class ScriptTemplate:
 
     def Update(self, game_object):
         if self.enabled:
-            keys = self.scene_view.key_pressed
-            if Qt.Key_Up in keys:
-                game_object.position = (game_object.position[0], game_object.position[1] - self.movement_speed)
-            if Qt.Key_Down in keys:
-                game_object.position = (game_object.position[0], game_object.position[1] + self.movement_speed)
-            if Qt.Key_Left in keys:
-                game_object.position = (game_object.position[0] - self.movement_speed, game_object.position[1])
-            if Qt.Key_Right in keys:
-                game_object.position = (game_object.position[0] + self.movement_speed, game_object.position[1])
+            inputs = self.scene_view.input
+            step = self.movement_speed * self.scene_view.dt
+            if inputs.is_down(Qt.Key_Up):
+                game_object.position = (game_object.position[0], game_object.position[1] - step)
+            if inputs.is_down(Qt.Key_Down):
+                game_object.position = (game_object.position[0], game_object.position[1] + step)
+            if inputs.is_down(Qt.Key_Left):
+                game_object.position = (game_object.position[0] - step, game_object.position[1])
+            if inputs.is_down(Qt.Key_Right):
+                game_object.position = (game_object.position[0] + step, game_object.position[1])
             game_object.notify_change()
\ No newline at end of file
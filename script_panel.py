@@ -10,9 +10,17 @@ from scene_view import SceneView
 import importlib.util
 import os
 
+# Valores imutáveis simples são comparados diretamente; o resto pelo texto exibido.
+PLAIN_TYPES = (bool, int, float, str, tuple, type(None))
+HIDDEN_VARIABLES = ('name', 'scene_view', 'started', 'enabled')
+
+
 class VariablePanel(QWidget):
     def __init__(self):
         super().__init__()
+        self.script = None
+        # nome da variável -> [widget, último valor mostrado]
+        self.editors = {}
         self.setup_ui()
 
     def setup_ui(self):
@@ -50,13 +58,54 @@ class VariablePanel(QWidget):
         """)
 
     def update_variables(self, script):
-        """Atualiza os editores de variáveis com base no script fornecido."""
+        """Mostra as variáveis do script.
+
+        Os editores são criados uma vez por script; chamadas seguintes com o
+        mesmo script só atualizam os valores que mudaram.
+        """
+        if script is not None and script is self.script and self.refresh():
+            return
         self.clear_layout(self.variable_list)
+        self.editors = {}
+        self.script = script
         if script:
             for var_name, var_value in vars(script).items():
-                if var_name not in ['name', 'scene_view', 'started', 'enabled']:
+                if var_name not in HIDDEN_VARIABLES:
                     self.add_variable_editor(var_name, var_value, script)
 
+    def refresh(self):
+        """Atualiza só os editores cujo valor mudou; False se o conjunto de variáveis mudou."""
+        variables = vars(self.script)
+        shown = 0
+        for var_name, var_value in variables.items():
+            if var_name in HIDDEN_VARIABLES:
+                continue
+            entry = self.editors.get(var_name)
+            if entry is None:
+                return False
+            shown += 1
+            widget, last_value = entry
+            if isinstance(var_value, PLAIN_TYPES):
+                if var_value is last_value or (type(var_value) is type(last_value) and var_value == last_value):
+                    continue
+                text = None
+            else:
+                # Listas e objetos podem mudar por dentro: compara o texto.
+                text = str(var_value)
+                if text == last_value:
+                    continue
+            if widget.hasFocus():
+                # Não sobrescreve o que o usuário está digitando.
+                continue
+            widget.blockSignals(True)
+            if isinstance(widget, QCheckBox):
+                widget.setChecked(bool(var_value))
+            else:
+                widget.setText(str(var_value) if text is None else text)
+            widget.blockSignals(False)
+            entry[1] = var_value if text is None else text
+        return shown == len(self.editors)
+
     def add_variable_editor(self, var_name, var_value, script):
         """Adiciona um editor de variável ao painel."""
         widget = QCheckBox() if isinstance(var_value, bool) else QLineEdit()
@@ -67,6 +116,7 @@ class VariablePanel(QWidget):
             widget.setText(str(var_value))
             widget.textChanged.connect(lambda value, v=var_name, t=type(var_value): self.update_script_variable(script, v, value, t))
 
+        self.editors[var_name] = [widget, var_value if isinstance(var_value, PLAIN_TYPES) else str(var_value)]
         self.variable_list.addRow(QLabel(var_name), widget)
 
     def update_script_variable(self, script, var_name, value, value_type):
@@ -80,6 +130,9 @@ class VariablePanel(QWidget):
                 value = float(value)
             setattr(script, var_name, value)
             updated_value = getattr(script, var_name)
+            entry = self.editors.get(var_name)
+            if entry is not None and script is self.script:
+                entry[1] = updated_value if isinstance(updated_value, PLAIN_TYPES) else str(updated_value)
             print(f"Updated script variable {var_name} to {updated_value} of type {type(updated_value)}")
         except ValueError as e:
             print(f"Error updating variable {var_name}: {e}")
@@ -101,6 +154,9 @@ class ScriptPanel(QWidget):
         self.scene_view = scene_view
         self.selected_object = None
         self.script_editor = None
+        # Script mostrado no painel de variáveis, guardado ao selecionar.
+        self.inspected_script = None
+        self.refresh_interval_ms = 100
 
         self.setup_ui()
         self.setup_timer()
@@ -156,17 +212,48 @@ class ScriptPanel(QWidget):
         layout.addWidget(self.variable_panel)
 
     def setup_timer(self):
-        """Configura o temporizador para atualizar o painel de variáveis periodicamente."""
+        """Configura o temporizador do painel de variáveis; só roda com o painel visível e a cena em execução."""
         self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self.refresh_variable_panel)
-        self.update_timer.start(100)  # Atualiza a cada 100 ms
+        play_state_changed = getattr(self.scene_view, 'play_state_changed', None)
+        if play_state_changed is not None:
+            play_state_changed.connect(self.on_play_state_changed)
+
+    def on_play_state_changed(self, running):
+        if running and self.isVisible():
+            self.update_timer.start(self.refresh_interval_ms)
+        else:
+            self.update_timer.stop()
+            # Mostra os valores em que a execução parou (ou que o Stop restaurou)
+            if self.inspected_script is not None and self.variable_panel.isVisible():
+                self.variable_panel.update_variables(self.inspected_script)
+
+    def set_refresh_interval(self, interval_ms):
+        """Muda a frequência com que as variáveis são lidas durante a execução."""
+        self.refresh_interval_ms = interval_ms
+        if self.update_timer.isActive():
+            self.update_timer.start(interval_ms)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.scene_view.running:
+            self.update_timer.start(self.refresh_interval_ms)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_timer.stop()
 
     def set_selected_object(self, selected_object):
         """Define o objeto selecionado e atualiza a lista de scripts."""
         self.selected_object = selected_object
+        self.inspect(None)
         if self.selected_object:
             self.update_script_list()
 
+    def inspect(self, script):
+        self.inspected_script = script
+        self.variable_panel.update_variables(script)
+
     def update_script_list(self):
         """Atualiza a lista de scripts exibida."""
         self.script_list.clear()
@@ -193,17 +280,12 @@ class ScriptPanel(QWidget):
         script_name = item.text()
         script = next((s for s in self.selected_object.scripts if s.name == script_name), None)
         if script:
-            self.variable_panel.update_variables(script)
+            self.inspect(script)
 
     def refresh_variable_panel(self):
-        """Atualiza o painel de variáveis se o cenário estiver em execução."""
-        if self.scene_view.running:
-            selected_item = self.script_list.currentItem()
-            if selected_item:
-                script_name = selected_item.text()
-                script = next((s for s in self.selected_object.scripts if s.name == script_name), None)
-                if script:
-                    self.variable_panel.update_variables(script)
+        """Atualiza os valores que mudaram, se o cenário estiver em execução."""
+        if self.scene_view.running and self.inspected_script is not None and self.variable_panel.isVisible():
+            self.variable_panel.update_variables(self.inspected_script)
 
     def toggle_script(self, state, script):
         """Habilita ou desabilita um script com base no estado do checkbox."""
@@ -241,6 +323,8 @@ class ScriptPanel(QWidget):
             script_name = item.text()
             script_to_remove = next((s for s in self.selected_object.scripts if s.name == script_name), None)
             if script_to_remove:
+                if script_to_remove is self.inspected_script:
+                    self.inspect(None)
                 self.selected_object.remove_script(script_to_remove)
                 self.update_script_list()
 
@@ -281,6 +365,9 @@ class ScriptPanel(QWidget):
                 new_script = getattr(module, script_name)(script_name, self.scene_view)
                 script_index = self.selected_object.scripts.index(script_to_reload)
                 self.selected_object.scripts[script_index] = new_script
+                self.selected_object.scripts_changed()
+                if script_to_reload is self.inspected_script:
+                    self.inspect(new_script)
                 print(f"Script '{script_name}' recarregado com sucesso.")
             except Exception as e:
                 print(f"Erro ao recarregar o script '{script_name}': {e}")
@@ -0,0 +1,147 @@
+import time
+
+
+class ScriptScheduler:
+    """Decides which script Updates run on each simulation tick.
+
+    Scripts opt in through two optional attributes, read when the scene's
+    scripts or hierarchy change:
+
+    - update_interval: seconds between Updates (default 0, every tick).
+      Scripts sharing an interval are staggered over its ticks, so twelve
+      5 Hz scripts at 60 Hz cost one Update per tick instead of twelve on
+      every twelfth tick.
+    - priority: higher runs earlier within a tick (default 0). With
+      budget_ms set, once the tick's scripts have used up the budget the
+      remaining due scripts with a negative priority are deferred: they
+      stay due and run first on the next tick. Priority 0 and above always
+      runs, and so does a script already deferred for max_deferred_ticks.
+
+    Objects whose VoidUpdate is overridden (it lacks the runs_scripts mark
+    the stock GameObject and Camera versions carry) keep the contract they
+    had before: VoidUpdate is called once per tick, and their scripts'
+    intervals and priorities do not apply.
+
+    A script that runs less often than every tick reads scene.update_dt
+    for the seconds since its previous Update. Ticks count scripts_run,
+    scripts_skipped (not due) and scripts_deferred on the profiler; the
+    running totals are in `stats`.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.budget_ms = None
+        self.max_deferred_ticks = 5
+        self.current_dt = scene.clock.fixed_dt
+        self.stats = {"run": 0, "skipped": 0, "deferred": 0}
+        # [due_tick, period, priority, game_object, script, last_tick];
+        # script is None for objects updated through their own VoidUpdate.
+        self._entries = None
+        self._known = {}
+        self._phases = {}
+        self._prioritized = False
+
+    def invalidate(self):
+        """Re-read scripts, intervals and priorities before the next tick."""
+        self._entries = None
+
+    def reset(self):
+        """Forget the schedule; the clock starts again from frame 0."""
+        self._entries = None
+        self._known = {}
+        self._phases = {}
+        self.stats = {"run": 0, "skipped": 0, "deferred": 0}
+
+    def entries(self):
+        if self._entries is None:
+            self._entries = self._build()
+        return self._entries
+
+    def _build(self):
+        frame = self.scene.clock.frame
+        fixed_dt = self.scene.clock.fixed_dt
+        known = {}
+        entries = []
+        for obj in self.scene.update_order():
+            scripts = getattr(obj, 'scripts', None)
+            update = getattr(obj, 'VoidUpdate', None)
+            if scripts is None or (update is not None and not getattr(update, 'runs_scripts', False)):
+                if update is not None:
+                    entries.append(self._entry(known, obj, None, 0, 0, frame, fixed_dt))
+                continue
+            for script in scripts:
+                interval = getattr(script, 'update_interval', 0) or 0
+                priority = getattr(script, 'priority', 0) or 0
+                entries.append(self._entry(known, obj, script, interval, priority, frame, fixed_dt))
+        # Keep the cadence of scripts that were already scheduled.
+        self._known = known
+        self._prioritized = any(entry[2] for entry in entries)
+        return entries
+
+    def _entry(self, known, obj, script, interval, priority, frame, fixed_dt):
+        key = id(script) if script is not None else id(obj)
+        period = max(1, round(interval / fixed_dt)) if interval > 0 else 1
+        entry = self._known.get(key)
+        if entry is None or entry[3] is not obj or entry[4] is not script:
+            # Spread scripts with the same period over its ticks.
+            phase = self._phases.get(period, 0)
+            self._phases[period] = phase + 1
+            due = frame + phase % period
+            entry = [due, period, priority, obj, script, due - period]
+        else:
+            entry[1] = period
+            entry[2] = priority
+        known[key] = entry
+        return entry
+
+    def run_tick(self):
+        """Run the Updates due on this tick; returns how many ran."""
+        scene = self.scene
+        frame = scene.clock.frame
+        fixed_dt = scene.clock.fixed_dt
+        entries = self.entries()
+        due = [entry for entry in entries if entry[0] <= frame]
+        skipped = len(entries) - len(due)
+        if self._prioritized:
+            # Stable: parents still run before children of equal priority,
+            # and deferred scripts go ahead of the rest of their priority.
+            due.sort(key=lambda entry: (-entry[2], entry[0]))
+
+        budget = self.budget_ms
+        start = time.perf_counter() if budget is not None else 0.0
+        ran = 0
+        deferred = 0
+        for entry in due:
+            if (budget is not None and entry[2] < 0 and frame - entry[0] < self.max_deferred_ticks
+                    and (time.perf_counter() - start) * 1000 > budget):
+                deferred += 1
+                continue
+            entry[0] = frame + entry[1]
+            self.current_dt = (frame - entry[5]) * fixed_dt
+            entry[5] = frame
+            game_object = entry[3]
+            script = entry[4]
+            if script is None:
+                game_object.VoidUpdate()
+                ran += 1
+                continue
+            if not getattr(game_object, 'active', True) or not getattr(script, 'enabled', True):
+                continue
+            try:
+                script.Update(game_object)
+            except Exception as e:
+                print(f"Error in script {script.name}: {e}")
+            ran += 1
+        self.current_dt = fixed_dt
+
+        stats = self.stats
+        stats["run"] += ran
+        stats["skipped"] += skipped
+        stats["deferred"] += deferred
+        profiler = scene.profiler
+        profiler.count("scripts_run", ran)
+        if skipped:
+            profiler.count("scripts_skipped", skipped)
+        if deferred:
+            profiler.count("scripts_deferred", deferred)
+        return ran
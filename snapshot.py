@@ -0,0 +1,139 @@
+from copy import copy
+
+
+def script_fields(script):
+    """Public attributes of a script; containers are copied one level deep."""
+    fields = getattr(script, '__dict__', None)
+    if fields is None:
+        return None
+    return {
+        name: copy(value) if isinstance(value, (list, dict, set)) else value
+        for name, value in fields.items()
+        if not name.startswith('_')
+    }
+
+
+class SceneSnapshot:
+    """Everything Play can change in a scene, captured in one pass.
+
+    Holds which objects are in the scene, each object's capture_state()
+    tuple, the hierarchy links, the script lists and the scripts' public
+    fields. Transforms of objects in a TransformStore are saved as column
+    copies instead. Values are kept by reference where they are immutable,
+    so taking a snapshot is cheap enough for checkpoints:
+
+        checkpoint = scene.take_snapshot()
+        ...
+        checkpoint.restore()
+
+    restore() only assigns what differs from the snapshot, so sprites whose
+    appearance did not change keep their textures.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.objects = list(scene.scene_objects)
+        # One flat record per object keeps the snapshot to a couple of
+        # allocations per object: (state, parent, children, scripts, fields).
+        self.records = [
+            (
+                obj.capture_state() if hasattr(obj, 'capture_state') else None,
+                getattr(obj, 'parent', None),
+                tuple(getattr(obj, 'children', ())),
+                tuple(getattr(obj, 'scripts', ())),
+                tuple(script_fields(script) for script in getattr(obj, 'scripts', ())),
+            )
+            for obj in self.objects
+        ]
+        store = scene.transform_store
+        self.store = store
+        self.store_columns = store.capture() if store is not None else None
+        self._store_rows = None
+
+    def restore(self):
+        scene = self.scene
+        self._restore_membership()
+        self._restore_hierarchy()
+
+        restored = set()
+        store = scene.transform_store
+        if store is not None and store is self.store:
+            rows, moved, restyled = store.restore(self.store_columns)
+            restored.update(store.objects[rows])
+            for obj in store.moved_objects(moved):
+                obj.transform_changed()
+            for obj in store.objects[restyled]:
+                obj.appearance_changed()
+
+        for obj, (state, _, _, scripts, fields) in zip(self.objects, self.records):
+            if state is None:
+                obj.reset()
+            else:
+                if hasattr(obj, 'bind_store') and state[0] is None and obj not in restored:
+                    # Was in a store at capture time but cannot be restored
+                    # column-wise any more (the store was swapped or the row freed).
+                    state = self._transform_from_columns(obj) + state[7:]
+                obj.restore_state(state)
+            if tuple(getattr(obj, 'scripts', ())) != scripts:
+                obj.scripts = list(scripts)
+                if hasattr(obj, 'scripts_changed'):
+                    obj.scripts_changed()
+            for script, saved in zip(scripts, fields):
+                if saved is None:
+                    continue
+                current = script.__dict__
+                for name in [name for name in current if not name.startswith('_') and name not in saved]:
+                    del current[name]
+                current.update((name, copy(value) if isinstance(value, (list, dict, set)) else value)
+                               for name, value in saved.items())
+        scene.mark_dirty()
+
+    def _restore_membership(self):
+        scene = self.scene
+        captured = set(self.objects)
+        for obj in [obj for obj in scene.scene_objects if obj not in captured]:
+            scene.remove_game_object(obj)
+        current = set(scene.scene_objects)
+        for obj in self.objects:
+            if obj not in current:
+                scene.add_game_object(obj)
+        if scene.scene_objects != self.objects:
+            scene.scene_objects[:] = self.objects
+            scene.hierarchy_changed()
+
+    def _restore_hierarchy(self):
+        changed = []
+        reordered = False
+        for obj, (_, parent, children, _, _) in zip(self.objects, self.records):
+            if getattr(obj, 'parent', None) is not parent:
+                obj.parent = parent
+                changed.append(obj)
+            if tuple(getattr(obj, 'children', ())) != children:
+                obj.children = list(children)
+                reordered = True
+        if not changed:
+            if reordered:
+                self.scene.hierarchy_changed()
+            return
+        for obj in changed:
+            store = getattr(obj, '_store', None)
+            if store is not None:
+                store.reparent(obj)
+            elif hasattr(obj, 'transform_changed'):
+                obj.transform_changed()
+        self.scene.hierarchy_changed()
+
+    def _transform_from_columns(self, obj):
+        if self._store_rows is None:
+            self._store_rows = {owner: row for row, owner in enumerate(self.store_columns["objects"]) if owner is not None}
+        row = self._store_rows[obj]
+        columns = self.store_columns
+        return (
+            tuple(columns["position"][row].tolist()),
+            float(columns["rotation"][row]),
+            float(columns["scale"][row]),
+            tuple(columns["size"][row].tolist()),
+            tuple(columns["color"][row].tolist()),
+            tuple(columns["velocity"][row].tolist()),
+            float(columns["angular_velocity"][row]),
+        )
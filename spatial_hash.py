@@ -0,0 +1,102 @@
+import math
+
+
+class SpatialHash:
+    """Uniform grid of buckets mapping cells to the objects overlapping them.
+
+    Every object is stored with its axis-aligned bounds (min_x, min_y, max_x,
+    max_y). Updating an object that stays inside the same cells only replaces
+    its bounds, so objects jittering in place cost a tuple compare. Queries
+    visit only the cells the query rectangle covers and return the objects
+    whose bounds actually overlap it.
+    """
+
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.bounds = {}
+        self.cell_ranges = {}
+
+    def __len__(self):
+        return len(self.bounds)
+
+    def __contains__(self, obj):
+        return obj in self.bounds
+
+    def cell_range(self, bounds):
+        size = self.cell_size
+        return (
+            math.floor(bounds[0] / size), math.floor(bounds[1] / size),
+            math.floor(bounds[2] / size), math.floor(bounds[3] / size),
+        )
+
+    def insert(self, obj, bounds):
+        cell_range = self.cell_range(bounds)
+        old_range = self.cell_ranges.get(obj)
+        self.bounds[obj] = bounds
+        if old_range == cell_range:
+            return
+        if old_range is not None:
+            self._unlink(obj, old_range)
+        self.cell_ranges[obj] = cell_range
+        min_cx, min_cy, max_cx, max_cy = cell_range
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is None:
+                    cell = self.cells[(cx, cy)] = set()
+                cell.add(obj)
+
+    update = insert
+
+    def remove(self, obj):
+        cell_range = self.cell_ranges.pop(obj, None)
+        if cell_range is None:
+            return
+        del self.bounds[obj]
+        self._unlink(obj, cell_range)
+
+    def clear(self):
+        self.cells.clear()
+        self.bounds.clear()
+        self.cell_ranges.clear()
+
+    def query_aabb(self, rect):
+        """Return the set of objects whose bounds overlap `rect`."""
+        min_x, min_y, max_x, max_y = rect
+        min_cx, min_cy, max_cx, max_cy = self.cell_range(rect)
+        found = set()
+        cells = self.cells
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(cells):
+            # Huge query (zoomed far out): walking the occupied cells is cheaper.
+            for (cx, cy), cell in cells.items():
+                if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy:
+                    found.update(cell)
+        else:
+            for cx in range(min_cx, max_cx + 1):
+                for cy in range(min_cy, max_cy + 1):
+                    cell = cells.get((cx, cy))
+                    if cell:
+                        found.update(cell)
+        bounds = self.bounds
+        return {
+            obj for obj in found
+            if not (bounds[obj][2] < min_x or bounds[obj][0] > max_x or bounds[obj][3] < min_y or bounds[obj][1] > max_y)
+        }
+
+    def query_point(self, x, y):
+        cell = self.cells.get((math.floor(x / self.cell_size), math.floor(y / self.cell_size)))
+        if not cell:
+            return set()
+        bounds = self.bounds
+        return {obj for obj in cell if bounds[obj][0] <= x <= bounds[obj][2] and bounds[obj][1] <= y <= bounds[obj][3]}
+
+    def _unlink(self, obj, cell_range):
+        min_cx, min_cy, max_cx, max_cy = cell_range
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(obj)
+                    if not cell:
+                        del self.cells[(cx, cy)]
@@ -0,0 +1,192 @@
+import ctypes
+
+import numpy as np
+from OpenGL.GL import *
+
+
+class SpriteBatch:
+    """Draws many textured quads with one buffer upload per frame.
+
+    Sprites are queued with add() in draw order. end() computes every quad's
+    transformed corners in one vectorized pass, uploads them into a single
+    VBO and issues one glDrawArrays per run of consecutive sprites sharing a
+    texture, instead of ~20 immediate-mode calls per sprite.
+    """
+
+    # x, y, u, v, r, g, b, a (overlay tint)
+    FLOATS_PER_VERTEX = 8
+    STRIDE = FLOATS_PER_VERTEX * 4
+
+    _shared = None
+
+    def __init__(self, profiler=None):
+        self.vbo = None
+        self.sprites = []
+        self.textures = []
+        self.chunks = []
+        self.profiler = profiler
+
+    @classmethod
+    def shared(cls):
+        """Batch used for one-off draws outside SceneView.paintGL."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def begin(self):
+        self.sprites.clear()
+        self.textures.clear()
+        self.chunks.clear()
+
+    def add(self, game_object):
+        if game_object.appearance_dirty:
+            if self.profiler is not None:
+                with self.profiler.span("upload"):
+                    game_object.sync_texture()
+            else:
+                game_object.sync_texture()
+        if not game_object.texture_id:
+            return
+
+        width, height = game_object.size
+        u0, v0, u1, v1, texture_id = self.sprite_uv(game_object)
+        x, y, rotation, scale = game_object.world_transform()
+        self.sprites.append((
+            x, y,
+            width / 2, height / 2,
+            rotation, scale,
+            u0, v0, u1, v1,
+            *game_object.overlay_tint,
+        ))
+        self.textures.append(texture_id)
+
+    def add_rows(self, sprites, textures):
+        """Queue prebuilt (N, 14) sprite rows and their texture ids, e.g. from TransformStore."""
+        self._seal()
+        if len(sprites):
+            self.chunks.append((sprites, textures))
+
+    @staticmethod
+    def sprite_uv(game_object):
+        """(u0, v0, u1, v1, texture_id) for a synced sprite."""
+        region = game_object.atlas_region
+        if region is not None:
+            u0, v0, u1, v1 = region.uv
+            return u0, v0, u1, v1, region.page.texture_id
+        width, height = game_object.size
+        u0 = (game_object.offset_x % width) / width
+        v0 = (game_object.offset_y % height) / height
+        return u0, v0, game_object.tiling_x + u0, game_object.tiling_y + v0, game_object.texture_id
+
+    def _seal(self):
+        # Turn the tuples queued by add() into an array chunk so they keep
+        # their place ahead of rows added afterwards.
+        if self.sprites:
+            self.chunks.append((np.array(self.sprites, dtype=np.float32), np.array(self.textures)))
+            self.sprites.clear()
+            self.textures.clear()
+
+    def flush(self):
+        """Draw everything queued so far and start a new batch."""
+        self.end()
+        self.begin()
+
+    def end(self):
+        self._seal()
+        if not self.chunks:
+            return
+        if len(self.chunks) == 1:
+            sprites, textures = self.chunks[0]
+        else:
+            sprites = np.concatenate([chunk[0] for chunk in self.chunks])
+            textures = np.concatenate([chunk[1] for chunk in self.chunks])
+        self.chunks.clear()
+
+        vertices = self.build_vertices(sprites)
+
+        # GL calls issued, tallied next to each group of calls below.
+        gl_calls = 0
+        if self.vbo is None:
+            self.vbo = glGenBuffers(1)
+            gl_calls += 1
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STREAM_DRAW)
+        gl_calls += 2
+
+        glEnable(GL_TEXTURE_2D)
+        gl_calls += 1 + self._enable_overlay_tint()
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, self.STRIDE, ctypes.c_void_p(0))
+        glTexCoordPointer(2, GL_FLOAT, self.STRIDE, ctypes.c_void_p(8))
+        glColorPointer(4, GL_FLOAT, self.STRIDE, ctypes.c_void_p(16))
+        gl_calls += 6
+
+        # Sprites arrive already sorted by layer, so a new run only starts
+        # when the texture changes.
+        starts = np.concatenate(([0], np.flatnonzero(textures[1:] != textures[:-1]) + 1))
+        ends = np.append(starts[1:], len(textures))
+        draw_calls = 0
+        for start, end in zip(starts, ends):
+            glBindTexture(GL_TEXTURE_2D, int(textures[start]))
+            glDrawArrays(GL_QUADS, int(start) * 4, int(end - start) * 4)
+            draw_calls += 1
+        gl_calls += 2 * draw_calls
+
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)
+        glColor4f(1, 1, 1, 1)
+        glDisable(GL_TEXTURE_2D)
+        gl_calls += 7
+
+        if self.profiler is not None:
+            self.profiler.count("sprites_drawn", len(textures))
+            self.profiler.count("draw_calls", draw_calls)
+            self.profiler.count("gl_calls", gl_calls)
+
+    # rgb = overlay.rgb * overlay.a + texture.rgb * (1 - overlay.a)
+    # alpha = texture.a
+    OVERLAY_TINT_ENV = (
+        (GL_TEXTURE_ENV_MODE, GL_COMBINE),
+        (GL_COMBINE_RGB, GL_INTERPOLATE),
+        (GL_SOURCE0_RGB, GL_PRIMARY_COLOR),
+        (GL_OPERAND0_RGB, GL_SRC_COLOR),
+        (GL_SOURCE1_RGB, GL_TEXTURE),
+        (GL_OPERAND1_RGB, GL_SRC_COLOR),
+        (GL_SOURCE2_RGB, GL_PRIMARY_COLOR),
+        (GL_OPERAND2_RGB, GL_SRC_ALPHA),
+        (GL_COMBINE_ALPHA, GL_REPLACE),
+        (GL_SOURCE0_ALPHA, GL_TEXTURE),
+        (GL_OPERAND0_ALPHA, GL_SRC_ALPHA),
+    )
+
+    @classmethod
+    def _enable_overlay_tint(cls):
+        """Set the texture environment for the overlay tint; returns the GL calls issued."""
+        for name, value in cls.OVERLAY_TINT_ENV:
+            glTexEnvi(GL_TEXTURE_ENV, name, value)
+        return len(cls.OVERLAY_TINT_ENV)
+
+    @staticmethod
+    def build_vertices(sprites):
+        """Expand (N, 14) sprite rows into (N * 4, 8) vertices."""
+        x, y, half_w, half_h, rotation, scale, u0, v0, u1, v1 = sprites[:, :10].T
+        angle = np.radians(rotation)
+        cos = np.cos(angle) * scale
+        sin = np.sin(angle) * scale
+
+        # Corner order matches the old glBegin(GL_QUADS) path.
+        corner_x = np.stack((-half_w, half_w, half_w, -half_w), axis=1)
+        corner_y = np.stack((-half_h, -half_h, half_h, half_h), axis=1)
+
+        vertices = np.empty((len(sprites), 4, 8), dtype=np.float32)
+        vertices[:, :, 0] = x[:, None] + corner_x * cos[:, None] - corner_y * sin[:, None]
+        vertices[:, :, 1] = y[:, None] + corner_x * sin[:, None] + corner_y * cos[:, None]
+        vertices[:, :, 2] = np.stack((u0, u1, u1, u0), axis=1)
+        vertices[:, :, 3] = np.stack((v0, v0, v1, v1), axis=1)
+        vertices[:, :, 4:] = sprites[:, None, 10:14]
+        return vertices.reshape(-1, 8)
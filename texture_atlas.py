@@ -0,0 +1,258 @@
+import numpy as np
+from OpenGL.GL import *
+
+from texture_cache import texture_cache
+
+
+class SkylinePacker:
+    """Bottom-left skyline rectangle packer.
+
+    The skyline is a list of (x, y, width) segments describing the lowest free
+    row at every column; rectangles are placed where their top edge ends up
+    lowest, which keeps pages dense for sprite-sized inputs.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.skyline = [(0, 0, width)]
+
+    def insert(self, width, height):
+        best = None
+        for i, (x, _, segment_width) in enumerate(self.skyline):
+            y = self._fit(i, width, height)
+            if y is None:
+                continue
+            if best is None or (y + height, segment_width) < (best[1] + height, best[3]):
+                best = (i, y, x, segment_width)
+        if best is None:
+            return None
+        i, y, x, _ = best
+        self._add_level(i, x, y, width, height)
+        return x, y
+
+    def _fit(self, i, width, height):
+        x = self.skyline[i][0]
+        if x + width > self.width:
+            return None
+        y = 0
+        remaining = width
+        while remaining > 0:
+            if i >= len(self.skyline):
+                return None
+            y = max(y, self.skyline[i][1])
+            if y + height > self.height:
+                return None
+            remaining -= self.skyline[i][2]
+            i += 1
+        return y
+
+    def _add_level(self, i, x, y, width, height):
+        self.skyline.insert(i, (x, y + height, width))
+
+        # Trim the segments now covered by the new one.
+        j = i + 1
+        while j < len(self.skyline):
+            previous_end = self.skyline[j - 1][0] + self.skyline[j - 1][2]
+            segment_x, segment_y, segment_width = self.skyline[j]
+            if segment_x >= previous_end:
+                break
+            shrink = previous_end - segment_x
+            if segment_width <= shrink:
+                del self.skyline[j]
+                continue
+            self.skyline[j] = (segment_x + shrink, segment_y, segment_width - shrink)
+            break
+
+        # Merge neighbours at the same height.
+        j = 0
+        while j < len(self.skyline) - 1:
+            x0, y0, w0 = self.skyline[j]
+            x1, y1, w1 = self.skyline[j + 1]
+            if y0 == y1:
+                self.skyline[j] = (x0, y0, w0 + w1)
+                del self.skyline[j + 1]
+            else:
+                j += 1
+
+
+class AtlasRegion:
+    """Sub-rectangle of an atlas page holding one texture cache entry."""
+
+    def __init__(self, key, pixels):
+        self.key = key
+        self.pixels = pixels
+        self.height, self.width = pixels.shape[:2]
+        self.page = None
+        self.x = 0
+        self.y = 0
+        self.uv = (0.0, 0.0, 1.0, 1.0)
+        self.refs = 0
+
+
+class AtlasPage:
+    def __init__(self, size):
+        self.size = size
+        self.packer = SkylinePacker(size, size)
+        self.pixels = np.zeros((size, size, 4), dtype=np.uint8)
+        self.regions = []
+        self.texture_id = None
+
+    def dead_regions(self):
+        return sum(1 for region in self.regions if not region.refs)
+
+
+class TextureAtlas:
+    """Packs texture cache entries into a few large RGBA pages.
+
+    Adding a sprite only writes and uploads its own sub-rectangle. When no
+    page has room, pages holding regions nobody references any more are
+    repacked in place before a new page is allocated. Regions keep their
+    identity across repacks, so objects pick up the new UVs automatically.
+
+    Pages are charged to the texture cache's byte budget. When a new page
+    does not fit in it, acquire() returns None and the sprite uses a
+    standalone texture instead.
+    """
+
+    def __init__(self, page_size=2048, padding=1):
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []
+        self.regions = {}
+        self.uploads = 0
+        self.repacks = 0
+        self.total_bytes = 0
+
+    def fits(self, entry):
+        limit = self.page_size - 2 * self.padding
+        return entry.width <= limit and entry.height <= limit
+
+    def acquire(self, entry):
+        """Region holding `entry`, or None when the memory budget has no room for another page."""
+        region = self.regions.get(entry.key)
+        if region is None:
+            region = AtlasRegion(entry.key, entry.pixels)
+            if not self._place(region):
+                return None
+            self.regions[entry.key] = region
+        region.refs += 1
+        return region
+
+    def release(self, region):
+        if region is not None:
+            region.refs = max(0, region.refs - 1)
+
+    def clear(self):
+        for page in self.pages:
+            if page.texture_id is not None:
+                glDeleteTextures([page.texture_id])
+        self.pages.clear()
+        self.regions.clear()
+        texture_cache.unreserve(self.total_bytes)
+        self.total_bytes = 0
+
+    def _place(self, region):
+        for page in self.pages:
+            if self._insert(page, region):
+                self._upload_region(page, region)
+                return True
+        for page in self.pages:
+            if page.dead_regions() and self._repack(page, region):
+                return True
+        if not self.fits(region):
+            raise ValueError(f"Texture {region.width}x{region.height} does not fit an atlas page")
+        page_bytes = self.page_size * self.page_size * 4
+        if not texture_cache.reserve(page_bytes):
+            return False
+        self.total_bytes += page_bytes
+        page = AtlasPage(self.page_size)
+        self.pages.append(page)
+        self._insert(page, region)
+        self._upload_page(page)
+        return True
+
+    def _insert(self, page, region):
+        padding = self.padding
+        position = page.packer.insert(region.width + 2 * padding, region.height + 2 * padding)
+        if position is None:
+            return False
+        region.page = page
+        region.x = position[0] + padding
+        region.y = position[1] + padding
+        region.uv = (
+            region.x / page.size, region.y / page.size,
+            (region.x + region.width) / page.size, (region.y + region.height) / page.size,
+        )
+        page.regions.append(region)
+        self._blit(page, region)
+        return True
+
+    def _blit(self, page, region):
+        # Replicate the sprite's edges into the padding so neighbouring
+        # sprites never bleed in when sampling right at the border.
+        padding = self.padding
+        padded = np.pad(region.pixels, ((padding, padding), (padding, padding), (0, 0)), mode="edge")
+        page.pixels[region.y - padding:region.y + region.height + padding,
+                    region.x - padding:region.x + region.width + padding] = padded
+
+    def _repack(self, page, region):
+        """Rebuild `page` from its live regions plus `region`, if they fit."""
+        live = [r for r in page.regions if r.refs] + [region]
+        packer = SkylinePacker(page.size, page.size)
+        padding = self.padding
+        placements = []
+        for candidate in sorted(live, key=lambda r: (r.height, r.width), reverse=True):
+            position = packer.insert(candidate.width + 2 * padding, candidate.height + 2 * padding)
+            if position is None:
+                return False
+            placements.append((candidate, position))
+
+        self.repacks += 1
+        for dead in page.regions:
+            if not dead.refs:
+                self.regions.pop(dead.key, None)
+        page.packer = packer
+        page.regions = []
+        page.pixels[:] = 0
+        for candidate, (x, y) in placements:
+            candidate.page = page
+            candidate.x = x + padding
+            candidate.y = y + padding
+            candidate.uv = (
+                candidate.x / page.size, candidate.y / page.size,
+                (candidate.x + candidate.width) / page.size, (candidate.y + candidate.height) / page.size,
+            )
+            page.regions.append(candidate)
+            self._blit(page, candidate)
+        self._upload_page(page)
+        return True
+
+    def _upload_page(self, page):
+        self.uploads += 1
+        if page.texture_id is None:
+            page.texture_id = glGenTextures(1)
+            glBindTexture(GL_TEXTURE_2D, page.texture_id)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        else:
+            glBindTexture(GL_TEXTURE_2D, page.texture_id)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, page.size, page.size, 0, GL_RGBA, GL_UNSIGNED_BYTE, page.pixels)
+
+    def _upload_region(self, page, region):
+        if page.texture_id is None:
+            self._upload_page(page)
+            return
+        self.uploads += 1
+        padding = self.padding
+        x, y = region.x - padding, region.y - padding
+        width, height = region.width + 2 * padding, region.height + 2 * padding
+        glBindTexture(GL_TEXTURE_2D, page.texture_id)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        glTexSubImage2D(GL_TEXTURE_2D, 0, x, y, width, height, GL_RGBA, GL_UNSIGNED_BYTE,
+                        np.ascontiguousarray(page.pixels[y:y + height, x:x + width]))
+
+
+texture_atlas = TextureAtlas()
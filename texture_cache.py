@@ -0,0 +1,143 @@
+import os
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image
+from OpenGL.GL import *
+
+
+class TextureEntry:
+    """Decoded RGBA buffer and the GL texture shared by every object using it."""
+
+    def __init__(self, key, pixels):
+        self.key = key
+        self.pixels = pixels
+        self.height, self.width = pixels.shape[:2]
+        self.nbytes = pixels.nbytes
+        self.texture_id = None
+        self.refs = 0
+
+
+class TextureCache:
+    """LRU cache of textures keyed by their source image or solid color.
+
+    Textures are stored at the image's native resolution; the display size
+    is purely quad geometry, so resizing an object never touches this cache
+    and objects showing one sprite at different sizes share a single entry.
+    Images are identified by absolute path and modification time, so editing
+    the file on disk produces a new entry instead of a stale texture. Entries
+    still referenced by a GameObject are never evicted; unreferenced ones are
+    dropped, least recently used first, once `max_bytes` is exceeded.
+
+    Pixels held elsewhere count toward the same budget through reserve():
+    the texture atlas charges every page it allocates, so `max_bytes` bounds
+    the cache and the atlas together.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, mipmaps=False):
+        self.max_bytes = max_bytes
+        self.mipmaps = mipmaps
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        # Reserved by others (atlas pages), charged to max_bytes as well.
+        self.reserved_bytes = 0
+        self.uploads = 0
+
+    def make_key(self, image_path, color):
+        if image_path:
+            return ((os.path.abspath(image_path), os.path.getmtime(image_path)), None)
+        return (None, tuple(map(int, color)))
+
+    def acquire(self, key):
+        """Return the entry for `key`, decoding it if needed."""
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self._store(key, self._build_pixels(key))
+        else:
+            self.entries.move_to_end(key)
+        entry.refs += 1
+        self._evict()
+        return entry
+
+    def texture(self, entry):
+        """Return a standalone GL_REPEAT texture for `entry`, uploading it once.
+
+        Only sprites that tile or scroll need this; everything else lives in
+        the texture atlas.
+        """
+        if entry.texture_id is None:
+            self._upload(entry)
+        return entry.texture_id
+
+    def release(self, entry):
+        if entry is None:
+            return
+        entry.refs = max(0, entry.refs - 1)
+        self._evict()
+
+    def reserve(self, nbytes):
+        """Charge `nbytes` to the budget, evicting to make room; False if they do not fit."""
+        self.reserved_bytes += nbytes
+        self._evict()
+        if self.total_bytes + self.reserved_bytes > self.max_bytes:
+            self.reserved_bytes -= nbytes
+            return False
+        return True
+
+    def unreserve(self, nbytes):
+        self.reserved_bytes = max(0, self.reserved_bytes - nbytes)
+
+    def clear(self):
+        for entry in self.entries.values():
+            self._delete_texture(entry)
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def _store(self, key, pixels):
+        entry = TextureEntry(key, pixels)
+        self.entries[key] = entry
+        self.total_bytes += entry.nbytes
+        return entry
+
+    def _build_pixels(self, key):
+        # The overlay color is not part of the texture: SpriteBatch applies it
+        # per vertex at draw time, so tinting never touches these pixels.
+        source, color = key
+        if source:
+            return np.array(Image.open(source[0]).convert("RGBA"))
+        return np.full((1, 1, 4), color, dtype=np.uint8)
+
+    def _upload(self, entry):
+        self.uploads += 1
+        entry.texture_id = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, entry.texture_id)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST_MIPMAP_LINEAR if self.mipmaps else GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, entry.width, entry.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, entry.pixels)
+        if self.mipmaps:
+            glGenerateMipmap(GL_TEXTURE_2D)
+
+    def _delete_texture(self, entry):
+        if entry.texture_id is not None:
+            glDeleteTextures([entry.texture_id])
+            entry.texture_id = None
+
+    def _evict(self):
+        limit = self.max_bytes - self.reserved_bytes
+        if self.total_bytes <= limit:
+            return
+        for key in list(self.entries):
+            entry = self.entries[key]
+            if entry.refs:
+                continue
+            self._delete_texture(entry)
+            del self.entries[key]
+            self.total_bytes -= entry.nbytes
+            if self.total_bytes <= limit:
+                break
+
+
+texture_cache = TextureCache()
@@ -2,12 +2,15 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLineEdit, QGridLayout, QGroupBox, QLabel
 )
 from PyQt5.QtCore import Qt
+from edit_transaction import EditTransaction, ScrubLabel
 
 class TransformPanel(QWidget):
     def __init__(self, scene_view):
         super().__init__()
         self.selected_object = None
         self.scene_view = scene_view
+        # Junta as edições de cada volta do loop de eventos numa só aplicação
+        self.edits = EditTransaction(scene_view)
 
         self.init_ui()
 
@@ -28,13 +31,14 @@ class TransformPanel(QWidget):
         self.scale_input = self.create_line_edit()
         self.is_child_label = QLabel()
 
-        self.add_labeled_input(transform_layout, "Posição X:", self.position_x_input, 0, 0)
-        self.add_labeled_input(transform_layout, "Posição Y:", self.position_y_input, 0, 2)
-        self.add_labeled_input(transform_layout, "Largura:", self.size_width_input, 1, 0)
-        self.add_labeled_input(transform_layout, "Altura:", self.size_height_input, 1, 2)
+        # Arrastar os rótulos numéricos para os lados altera o valor do campo
+        self.add_labeled_input(transform_layout, "Posição X:", self.position_x_input, 0, 0, scrub_step=1.0)
+        self.add_labeled_input(transform_layout, "Posição Y:", self.position_y_input, 0, 2, scrub_step=1.0)
+        self.add_labeled_input(transform_layout, "Largura:", self.size_width_input, 1, 0, scrub_step=1.0)
+        self.add_labeled_input(transform_layout, "Altura:", self.size_height_input, 1, 2, scrub_step=1.0)
         self.add_labeled_input(transform_layout, "Cor (RGBA):", self.color_input, 2, 0, 1, 4)
-        self.add_labeled_input(transform_layout, "Rotação:", self.rotation_input, 3, 0)
-        self.add_labeled_input(transform_layout, "Escala:", self.scale_input, 3, 2)
+        self.add_labeled_input(transform_layout, "Rotação:", self.rotation_input, 3, 0, scrub_step=1.0)
+        self.add_labeled_input(transform_layout, "Escala:", self.scale_input, 3, 2, scrub_step=0.01)
         self.add_labeled_input(transform_layout, "É Filho:", self.is_child_label, 4, 0, 1, 4)
 
         transform_group.setLayout(transform_layout)
@@ -46,9 +50,13 @@ class TransformPanel(QWidget):
         """Cria e retorna um QLineEdit."""
         return QLineEdit()
 
-    def add_labeled_input(self, layout, label_text, input_widget, row, col, row_span=1, col_span=1):
+    def add_labeled_input(self, layout, label_text, input_widget, row, col, row_span=1, col_span=1, scrub_step=None):
         """Adiciona um rótulo e um campo de entrada ao layout."""
-        layout.addWidget(QLabel(label_text), row, col)
+        if scrub_step is None:
+            label = QLabel(label_text)
+        else:
+            label = ScrubLabel(label_text, input_widget, self.edits, scrub_step)
+        layout.addWidget(label, row, col)
         layout.addWidget(input_widget, row, col + 1, row_span, col_span)
 
     def connect_signals(self):
@@ -71,22 +79,28 @@ class TransformPanel(QWidget):
         if not self.selected_object:
             return
 
-        self.position_x_input.setText(str(self.selected_object.position[0]))
-        self.position_y_input.setText(str(self.selected_object.position[1]))
-        self.size_width_input.setText(str(self.selected_object.size[0]))
-        self.size_height_input.setText(str(self.selected_object.size[1]))
+        self.set_field_text(self.position_x_input, self.selected_object.position[0])
+        self.set_field_text(self.position_y_input, self.selected_object.position[1])
+        self.set_field_text(self.size_width_input, self.selected_object.size[0])
+        self.set_field_text(self.size_height_input, self.selected_object.size[1])
 
         if hasattr(self.selected_object, 'color'):
-            self.color_input.setText(','.join(map(str, self.selected_object.color)))
+            self.set_field_text(self.color_input, ','.join(map(str, self.selected_object.color)))
         
         if hasattr(self.selected_object, 'rotation'):
-            self.rotation_input.setText(str(self.selected_object.rotation))
+            self.set_field_text(self.rotation_input, self.selected_object.rotation)
         
         if hasattr(self.selected_object, 'scale'):
-            self.scale_input.setText(str(self.selected_object.scale))
+            self.set_field_text(self.scale_input, self.selected_object.scale)
         
         self.is_child_label.setText("Sim" if self.selected_object.parent else "Não")
 
+    def set_field_text(self, field, value):
+        """Mostra um valor sem disparar textChanged (não é uma edição do usuário)."""
+        field.blockSignals(True)
+        field.setText(str(value))
+        field.blockSignals(False)
+
     def update_position(self, text, axis):
         """Atualiza a posição do objeto selecionado com base no texto de entrada."""
         if not self.selected_object:
@@ -94,13 +108,12 @@ class TransformPanel(QWidget):
 
         try:
             value = float(text)
-            position = list(self.selected_object.position)
+            position = list(self.edits.get(self.selected_object, 'position'))
             if axis == 'x':
                 position[0] = value
             elif axis == 'y':
                 position[1] = value
-            self.selected_object.set_position(tuple(position))
-            self.notify_change()
+            self.edits.set(self.selected_object, 'position', tuple(position))
         except ValueError:
             pass
 
@@ -111,15 +124,12 @@ class TransformPanel(QWidget):
 
         try:
             value = float(text)
-            size = list(self.selected_object.size)
+            size = list(self.edits.get(self.selected_object, 'size'))
             if dimension == 'width':
                 size[0] = value
             elif dimension == 'height':
                 size[1] = value
-            self.selected_object.size = tuple(size)
-            if hasattr(self.selected_object, 'update_image'):
-                self.selected_object.update_image()
-            self.notify_change()
+            self.edits.set(self.selected_object, 'size', tuple(size))
         except ValueError:
             pass
 
@@ -131,10 +141,7 @@ class TransformPanel(QWidget):
         try:
             color_values = list(map(int, text.split(',')))
             if len(color_values) == 4:
-                self.selected_object.color = tuple(color_values)
-                if hasattr(self.selected_object, 'update_image'):
-                    self.selected_object.update_image()
-                self.notify_change()
+                self.edits.set(self.selected_object, 'color', tuple(color_values))
         except ValueError:
             pass
 
@@ -144,10 +151,7 @@ class TransformPanel(QWidget):
             return
 
         try:
-            self.selected_object.rotation = float(text)
-            if hasattr(self.selected_object, 'update_image'):
-                self.selected_object.update_image()
-            self.notify_change()
+            self.edits.set(self.selected_object, 'rotation', float(text))
         except ValueError:
             pass
 
@@ -157,15 +161,6 @@ class TransformPanel(QWidget):
             return
 
         try:
-            self.selected_object.scale = float(text)
-            if hasattr(self.selected_object, 'update_image'):
-                self.selected_object.update_image()
-            self.notify_change()
+            self.edits.set(self.selected_object, 'scale', float(text))
         except ValueError:
             pass
-
-    def notify_change(self):
-        """Notifica mudanças e atualiza a cena."""
-        self.scene_view.repaint()
-        self.selected_object.store_original_state()
-        self.update_fields()
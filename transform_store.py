@@ -0,0 +1,372 @@
+import numpy as np
+
+
+class TransformStore:
+    """Columnar (struct-of-arrays) storage for the transforms of a scene.
+
+    Bound GameObjects keep their position, rotation, scale, size, color and
+    velocity in one row of contiguous NumPy columns instead of per-object
+    tuples. Their attributes read and write that row, and scripts still see
+    plain tuples, so existing code keeps working. Engine systems then run
+    over whole columns at once:
+
+    - integrate(dt) applies velocity and angular_velocity to every row,
+    - update_world() composes world transforms one hierarchy level at a time,
+    - visible_rows(rect) culls the scene and sorts it into draw order,
+    - sprite_rows(rows) builds SpriteBatch input without touching objects.
+
+    The render columns (uv, texture, tint) are refreshed per row only when
+    the object's appearance, size or overlay changes.
+    """
+
+    # name: (per-row shape, dtype, value of unused rows)
+    COLUMNS = {
+        "objects": ((), object, None),
+        "alive": ((), bool, False),
+        "drawn": ((), bool, False),
+        "position": ((2,), np.float64, 0),
+        "rotation": ((), np.float64, 0),
+        "scale": ((), np.float64, 1),
+        "size": ((2,), np.float64, 0),
+        "color": ((4,), np.uint8, 0),
+        "velocity": ((2,), np.float64, 0),
+        "angular_velocity": ((), np.float64, 0),
+        "parent": ((), np.int64, -1),
+        "depth": ((), np.int64, 0),
+        "world": ((4,), np.float64, 0),
+        "layer": ((), np.float64, 0),
+        "sequence": ((), np.int64, 0),
+        "uv": ((4,), np.float32, 0),
+        "texture": ((), np.int64, 0),
+        "tint": ((4,), np.float32, 0),
+        "render_pending": ((), bool, False),
+    }
+
+    # Columns a SceneSnapshot saves and restores.
+    STATE_COLUMNS = ("position", "rotation", "scale", "size", "color", "velocity", "angular_velocity")
+
+    def __init__(self, capacity=1024):
+        self.capacity = 0
+        self.count = 0
+        self.free_rows = []
+        self.world_dirty = True
+        self._levels = None
+        self._atlas_repacks = 0
+        self.columns = dict(self.COLUMNS)
+        # allocator(name, shape, dtype) -> ndarray, used for every column but
+        # `objects` when set (ParallelStepper puts them in shared memory).
+        self.allocator = None
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity, names=None):
+        for name in names or self.columns:
+            shape, dtype, fill = self.columns[name]
+            if self.allocator is not None and dtype is not object:
+                column = self.allocator(name, (capacity,) + shape, dtype)
+                column[...] = fill
+            else:
+                column = np.full((capacity,) + shape, fill, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                kept = min(len(old), capacity)
+                column[:kept] = old[:kept]
+            setattr(self, name, column)
+        self.capacity = capacity
+
+    def set_allocator(self, allocator):
+        """Move every column into memory from `allocator` (None: back to private arrays)."""
+        self.allocator = allocator
+        self._allocate(self.capacity)
+
+    def add_column(self, name, shape=(), dtype=np.float64, fill=0):
+        """Add a per-row column of extra state, e.g. for a parallel kernel."""
+        if name in self.columns:
+            return getattr(self, name)
+        if hasattr(self, name):
+            raise ValueError(f"'{name}' is already a TransformStore attribute")
+        self.columns[name] = (tuple(shape), dtype, fill)
+        self._allocate(self.capacity, (name,))
+        return getattr(self, name)
+
+    def __len__(self):
+        return self.count - len(self.free_rows)
+
+    def __contains__(self, game_object):
+        return getattr(game_object, '_store', None) is self
+
+    # Binding
+
+    def bind(self, game_object, drawn=True):
+        """Move an object's state into a row; its parents are bound first."""
+        if game_object._store is self:
+            self.drawn[game_object._row] = self.drawn[game_object._row] or drawn
+            return game_object._row
+        parent = game_object.parent
+        if hasattr(parent, 'bind_store') and parent._store is not self:
+            self.bind(parent, drawn=False)
+
+        if self.free_rows:
+            row = self.free_rows.pop()
+        else:
+            if self.count == self.capacity:
+                self._allocate(self.capacity * 2)
+            row = self.count
+            self.count += 1
+
+        self.objects[row] = game_object
+        self.alive[row] = True
+        self.drawn[row] = drawn
+        self.position[row] = game_object._position
+        self.rotation[row] = game_object._rotation
+        self.scale[row] = game_object._scale
+        self.size[row] = game_object._size
+        self.color[row] = self.color_row(game_object._color)
+        self.velocity[row] = game_object._velocity
+        self.angular_velocity[row] = game_object._angular_velocity
+        self.parent[row] = parent._row if hasattr(parent, 'bind_store') else -1
+        self.depth[row] = self.depth[self.parent[row]] + 1 if self.parent[row] >= 0 else 0
+        self.render_pending[row] = True
+        self.texture[row] = 0
+        for name, (_, _, fill) in self.columns.items():
+            if name not in self.COLUMNS:
+                getattr(self, name)[row] = fill
+        game_object.bind_store(self, row)
+        self.update_draw_key(game_object)
+        self.world_dirty = True
+        self._levels = None
+        return row
+
+    def unbind(self, game_object, force=False):
+        """Give a row's state back to its object and free the row.
+
+        Objects that still have bound children stay bound, just not drawn,
+        unless `force` is set (the whole store is being torn down).
+        """
+        if game_object._store is not self:
+            return
+        row = game_object._row
+        if not force and any(getattr(child, '_store', None) is self for child in game_object.children):
+            self.drawn[row] = False
+            return
+        game_object.unbind_store(
+            position=tuple(self.position[row].tolist()),
+            rotation=float(self.rotation[row]),
+            scale=float(self.scale[row]),
+            size=tuple(self.size[row].tolist()),
+            color=tuple(self.color[row].tolist()),
+            velocity=tuple(self.velocity[row].tolist()),
+            angular_velocity=float(self.angular_velocity[row]),
+        )
+        self.objects[row] = None
+        self.alive[row] = False
+        self.drawn[row] = False
+        self.parent[row] = -1
+        self.velocity[row] = 0
+        self.angular_velocity[row] = 0
+        self.free_rows.append(row)
+        self.world_dirty = True
+        self._levels = None
+
+    def clear(self):
+        for row in range(self.count):
+            if self.alive[row]:
+                self.unbind(self.objects[row], force=True)
+        self.count = 0
+        self.free_rows.clear()
+
+    def reparent(self, game_object):
+        """Refresh parent links and depths after `game_object` changed parent."""
+        parent = game_object.parent
+        if hasattr(parent, 'bind_store') and parent._store is not self:
+            self.bind(parent, drawn=False)
+        row = game_object._row
+        self.parent[row] = parent._row if hasattr(parent, 'bind_store') else -1
+        stack = [game_object]
+        while stack:
+            obj = stack.pop()
+            obj_row = obj._row
+            parent_row = self.parent[obj_row]
+            self.depth[obj_row] = self.depth[parent_row] + 1 if parent_row >= 0 else 0
+            stack.extend(child for child in obj.children if getattr(child, '_store', None) is self)
+        self.world_dirty = True
+        self._levels = None
+
+    def capture(self):
+        """Copies of the state columns and of the row owners, for SceneSnapshot."""
+        count = self.count
+        captured = {name: getattr(self, name)[:count].copy() for name in self.STATE_COLUMNS}
+        captured["objects"] = self.objects[:count].copy()
+        return captured
+
+    def restore(self, captured):
+        """Write captured state back into the rows still owned by the same objects.
+
+        Returns (restored, moved, restyled) row arrays: every row written,
+        the rows whose bounds changed and the rows whose size or color
+        changed.
+        """
+        objects = captured["objects"]
+        count = min(len(objects), self.count)
+        same = self.alive[:count] & (self.objects[:count] == objects[:count])
+        restored = np.flatnonzero(same)
+
+        def changed(name):
+            current = getattr(self, name)[restored]
+            differs = current != captured[name][restored]
+            return differs.reshape(len(restored), -1).any(axis=1)
+
+        resized = changed("size")
+        moved = restored[changed("position") | changed("rotation") | changed("scale") | resized]
+        restyled = restored[resized | changed("color")]
+        for name in self.STATE_COLUMNS:
+            getattr(self, name)[restored] = captured[name][restored]
+        self.render_pending[restyled] = True
+        self.world_dirty = True
+        return restored, moved, restyled
+
+    # Row access used by GameObject properties
+
+    @staticmethod
+    def color_row(color):
+        return tuple(color) + (255,) * (4 - len(color))
+
+    def update_draw_key(self, game_object):
+        render_queue = getattr(game_object.scene_view, 'render_queue', None)
+        key = render_queue.draw_keys.get(game_object) if render_queue is not None else None
+        row = game_object._row
+        if key is None:
+            self.layer[row] = game_object._layer if hasattr(game_object, '_layer') else 0
+            self.sequence[row] = row
+        else:
+            self.layer[row], self.sequence[row] = key
+
+    def world_of(self, row):
+        """World (x, y, rotation, scale) of one row."""
+        if self.parent[row] < 0:
+            position = self.position[row]
+            return (float(position[0]), float(position[1]), float(self.rotation[row]), float(self.scale[row]))
+        self.update_world()
+        return tuple(self.world[row].tolist())
+
+    def moved_objects(self, rows):
+        """Objects in `rows` plus every bound descendant of them."""
+        count = self.count
+        moved = np.zeros(count, dtype=bool)
+        moved[rows] = True
+        for level in self.levels()[1:]:
+            moved[level] |= moved[self.parent[level]]
+        return self.objects[:count][moved & self.alive[:count]]
+
+    # Vectorized systems
+
+    def integrate(self, dt):
+        """Advance positions and rotations by their velocities; returns the rows that moved."""
+        count = self.count
+        moving = self.alive[:count] & (
+            (self.velocity[:count] != 0).any(axis=1) | (self.angular_velocity[:count] != 0)
+        )
+        rows = np.flatnonzero(moving)
+        if len(rows):
+            self.position[rows] += self.velocity[rows] * dt
+            self.rotation[rows] += self.angular_velocity[rows] * dt
+            self.world_dirty = True
+        return rows
+
+    def levels(self):
+        """Live rows grouped by hierarchy depth, roots first."""
+        if self._levels is None:
+            count = self.count
+            depth = np.where(self.alive[:count], self.depth[:count], -1)
+            self._levels = [np.flatnonzero(depth == d) for d in range(int(depth.max(initial=-1)) + 1)]
+        return self._levels
+
+    def update_world(self):
+        if not self.world_dirty:
+            return
+        count = self.count
+        world = self.world
+        world[:count, 0:2] = self.position[:count]
+        world[:count, 2] = self.rotation[:count]
+        world[:count, 3] = self.scale[:count]
+        for level in self.levels()[1:]:
+            parent = world[self.parent[level]]
+            angle = np.radians(parent[:, 2])
+            cos = np.cos(angle) * parent[:, 3]
+            sin = np.sin(angle) * parent[:, 3]
+            x = self.position[level, 0]
+            y = self.position[level, 1]
+            world[level, 0] = parent[:, 0] + x * cos - y * sin
+            world[level, 1] = parent[:, 1] + x * sin + y * cos
+            world[level, 2] = parent[:, 2] + self.rotation[level]
+            world[level, 3] = parent[:, 3] * self.scale[level]
+        self.world_dirty = False
+
+    def world_bounds(self):
+        """(count, 4) world AABBs, matching GameObject.get_bounds."""
+        self.update_world()
+        count = self.count
+        world = self.world[:count]
+        scale = np.abs(world[:, 3])
+        half_w = np.abs(self.size[:count, 0]) * scale / 2
+        half_h = np.abs(self.size[:count, 1]) * scale / 2
+        angle = np.radians(world[:, 2])
+        cos, sin = np.abs(np.cos(angle)), np.abs(np.sin(angle))
+        rotated = (world[:, 2] % 180) != 0
+        half_w, half_h = (
+            np.where(rotated, cos * half_w + sin * half_h, half_w),
+            np.where(rotated, sin * half_w + cos * half_h, half_h),
+        )
+        return np.stack((world[:, 0] - half_w, world[:, 1] - half_h, world[:, 0] + half_w, world[:, 1] + half_h), axis=1)
+
+    def visible_rows(self, rect=None):
+        """Drawn rows overlapping `rect` (everything if None), in draw order."""
+        count = self.count
+        mask = self.alive[:count] & self.drawn[:count]
+        if rect is not None:
+            bounds = self.world_bounds()
+            min_x, min_y, max_x, max_y = rect
+            mask &= ~((bounds[:, 2] < min_x) | (bounds[:, 0] > max_x) | (bounds[:, 3] < min_y) | (bounds[:, 1] > max_y))
+        rows = np.flatnonzero(mask)
+        return rows[np.lexsort((self.sequence[rows], self.layer[rows]))]
+
+    def sprite_rows(self, rows, profiler=None):
+        """SpriteBatch rows (N, 14) and texture ids for `rows`, skipping untextured ones."""
+        from texture_atlas import texture_atlas
+
+        if texture_atlas.repacks != self._atlas_repacks:
+            # Repacked regions moved: every atlas UV may be stale.
+            self._atlas_repacks = texture_atlas.repacks
+            self.render_pending[:self.count] |= self.alive[:self.count]
+        pending = rows[self.render_pending[rows]]
+        if len(pending):
+            if profiler is not None:
+                with profiler.span("upload"):
+                    self.refresh_render_rows(pending)
+            else:
+                self.refresh_render_rows(pending)
+        rows = rows[self.texture[rows] != 0]
+
+        self.update_world()
+        sprites = np.empty((len(rows), 14), dtype=np.float32)
+        sprites[:, 0:2] = self.world[rows, 0:2]
+        sprites[:, 2:4] = self.size[rows] / 2
+        sprites[:, 4:6] = self.world[rows, 2:4]
+        sprites[:, 6:10] = self.uv[rows]
+        sprites[:, 10:14] = self.tint[rows]
+        return sprites, self.texture[rows]
+
+    def refresh_render_rows(self, rows):
+        from sprite_batch import SpriteBatch
+
+        for row in rows.tolist():
+            game_object = self.objects[row]
+            if game_object.appearance_dirty:
+                game_object.sync_texture()
+            self.render_pending[row] = False
+            self.tint[row] = game_object.overlay_tint
+            if not game_object.texture_id:
+                self.texture[row] = 0
+                continue
+            *uv, texture_id = SpriteBatch.sprite_uv(game_object)
+            self.uv[row] = uv
+            self.texture[row] = texture_id